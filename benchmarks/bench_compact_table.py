@@ -0,0 +1,95 @@
+"""
+Kompakt tablo karşılaştırması: Excel'den okunduğu haliyle (object) sayfa, süreleri timedelta64'e çevrilmiş sayfa
+ve compact_sheet ile yüklenen sayfanın bellek kullanımı ile günlük seçim filtresinin süresi. Ayrıca kompakt
+OEE oranlarından üretilen günlük OEE etiketlerinin ham hücrelerden üretilenlerle aynı olduğu doğrulanır.
+
+Çalıştırma (depo kök dizininden):
+    python -m benchmarks.bench_compact_table --rows 200000 --products 80
+"""
+import argparse
+import datetime
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.helpers import (compact_sheet, detect_sheet_columns, format_oee_display, key_equals_mask, key_isin_mask,
+                           sheet_column_range)
+
+SHEET = "SMD-OEE"
+
+
+def make_raw_sheet(rows: int, products: int, seed: int = 0) -> pd.DataFrame:
+    """Excel'den okunan SMD-OEE sayfasına benzeyen (A, B, H..BD, BP) object tipli sentetik veri üretir."""
+    rng = np.random.default_rng(seed)
+    times = np.array([datetime.time(0, m, s) for m in range(60) for s in range(60)], dtype=object)
+    data = {
+        "Tarih": np.array([datetime.datetime(2024, 1, 1) + datetime.timedelta(days=d) for d in range(31)],
+                          dtype=object)[rng.integers(0, 31, rows)],
+        "Ürün": np.array([f"HAT{p % 4 + 1}-P{p}" for p in range(products)], dtype=object)[
+            rng.integers(0, products, rows)],
+    }
+    for i in range(49):  # H..BD
+        data[f"M{i}"] = times[rng.integers(0, len(times), rows)]
+    # Oranlar ile yarım yüzdeler (ör. 17.5, "54.5%") karışık; yuvarlama sınırlarındaki değerler de denenir
+    fractions = rng.random(rows)
+    percents = rng.integers(0, 2001, rows) / 20
+    data["OEE"] = np.where(rng.random(rows) < 0.5, fractions, percents).astype(object)
+    as_text = rng.random(rows) < 0.2
+    data["OEE"][as_text] = [f"{v}%" for v in data["OEE"][as_text]]
+    return pd.DataFrame(data)
+
+
+def as_timedelta_sheet(raw: pd.DataFrame) -> pd.DataFrame:
+    """Kompakt tablo öncesi yükleme: yalnızca süre sütunları timedelta64'e çevrilir."""
+    df = raw.copy()
+    df["Tarih"] = pd.to_datetime(df["Tarih"])
+    for col in sheet_column_range(df, SHEET, 'H', 'BD'):
+        df[col] = pd.to_timedelta(df[col].astype(str))
+    return df
+
+
+def time_filter(df: pd.DataFrame, compact: bool, repeat: int = 5) -> float:
+    """Günlük grafikteki (tarih, ürünler) seçim maskesinin ortalama süresi (ms)."""
+    columns = detect_sheet_columns(df, SHEET)
+    grouping, grouped = df[columns.grouping_col_name], df[columns.grouped_col_name]
+    selected = str(grouping.astype(str).iloc[0])
+    products = sorted(grouped.astype(str).unique())[:10]
+    start = time.perf_counter()
+    for _ in range(repeat):
+        if compact:
+            key_equals_mask(grouping, selected) & key_isin_mask(grouped, products)
+        else:
+            (grouping.astype(str) == selected) & grouped.astype(str).isin(products)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def oee_label_mismatches(raw: pd.DataFrame, compact: pd.DataFrame) -> int:
+    """Ham OEE hücrelerinin ve kompakt oranların format_oee_display etiketlerinin farklı olduğu satır sayısı."""
+    raw_col = detect_sheet_columns(raw, SHEET).oee_col_name
+    compact_col = detect_sheet_columns(compact, SHEET).oee_col_name
+    return sum(format_oee_display(r) != format_oee_display(c, fraction=True)
+               for r, c in zip(raw[raw_col], compact[compact_col]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Kompakt tablo bellek ve filtre karşılaştırması")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--products", type=int, default=80)
+    args = parser.parse_args()
+
+    raw = make_raw_sheet(args.rows, args.products)
+    variants = {
+        "object": (raw, False),
+        "timedelta": (as_timedelta_sheet(raw), False),
+        "kompakt": (compact_sheet(raw.copy(), SHEET), True),
+    }
+    print(f"{args.rows} satır, {args.products} ürün")
+    for name, (df, compact) in variants.items():
+        mb = df.memory_usage(deep=True).sum() / 2 ** 20
+        print(f"{name:>10}: bellek {mb:8.1f} MB, seçim filtresi {time_filter(df, compact):7.1f} ms")
+    print(f"OEE etiketi farkı (ham / kompakt): {oee_label_mismatches(raw, variants['kompakt'][0])} satır")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Günlük grafik toplama karşılaştırması: GraphWorker'ın eski ürün başına maske döngüsü ile
+aggregate_daily_metrics tek geçiş groupby uygulamasının seçili ürün sayısına göre ölçeklenmesi.
+
+Çalıştırma (depo kök dizininden):
+    python -m benchmarks.bench_daily_groupby --rows 50000 --cols 48 --products 5 20 80
+"""
+import argparse
+import time
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_durations import make_frame
+from logic.dailyEngine import aggregate_daily_metrics
+from utils.helpers import format_oee_display, seconds_matrix_from_durations
+
+
+def legacy_aggregate(df: pd.DataFrame, grouping_col_name: str, grouped_col_name: str, grouped_values: List[str],
+                     metric_cols: List[str], oee_col_name: str, selected_grouping_val: str) -> list:
+    """Tek geçiş öncesi GraphWorker.run döngüsü (referans olarak korunur)."""
+    df = df.copy()
+    df[metric_cols] = seconds_matrix_from_durations(df[metric_cols])
+    df[grouping_col_name] = df[grouping_col_name].astype(str)
+    df[grouped_col_name] = df[grouped_col_name].astype(str)
+    results = []
+    for current_grouped_val in grouped_values:
+        subset = df[(df[grouping_col_name] == selected_grouping_val) & (df[grouped_col_name] == current_grouped_val)]
+        sums = subset[metric_cols].sum()
+        sums = sums[sums > 0]
+        oee_display_value = format_oee_display(subset[oee_col_name].values[0]) if not subset.empty else "0%"
+        if not sums.empty:
+            results.append((current_grouped_val, sums, oee_display_value))
+    return results
+
+
+def make_daily_frame(rows: int, cols: int, products: int, days: int, seed: int = 0) -> pd.DataFrame:
+    """Tarih, ürün, OEE ve süre sütunlarından oluşan sentetik günlük veri üretir."""
+    rng = np.random.default_rng(seed)
+    df = make_frame(rows, cols, seed)
+    df.insert(0, "Tarih", pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, days, rows), unit="D"))
+    df.insert(1, "Ürün", [f"P{i:03d}" for i in rng.integers(0, products, rows)])
+    df["OEE"] = rng.random(rows)
+    return df
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Günlük grafik toplama karşılaştırması")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--cols", type=int, default=48)
+    parser.add_argument("--days", type=int, default=5)
+    parser.add_argument("--products", type=int, nargs="+", default=[5, 20, 80])
+    args = parser.parse_args()
+
+    base = make_frame(args.rows, args.cols)
+    metric_cols = list(base.columns)
+    print(f"{args.rows} satır x {args.cols} metrik sütun, {args.days} gün")
+    for products in args.products:
+        df = make_daily_frame(args.rows, args.cols, products, args.days)
+        grouped_values = sorted(df["Ürün"].unique())
+        selected = "2024-01-01"
+        params = (df, "Tarih", "Ürün", grouped_values, metric_cols, "OEE", selected)
+
+        t0 = time.perf_counter()
+        legacy = legacy_aggregate(*params)
+        t_legacy = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        single = aggregate_daily_metrics(*params)
+        t_single = time.perf_counter() - t0
+
+        assert [(g, o) for g, _, o in legacy] == [(g, o) for g, _, o in single], "Sonuçlar eşleşmiyor"
+        assert all(np.allclose(a.to_numpy(), b.reindex(a.index).to_numpy()) for (_, a, _), (_, b, _) in zip(legacy, single))
+        print(f"  {products:4d} ürün -> eski: {t_legacy:.3f} s, tek geçiş: {t_single:.3f} s, "
+              f"hızlanma: {t_legacy / t_single:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Süre dönüştürme karşılaştırması: eski sütun sütun seconds_from_timedelta uygulaması ile
+seconds_matrix_from_durations blok motorunun karşılaştırılması.
+
+Çalıştırma (depo kök dizininden):
+    python -m benchmarks.bench_durations --rows 50000 --cols 48
+"""
+import argparse
+import datetime
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.helpers import seconds_matrix_from_durations
+
+
+def legacy_seconds_from_timedelta(series: pd.Series) -> pd.Series:
+    """Vektörleştirme öncesi seconds_from_timedelta uygulaması (referans olarak korunur)."""
+    seconds_series = pd.Series(0.0, index=series.index, dtype=float)
+
+    is_time_obj = series.apply(lambda x: isinstance(x, datetime.time))
+    if is_time_obj.any():
+        time_objects = series[is_time_obj]
+        seconds_series.loc[is_time_obj] = time_objects.apply(
+            lambda t: t.hour * 3600 + t.minute * 60 + t.second + t.microsecond / 1e6
+        )
+
+    str_and_timedelta_mask = ~is_time_obj & series.notna()
+    if str_and_timedelta_mask.any():
+        converted_td = pd.to_timedelta(series.loc[str_and_timedelta_mask].astype(str).str.strip(), errors='coerce')
+        valid_td_mask = pd.notna(converted_td)
+        seconds_series.loc[str_and_timedelta_mask & valid_td_mask] = converted_td[valid_td_mask].dt.total_seconds()
+
+    return seconds_series.fillna(0.0)
+
+
+def make_frame(rows: int, cols: int, seed: int = 0) -> pd.DataFrame:
+    """SMD-OEE metrik bloğuna benzeyen karışık tipli (time, string, boş) sentetik veri üretir."""
+    rng = np.random.default_rng(seed)
+    minutes = rng.integers(0, 240, size=(rows, cols))
+    kinds = rng.random(size=(rows, cols))
+    data = np.empty((rows, cols), dtype=object)
+    for r in range(rows):
+        for c in range(cols):
+            m = int(minutes[r, c])
+            if kinds[r, c] < 0.6:
+                data[r, c] = None
+            elif kinds[r, c] < 0.9:
+                data[r, c] = datetime.time(m // 60, m % 60)
+            else:
+                data[r, c] = f"{m // 60:02d}:{m % 60:02d}:00"
+    return pd.DataFrame(data, columns=[f"M{i}" for i in range(cols)])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Süre dönüştürme karşılaştırması")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--cols", type=int, default=48)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, args.cols)
+
+    t0 = time.perf_counter()
+    legacy = np.column_stack([legacy_seconds_from_timedelta(df[c]).to_numpy() for c in df.columns])
+    t_legacy = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    block = seconds_matrix_from_durations(df)
+    t_block = time.perf_counter() - t0
+
+    assert np.allclose(legacy, block), "Sonuçlar eşleşmiyor"
+    print(f"{args.rows} satır x {args.cols} sütun")
+    print(f"  eski (sütun sütun): {t_legacy:.3f} s")
+    print(f"  blok motoru       : {t_block:.3f} s")
+    print(f"  hızlanma          : {t_legacy / t_block:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
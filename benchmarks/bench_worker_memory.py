@@ -0,0 +1,130 @@
+"""
+Worker bellek karşılaştırması: GraphWorker ve hat bazlı aylık hesaplamanın eski tam kopyalı uygulaması ile
+sütun seçimli (maskeyle hat seçimi) uygulamasının tepe RSS artışı. Ölçüm, uygulamanın giriş noktalarında
+olduğu gibi enable_copy_on_write() çağrıldıktan sonra yapılır (pandas 2.x'te Copy-on-Write açılır).
+
+Her ölçüm ayrı bir süreçte yapılır; sayfa oluşturulduktan sonraki RSS taban alınır ve iş sırasında
+/proc/self/statm örneklenerek tepe değer bulunur (Linux).
+
+Çalıştırma (depo kök dizininden):
+    python -m benchmarks.bench_worker_memory --rows 200000 --hats 4
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from logic.dailyEngine import aggregate_daily_metrics
+from logic.monthlyEngine import compute_hat_figures_data
+from utils.helpers import detect_sheet_columns, enable_copy_on_write, seconds_from_timedelta, sheet_column_name
+
+SHEET = "SMD-OEE"
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def make_sheet(rows: int, hats: int, seed: int = 0) -> pd.DataFrame:
+    """Önbellekten yüklenmiş SMD-OEE sayfasına benzeyen (A, B, H..BD süreleri, BP OEE) sentetik veri üretir."""
+    rng = np.random.default_rng(seed)
+    data = {
+        "Tarih": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 31, rows), unit="D"),
+        "Ürün": np.array([f"HAT{h}-P{p}" for h in range(1, hats + 1) for p in range(20)], dtype=object)[
+            rng.integers(0, hats * 20, rows)],
+    }
+    for i in range(49):  # H..BD
+        data[f"M{i}"] = pd.to_timedelta(rng.integers(0, 3600, rows), unit="s")
+    data["OEE"] = rng.random(rows)
+    return pd.DataFrame(data)
+
+
+def legacy_hat_onay(df: pd.DataFrame, grouping_col_name: str, grouped_col_name: str, onay_col_name: str) -> list:
+    """Kopyasız uygulama öncesi hat bazlı Dizgi Onay hesabı (sayfa ve her hat için tam kopya)."""
+    work = df.copy()
+    work.rename(columns={grouping_col_name: 'Tarih', grouped_col_name: 'U_Agaci_Sev'}, inplace=True)
+    work['Tarih'] = pd.to_datetime(work['Tarih'], errors='coerce')
+    work.dropna(subset=['Tarih'], inplace=True)
+    work[onay_col_name] = seconds_from_timedelta(work[onay_col_name])
+    work['Group_Key'] = work['U_Agaci_Sev'].apply(
+        lambda s: f"HAT-{m.group(1)}" if (m := re.search(r'HAT(\d+)', str(s).upper())) else None)
+    work.dropna(subset=['Group_Key'], inplace=True)
+    results = []
+    for hat in sorted(work['Group_Key'].unique()):
+        by_hat = work[work['Group_Key'] == hat].copy()
+        other_hats = work[work['Group_Key'] != hat].copy()
+        results.append((hat, by_hat[onay_col_name].sum(), other_hats[onay_col_name].sum()))
+    return results
+
+
+def run_workload(variant: str, df: pd.DataFrame) -> None:
+    """Günlük worker girdisini hazırlar, günlük toplamları ve hat bazlı Dizgi Onay verisini hesaplar."""
+    columns = detect_sheet_columns(df, SHEET)
+    worker_cols = [columns.grouping_col_name, columns.grouped_col_name, columns.oee_col_name] + columns.metric_cols
+    worker_df = df[worker_cols].copy() if variant == "legacy" else df[worker_cols]
+    grouping_val = str(df[columns.grouping_col_name].iloc[0])
+    products = sorted(df[columns.grouped_col_name].unique())
+    aggregate_daily_metrics(worker_df, columns.grouping_col_name, columns.grouped_col_name, products,
+                            columns.metric_cols, columns.oee_col_name, grouping_val)
+    if variant == "legacy":
+        legacy_hat_onay(df, columns.grouping_col_name, columns.grouped_col_name,
+                        sheet_column_name(df, SHEET, 'T'))
+    else:
+        compute_hat_figures_data(df, SHEET, columns.grouping_col_name, columns.grouped_col_name,
+                                 columns.oee_col_name, "Dizgi Onay Dağılım Grafiği")
+
+
+def current_rss() -> int:
+    """Sürecin anlık RSS değeri (bayt)."""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * PAGE_SIZE
+
+
+def measure(variant: str, rows: int, hats: int) -> None:
+    """Alt süreçte çalışır: iş yükü sırasındaki tepe RSS artışını ve süreyi yazdırır."""
+    enable_copy_on_write()
+    df = make_sheet(rows, hats)
+    baseline = current_rss()
+    peak = baseline
+    done = threading.Event()
+
+    def sample() -> None:
+        nonlocal peak
+        while not done.is_set():
+            peak = max(peak, current_rss())
+            time.sleep(0.001)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    start = time.perf_counter()
+    run_workload(variant, df)
+    elapsed = time.perf_counter() - start
+    done.set()
+    sampler.join()
+    peak = max(peak, current_rss())
+    print(f"{variant:>8}: tepe RSS artışı {(peak - baseline) / 2 ** 20:8.1f} MB, süre {elapsed:.2f} s "
+          f"(sayfa {df.memory_usage(deep=True).sum() / 2 ** 20:.0f} MB)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Worker bellek karşılaştırması")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--hats", type=int, default=4)
+    parser.add_argument("--variant", choices=["legacy", "cow"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        measure(args.variant, args.rows, args.hats)
+        return
+
+    print(f"{args.rows} satır, {args.hats} hat (pandas {pd.__version__})")
+    for variant in ("legacy", "cow"):
+        subprocess.run([sys.executable, "-m", "benchmarks.bench_worker_memory", "--rows", str(args.rows),
+                        "--hats", str(args.hats), "--variant", variant], check=True)
+
+
+if __name__ == "__main__":
+    main()
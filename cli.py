@@ -0,0 +1,223 @@
+"""
+Arayüzsüz (komut satırı) grafik dışa aktarıcı.
+
+Bir çalışma kitabındaki günlük (Donut/Bar) ve aylık (OEE, sayfa bazlı OEE, Dizgi Onay, Dizgi Duruş)
+grafikleri seçilen tarih aralığı için bir dizine PNG olarak yazar. PyQt5 hiç içe aktarılmaz; sunucu veya
+zamanlanmış görevlerde ekran olmadan çalışır.
+
+Örnek:
+    python cli.py rapor.xlsx --sheet SMD-OEE --from 2024-01-01 --to 2024-01-31 \\
+        --daily donut bar --monthly oee pareto --out cikti
+
+Geçmiş deposundaki birden çok ayın hat bazlı aylık grafikleri (çalışma kitabı önce depoya eklenir):
+    python cli.py rapor.xlsx --add-to-history --from-history --from 2023-01-01 --to 2024-03-31 \\
+        --monthly oee --out cikti
+"""
+import argparse
+import logging
+import multiprocessing
+import sys
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+import matplotlib
+
+matplotlib.use("Agg")  # Ekran gerektirmeyen arka uç; pyplot içe aktarılmadan önce seçilmeli
+
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from config.constants import EXPORT_DPI, HISTORY_STORE_DIR, PARETO_THRESHOLD_PERCENT, REQ_SHEETS
+from logic.batchRenderer import daily_chart_filename, render_daily_jobs
+from logic.dailyCube import DailyAggregateCube
+from logic.graphPlotter import GraphPlotter
+from logic.historyStore import HistoryStore
+from logic.monthlyEngine import FiguresData, MonthlyGraphError, compute_monthly_figures_data, compute_reference_oee
+from logic.sidecarCache import SidecarCache
+from logic.workbookCache import WorkbookCache
+from utils.helpers import detect_sheet_columns, enable_copy_on_write
+
+# Komut satırı seçenekleri -> arayüzdeki grafik tipi adları
+DAILY_CHART_TYPES = {"donut": "Donut", "bar": "Bar"}
+MONTHLY_CHART_TYPES = {
+    "oee": ("hat", "OEE Grafikleri"),
+    "oee-page": ("page", "OEE Grafikleri"),
+    "onay": ("hat", "Dizgi Onay Dağılım Grafiği"),
+    "pareto": ("hat", "Dizgi Duruş Grafiği"),
+}
+
+
+def _safe_name(text: str) -> str:
+    """Dosya adında kullanılacak metni arayüzdeki kaydetme adlarıyla aynı biçimde düzenler."""
+    return str(text).replace(" ", "_").replace("/", "-")
+
+
+def _parse_date_range(date_from: str | None, date_to: str | None) -> Tuple[pd.Timestamp, pd.Timestamp] | None:
+    """--from/--to değerlerini (uçlar dahil) tarih aralığına çevirir; ikisi de yoksa None döner."""
+    if not date_from and not date_to:
+        return None
+    start = pd.Timestamp(date_from) if date_from else pd.Timestamp.min
+    end = pd.Timestamp(date_to) if date_to else pd.Timestamp.max
+    if start > end:
+        raise ValueError("--from tarihi --to tarihinden sonra olamaz.")
+    return start, end
+
+
+def export_daily_charts(df: pd.DataFrame, sheet_name: str, chart_types: Sequence[str], output_dir: Path,
+                        date_range: Tuple[pd.Timestamp, pd.Timestamp] | None,
+                        max_workers: int | None) -> List[Path]:
+    """Aralıktaki her tarih ve ürün için günlük grafikleri tek süreç havuzunda çizer."""
+    grouping_col_name, grouped_col_name, oee_col_name, metric_cols = detect_sheet_columns(df, sheet_name)
+    if not grouping_col_name or not grouped_col_name or not metric_cols:
+        logging.warning("'%s' sayfası için günlük grafik sütunları bulunamadı, atlanıyor.", sheet_name)
+        return []
+
+    cube = DailyAggregateCube.from_frame(df, grouping_col_name, grouped_col_name, metric_cols, oee_col_name)
+    grouping_values = cube.grouping_values
+    if date_range is not None:
+        dates = pd.to_datetime(pd.Series(grouping_values), errors="coerce")
+        grouping_values = [val for val, in_range in zip(grouping_values, dates.between(*date_range)) if in_range]
+
+    jobs = []
+    for grouping_val in grouping_values:
+        results = cube.results(grouping_val, cube.grouped_values_for(grouping_val), cube.metric_cols)
+        for graph_type in chart_types:
+            jobs.extend((str(output_dir / "gunluk" / daily_chart_filename(grouped_val, grouping_val, graph_type)),
+                         metric_sums, oee_display_value, graph_type)
+                        for grouped_val, metric_sums, oee_display_value in results)
+    return render_daily_jobs(jobs, max_workers)
+
+
+def export_monthly_charts(workbook_cache: WorkbookCache, excel_path: Path, df: pd.DataFrame, sheet_name: str,
+                          available_sheets: Sequence[str], chart_keys: Sequence[str], output_dir: Path,
+                          date_range: Tuple[pd.Timestamp, pd.Timestamp] | None,
+                          prev_year_oee: float | None, prev_month_oee: float | None,
+                          pareto_threshold: float = PARETO_THRESHOLD_PERCENT) -> List[Path]:
+    """
+    Seçilen aylık grafik tiplerini hesaplar ve her hat/sayfa için bir PNG yazar. Önceki yıl/ay OEE
+    verilmezse her hat/sayfa için geçmiş deposundaki değerler kullanılır.
+    """
+    columns = detect_sheet_columns(df, sheet_name)
+    written: List[Path] = []
+    for key in chart_keys:
+        graph_mode, graph_type = MONTHLY_CHART_TYPES[key]
+        try:
+            figures_data: FiguresData = compute_monthly_figures_data(
+                graph_mode, graph_type, df, sheet_name, columns, workbook_cache=workbook_cache,
+                excel_path=excel_path, available_sheets=available_sheets, date_range=date_range,
+                pareto_threshold=pareto_threshold
+            )
+        except MonthlyGraphError as exc:
+            logging.warning("%s atlandı: %s", graph_type, exc)
+            continue
+
+        reference_oee = compute_reference_oee(workbook_cache.history, graph_mode, sheet_name, figures_data) \
+            if graph_type == "OEE Grafikleri" else {}
+
+        # Dizgi Duruş başlığındaki tarih aralığı arayüzde olduğu gibi sayfanın Tarih sütunundan alınır
+        # (geçmiş deposundan gelen sayfalarda sütun adları Excel harfleri olduğu için A sütunu konumdan bulunur)
+        source_dates = None
+        if graph_type == "Dizgi Duruş Grafiği" and columns.grouping_col_name:
+            source_dates = pd.to_datetime(df[columns.grouping_col_name], errors='coerce')
+            if date_range is not None:
+                source_dates = source_dates[source_dates.between(*date_range)]
+
+        mode_dir = output_dir / "aylik"
+        mode_dir.mkdir(parents=True, exist_ok=True)
+        for chart in figures_data:
+            ref_year, ref_month = reference_oee.get(chart.name, (None, None))
+            fig = Figure(figsize=GraphPlotter.monthly_export_figsize(graph_type, chart.data), dpi=EXPORT_DPI)
+            FigureCanvasAgg(fig)
+            GraphPlotter.create_monthly_chart(
+                fig, graph_type, graph_mode, chart.name, chart.data,
+                prev_year_oee=prev_year_oee if prev_year_oee is not None else ref_year,
+                prev_month_oee=prev_month_oee if prev_month_oee is not None else ref_month,
+                source_dates=source_dates)
+            prefix = _safe_name(graph_type) + ("_sayfa" if graph_mode == "page" else "")
+            output_path = mode_dir / f"{prefix}_{_safe_name(chart.name)}.png"
+            fig.savefig(output_path, dpi=EXPORT_DPI, facecolor=fig.get_facecolor())
+            written.append(output_path)
+    return written
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Komut satırı argümanlarını tanımlar."""
+    parser = argparse.ArgumentParser(description="OEE grafiklerini arayüz olmadan PNG olarak dışa aktarır.")
+    parser.add_argument("workbook", type=Path, help="Excel çalışma kitabı (.xlsx)")
+    parser.add_argument("--sheet", default="SMD-OEE",
+                        help="Günlük ve hat bazlı aylık grafiklerin sayfası (varsayılan: SMD-OEE)")
+    parser.add_argument("--from", dest="date_from", help="Başlangıç tarihi (YYYY-AA-GG, dahil)")
+    parser.add_argument("--to", dest="date_to", help="Bitiş tarihi (YYYY-AA-GG, dahil)")
+    parser.add_argument("--daily", nargs="*", choices=sorted(DAILY_CHART_TYPES), default=[],
+                        help="Günlük grafik tipleri")
+    parser.add_argument("--monthly", nargs="*", choices=list(MONTHLY_CHART_TYPES), default=[],
+                        help="Aylık grafik tipleri")
+    parser.add_argument("--out", type=Path, default=Path("grafikler"), help="Çıktı dizini")
+    parser.add_argument("--prev-year-oee", type=float,
+                        help="Önceki yılın OEE değeri (%%); verilmezse geçmiş deposundan okunur")
+    parser.add_argument("--prev-month-oee", type=float,
+                        help="Önceki ayın OEE değeri (%%); verilmezse geçmiş deposundan okunur")
+    parser.add_argument("--pareto-threshold", type=float, default=PARETO_THRESHOLD_PERCENT,
+                        help="Dizgi Duruş Pareto'sunun kümülatif yüzde eşiği (varsayılan: %(default)s)")
+    parser.add_argument("--workers", type=int, help="Günlük grafikler için süreç sayısı")
+    parser.add_argument("--add-to-history", action="store_true",
+                        help="Çalışma kitabını önceki ay/yıl OEE referansları için geçmiş deposuna ekle")
+    parser.add_argument("--from-history", action="store_true",
+                        help="Günlük ve hat bazlı aylık grafiklerin verisini çalışma kitabı yerine geçmiş deposundan "
+                             "(--from/--to aralığındaki tüm aylar) al")
+    parser.add_argument("--history-dir", type=Path, default=HISTORY_STORE_DIR,
+                        help="Geçmiş deposu dizini (varsayılan: %(default)s)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Ayrıntılı günlük çıktısı")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Komut satırı giriş noktası; başarıda 0, hatada 1 döndürür."""
+    args = build_parser().parse_args(argv)
+    # force=True: içe aktarılan bir modül kök logger'ı önceden kurmuş olsa bile -v seviyesi geçerli olur
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(levelname)s: %(message)s", force=True)
+    enable_copy_on_write()
+    if not args.daily and not args.monthly:
+        logging.error("En az bir --daily veya --monthly grafik tipi seçilmelidir.")
+        return 1
+
+    try:
+        date_range = _parse_date_range(args.date_from, args.date_to)
+        with pd.ExcelFile(args.workbook) as xls:
+            available_sheets = sorted(REQ_SHEETS.intersection(xls.sheet_names))
+            if args.sheet not in available_sheets:
+                logging.error("'%s' sayfası çalışma kitabında bulunamadı.", args.sheet)
+                return 1
+            workbook_cache = WorkbookCache(sidecar=SidecarCache(), history=HistoryStore(args.history_dir),
+                                           auto_ingest=args.add_to_history)
+            # Gerekli tüm sayfalar çalışma kitabı bir kez açılarak okunur
+            workbook_cache.load_sheets(args.workbook, available_sheets, excel_file=xls)
+        if args.from_history:
+            # Çok aylık grafikler: aralıktaki ay bölümleri Excel yeniden ayrıştırılmadan belleğe eşlenerek okunur
+            df = workbook_cache.history.load_sheet(args.sheet, *(date_range or (None, None)))
+            if df is None:
+                logging.error("'%s' sayfası için geçmiş deposunda veri bulunamadı.", args.sheet)
+                return 1
+        else:
+            df = workbook_cache.load_sheet(args.workbook, args.sheet)
+
+        written = export_daily_charts(df, args.sheet, [DAILY_CHART_TYPES[t] for t in args.daily], args.out,
+                                      date_range, args.workers) if args.daily else []
+        if args.monthly:
+            written += export_monthly_charts(workbook_cache, args.workbook, df, args.sheet, available_sheets,
+                                             args.monthly, args.out, date_range,
+                                             args.prev_year_oee, args.prev_month_oee, args.pareto_threshold)
+    except Exception as exc:
+        logging.exception("Grafikler dışa aktarılırken bir hata oluştu.")
+        print(f"Hata: {exc}", file=sys.stderr)
+        return 1
+
+    print(f"{len(written)} grafik kaydedildi: {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -1,5 +1,4 @@
-import logging  # Uygulama günlükleme işlemleri için
-import sys      # Sistem çıktıları/logları için
+from pathlib import Path  # Önbellek dizini yolu için
 import matplotlib.pyplot as plt  # Grafik çizimi için Matplotlib
 
 # Her sayfada kaç grafik gösterileceği (sayfalama için)
@@ -11,11 +10,9 @@ REQ_SHEETS = {"SMD-OEE", "ROBOT", "DALGA_LEHİM", "KAPLAMA-OEE"}  # Gerekli shee
 # ------------------------------------------
 # Loglama ayarları
 # ------------------------------------------
-logging.basicConfig(
-    level=logging.INFO,  # Log seviyesini INFO olarak ayarla
-    format="%(asctime)s [%(levelname)s] %(message)s",  # Log formatı: zaman - seviye - mesaj
-    handlers=[logging.StreamHandler(sys.stdout)],  # Log'ları terminale yazdır
-)
+# Kütüphane modülleri içe aktarılırken loglamayı yapılandırmaz; giriş noktaları (main.py, cli.py)
+# bu biçimle kök logger'ı kendisi kurar
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"  # Log formatı: zaman - seviye - mesaj
 
 # ------------------------------------------
 # Matplotlib yazı tipi ayarları (Türkçe karakter desteği için)
@@ -51,3 +48,83 @@ plt.rcParams['xtick.top'] = False          # X ekseninde üst tik çizgisi göst
 plt.rcParams['ytick.right'] = False        # Y ekseninde sağ tik çizgisi gösterme
 plt.rcParams['axes.edgecolor'] = 'black'   # Grafik çerçeve rengi
 plt.rcParams['axes.linewidth'] = 1.5       # Grafik çerçeve kalınlığı
+
+# ------------------------------------------
+# Çalışma kitabı önbelleği ayarları
+# ------------------------------------------
+WORKBOOK_CACHE_MAX_BYTES = 1024 * 1024 * 1024  # Bellekte tutulacak ayrıştırılmış sayfaların toplam üst sınırı (1 GB)
+
+# Sayfa bazında uygulamanın kullandığı sütunlar (Excel harfleriyle; "H:BD" uçlar dahil aralık).
+# Excel yalnızca bu sütunlar okunarak yüklenir (usecols). Tanımsız sayfalar tüm sütunlarıyla okunur.
+#   A: Tarih, B: Ürün/Hat, H..BD / H..AU: duruş süreleri (T: Dizgi Onay), BP / BG: OEE
+SHEET_COLUMN_LAYOUT = {
+    "SMD-OEE": "A,B,H:BD,BP",
+    "DALGA_LEHİM": "A,B,H:BD,BP",
+    "ROBOT": "A,B,H:AU,BG",
+    "KAPLAMA-OEE": "A,B,BG",
+}
+
+# Sayfa bazında süre (hh:mm:ss) içeren sütun aralıkları (Excel harfleriyle, uçlar dahil)
+SHEET_DURATION_RANGES = {
+    "SMD-OEE": ("H", "BD"),
+    "DALGA_LEHİM": ("H", "BD"),
+    "ROBOT": ("H", "AU"),
+}
+
+# Sayfa bazında OEE sütunu (Excel harfi); yüklemede float64 orana çevrilir
+SHEET_OEE_COLUMNS = {
+    "SMD-OEE": "BP",
+    "DALGA_LEHİM": "BP",
+    "ROBOT": "BG",
+    "KAPLAMA-OEE": "BG",
+}
+OEE_NO_PRODUCTION = -1.0  # Kompakt tabloda "ÜRETİM YAPILMADI" hücrelerinin OEE değeri (geçerli oranlar 0..1)
+
+# Hat kayıt defteri: ürün/hat (B) hücrelerindeki "HAT<n>" ifadesi "HAT-<n>" anahtarına çevrilir.
+# Anahtarlar yüklemede bir kez hesaplanıp LINE_GROUP_COLUMN sütununda (category) saklanır; aylık hat
+# grafikleri yalnızca LINE_REGISTRY'deki hatlar için, bu sırayla çizilir.
+LINE_GROUP_PATTERN = r"HAT(\d+)"
+LINE_GROUP_COLUMN = "Hat_Anahtari"
+LINE_REGISTRY = ("HAT-1", "HAT-2", "HAT-3", "HAT-4")
+
+# ------------------------------------------
+# Disk üzerindeki sütunsal (Feather) yan dosya önbelleği
+# ------------------------------------------
+SIDECAR_CACHE_DIR = Path.home() / ".oee_grafik_cache"  # Yan dosyaların yazılacağı yerel dizin
+SIDECAR_CACHE_MAX_FILES = 64  # Dizinde tutulacak en fazla yan dosya sayısı (eskiler silinir)
+STREAM_CHUNK_ROWS = 5000  # Akışlı (read-only) Excel okumasında her parçadaki satır sayısı
+
+# ------------------------------------------
+# Çok aylık OEE geçmişi (geçmişe eklenen çalışma kitaplarının ay bölümlü Feather dosyaları)
+# ------------------------------------------
+HISTORY_STORE_DIR = Path.home() / ".oee_grafik_gecmis"  # Ay bölümlerinin yazılacağı yerel dizin
+# False: çalışma kitapları yalnızca açık istekle (arayüzde "Geçmişe Ekle", CLI'da --add-to-history)
+# geçmişe eklenir; True: açılan her sayfa otomatik eklenir
+HISTORY_AUTO_INGEST = False
+
+# ------------------------------------------
+# Günlük grafik sonuç önbelleği
+# ------------------------------------------
+DAILY_RESULTS_CACHE_SIZE = 16  # (sayfa, tarih, ürünler, metrikler) başına tutulacak en fazla sonuç kümesi
+DAILY_FIGURE_CACHE_PAGES = 5  # Günlük grafiklerde bellekte tutulacak çizilmiş sayfa sayısı (LRU)
+
+# ------------------------------------------
+# Aylık grafikler
+# ------------------------------------------
+ALL_HATS_CHART_NAME = "TÜM HATLAR"  # Dizgi Onay dağılımında tüm hatların paylarını gösteren grafiğin adı
+PARETO_THRESHOLD_PERCENT = 80.0  # Dizgi Duruş Pareto'sunda gösterilecek duruşların kümülatif yüzde eşiği
+GENERAL_PARETO_CHART_NAME = "Genel Dizgi Duruş"  # Tüm hatların birlikte gösterildiği Pareto grafiğinin adı
+# Grafik başlıklarında kullanılan Türkçe ay isimleri (ay numarası -> ad)
+MONTH_NAMES_TR = {
+    1: "Ocak", 2: "Şubat", 3: "Mart", 4: "Nisan", 5: "Mayıs", 6: "Haziran",
+    7: "Temmuz", 8: "Ağustos", 9: "Eylül", 10: "Ekim", 11: "Kasım", 12: "Aralık"
+}
+
+# ------------------------------------------
+# Dışa aktarma (PDF / komut satırı)
+# ------------------------------------------
+MONTHLY_EXPORT_FIGSIZE = (12, 7)  # Dışa aktarılan aylık grafiklerin inç cinsinden boyutu
+PARETO_EXPORT_WIDTH = 14.0  # Dizgi Duruş grafiğinin genişliği (uzun duruş etiketleri için daha geniş)
+PARETO_EXPORT_HEIGHT_PER_BAR = 0.5  # Dizgi Duruş grafiğinde çubuk başına yükseklik (inç)
+PARETO_EXPORT_HEIGHT_LIMITS = (6.0, 25.0)  # Dizgi Duruş grafiğinin en küçük / en büyük yüksekliği (inç)
+EXPORT_DPI = 120  # Dışa aktarmada raster öğelerin çözünürlüğü (arayüzdeki aylık grafiklerle aynı)
@@ -0,0 +1,36 @@
+import logging
+from pathlib import Path
+from typing import List, Tuple
+
+import pandas as pd
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from logic.batchRenderer import render_daily_batch
+
+
+class BatchRenderWorker(QThread):
+    """Seçili tarihin tüm günlük grafiklerini süreç havuzunda çizip PNG olarak kaydeden iş parçacığı."""
+
+    finished = pyqtSignal(list)  # Yazılan dosya yolları
+    progress = pyqtSignal(int)  # Yüzdelik ilerleme
+    error = pyqtSignal(str)  # Hata mesajı
+
+    def __init__(self, results: List[Tuple[str, pd.Series, str]], output_dir: Path, grouping_val: str,
+                 graph_type: str) -> None:
+        super().__init__()
+        self.results = results
+        self.output_dir = output_dir
+        self.grouping_val = grouping_val
+        self.graph_type = graph_type
+
+    def run(self) -> None:
+        """Toplu çizimi başlatır; havuzdaki süreçler bittikçe ilerleme yayınlar."""
+        try:
+            written = render_daily_batch(
+                self.results, self.output_dir, self.grouping_val, self.graph_type,
+                progress_callback=lambda done, total: self.progress.emit(int(done / total * 100))
+            )
+            self.finished.emit(written)
+        except Exception as exc:
+            logging.exception("BatchRenderWorker hatası oluştu.")
+            self.error.emit(f"Grafikler kaydedilirken bir hata oluştu: {str(exc)}")
@@ -0,0 +1,85 @@
+import logging
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, List, Sequence, Tuple
+
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from logic.graphPlotter import GraphPlotter
+
+
+def daily_chart_filename(grouped_val: str, grouping_val: str, graph_type: str) -> str:
+    """Günlük grafik için dosya adı üretir (tek grafik kaydetmedeki varsayılan adla aynı biçim)."""
+    filename = f"grafik_{grouped_val}_{grouping_val}_{graph_type}.png".replace(" ", "_").replace("/", "-")
+    return re.sub(r'[<>:"\\|?*]', "-", filename)  # Windows'ta dosya adında geçersiz karakterler
+
+
+def _render_daily_chart_job(job: Tuple[str, pd.Series, str, str]) -> str:
+    """
+    Süreç havuzunda çalışan iş: tek bir ürünün günlük grafiğini Agg ile çizer ve PNG olarak kaydeder.
+    Her iş kendi figürünü oluşturur; süreçler arasında paylaşılan matplotlib durumu yoktur.
+    """
+    output_path, metric_sums, oee_display_value, graph_type = job
+    fig = GraphPlotter.create_daily_figure(metric_sums, oee_display_value, graph_type)
+    FigureCanvasAgg(fig)
+    fig.savefig(output_path, bbox_inches='tight', facecolor=fig.get_facecolor())
+    return output_path
+
+
+def render_daily_jobs(
+        jobs: Sequence[Tuple[str, pd.Series, str, str]],  # (çıktı yolu, metrik toplamları, OEE, grafik tipi)
+        max_workers: int | None = None,  # Süreç sayısı (varsayılan: çekirdek sayısı)
+        progress_callback: Callable[[int, int], None] | None = None  # (tamamlanan, toplam)
+) -> List[Path]:
+    """
+    Hazırlanmış günlük grafik işlerini tek bir süreç havuzunda çizip kaydeder. Farklı tarih ve grafik
+    tiplerine ait işler aynı havuzu paylaşabilir; süreç başlatma maliyeti bir kez ödenir.
+
+    Returns:
+        Yazılan dosyaların yolları (jobs sırasıyla).
+    """
+    if not jobs:
+        return []
+    for output_path, *_ in jobs:
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    written: List[Path] = []
+    # fork, QThread'den çağrıldığında Qt ve kilit durumunu kopyalayıp alt süreçleri kilitleyebilir; spawn
+    # her süreci temiz başlatır (Windows'taki varsayılanla aynı)
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [executor.submit(_render_daily_chart_job, job) for job in jobs]
+        for done, future in enumerate(as_completed(futures), 1):
+            written.append(Path(future.result()))
+            if progress_callback:
+                progress_callback(done, len(jobs))
+
+    logging.info("%d günlük grafik %d süreçle kaydedildi.", len(written), max_workers)
+    order = {job[0]: i for i, job in enumerate(jobs)}
+    return sorted(written, key=lambda path: order[str(path)])
+
+
+def render_daily_batch(
+        results: Sequence[Tuple[str, pd.Series, str]],  # GraphWorker sonuç biçimi: (ürün, metrik toplamları, OEE)
+        output_dir: Path,  # PNG dosyalarının yazılacağı dizin
+        grouping_val: str,  # Seçilen tarih (dosya adlarında kullanılır)
+        graph_type: str = "Donut",  # "Donut" veya "Bar"
+        max_workers: int | None = None,  # Süreç sayısı (varsayılan: çekirdek sayısı)
+        progress_callback: Callable[[int, int], None] | None = None  # (tamamlanan, toplam)
+) -> List[Path]:
+    """
+    Tüm ürünlerin günlük grafiklerini bir süreç havuzunda paralel çizip PNG olarak kaydeder.
+    Çizim CPU'ya bağlı olduğundan süreçler GIL'den bağımsız olarak çekirdek sayısıyla ölçeklenir.
+
+    Returns:
+        Yazılan dosyaların yolları (results sırasıyla).
+    """
+    output_dir = Path(output_dir)
+    jobs = [(str(output_dir / daily_chart_filename(grouped_val, grouping_val, graph_type)),
+             metric_sums, oee_display_value, graph_type)
+            for grouped_val, metric_sums, oee_display_value in results]
+    return render_daily_jobs(jobs, max_workers, progress_callback)
@@ -0,0 +1,37 @@
+import threading
+
+
+class OperationCancelled(Exception):
+    """İptal edilen bir hesaplamayı, bir sonraki kontrol noktasında sonlandırmak için fırlatılır."""
+
+
+class CancellationToken:
+    """
+    Arka plan hesaplamalarını işbirlikçi olarak iptal etmek için paylaşılan bayrak.
+
+    GUI iş parçacığı cancel() çağırır; hesaplama döngüleri raise_if_cancelled() ile bayrağı kontrol eder
+    ve iptal istenmişse OperationCancelled fırlatarak çıkar. Qt'ye bağımlı değildir.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """İptal ister; hesaplama bir sonraki kontrol noktasında durur."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """İptal istenip istenmediği."""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """İptal istenmişse OperationCancelled fırlatır."""
+        if self._event.is_set():
+            raise OperationCancelled()
+
+
+def check_cancelled(cancel_token: CancellationToken | None) -> None:
+    """İsteğe bağlı belirteç için raise_if_cancelled kısayolu (belirteç yoksa hiçbir şey yapmaz)."""
+    if cancel_token is not None:
+        cancel_token.raise_if_cancelled()
@@ -0,0 +1,42 @@
+import logging
+from typing import Callable
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PyQt5.QtCore import QThread, pyqtSignal
+
+
+class ChartRenderWorker(QThread):
+    """
+    Bir grafiği GUI iş parçacığı dışında Agg ile RGBA arabelleğine çizen iş parçacığı.
+
+    Çizim fonksiyonu boş bir Figure alır ve üzerine çizer; sonuç (istek no, RGBA dizisi, Figure)
+    olarak yayınlanır. Figure kaydetme gibi işlemler için saklanabilir.
+    """
+
+    finished = pyqtSignal(int, object, object)  # İstek no, (yükseklik, genişlik, 4) uint8 RGBA dizisi, Figure
+    error = pyqtSignal(int, str)  # İstek no, hata mesajı
+
+    def __init__(self, request_id: int, draw: Callable[[Figure], None], width_px: int, height_px: int,
+                 dpi: float) -> None:
+        super().__init__()
+        self.request_id = request_id
+        self.draw = draw
+        self.width_px = width_px
+        self.height_px = height_px
+        self.dpi = dpi
+
+    def run(self) -> None:
+        """Figürü oluşturur, çizer ve Agg arabelleğini yayınlar."""
+        try:
+            fig = Figure(figsize=(self.width_px / self.dpi, self.height_px / self.dpi), dpi=self.dpi)
+            canvas = FigureCanvasAgg(fig)
+            self.draw(fig)
+            canvas.draw()
+            # Arabellek kopyalanmadan numpy dizisi olarak iletilir (Figure yaşadıkça geçerlidir)
+            rgba = np.asarray(canvas.buffer_rgba())
+            self.finished.emit(self.request_id, rgba, fig)
+        except Exception as exc:
+            logging.exception("ChartRenderWorker hatası oluştu.")
+            self.error.emit(self.request_id, f"Grafik çizilirken bir hata oluştu: {str(exc)}")
@@ -0,0 +1,103 @@
+import logging
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from logic.dailyEngine import DailyGraphResult
+from utils.helpers import factorize_keys, format_oee_display, is_compact_oee, seconds_matrix_from_durations
+
+
+class DailyAggregateCube:
+    """
+    Bir sayfanın (tarih, ürün) hücrelerine ait metrik toplamlarını (saniye) tutan önceden hesaplanmış küp.
+
+    Sayfa yüklendikten sonra bir kez oluşturulur; tarih, ürün ve metrik seçimlerine ait sonuçlar
+    ham satırlara dönmeden dizi dilimleme ile üretilir. Yalnızca satırı bulunan hücreler saklanır
+    (tarih koduna göre sıralı, tarih başına bitişik satır aralıkları); boş tarih veya ürün içeren
+    satırlar, veri seçim sayfasında seçilemedikleri için küpe alınmaz.
+    """
+
+    def __init__(self, grouping_values: List[str], grouped_values: List[str], metric_cols: List[str],
+                 cell_grouped: np.ndarray, grouping_offsets: np.ndarray, sums: np.ndarray,
+                 first_oee: np.ndarray | None, oee_is_fraction: bool = False) -> None:
+        self.grouping_values = grouping_values  # Küpteki tarihler (ilk görülme sırasıyla)
+        self.grouped_values = grouped_values  # Küpteki ürünler (ilk görülme sırasıyla)
+        self.metric_cols = metric_cols
+        self.cell_grouped = cell_grouped  # Her hücrenin ürün konumu
+        self.grouping_offsets = grouping_offsets  # Tarih g'nin hücreleri: [offsets[g], offsets[g + 1])
+        self.sums = sums  # (hücre, metrik) saniye toplamları
+        self.first_oee = first_oee  # Her hücrenin ilk satırındaki ham OEE değeri
+        self.oee_is_fraction = oee_is_fraction  # first_oee kompakt tablodan mı geldi (0-1 oran)
+        self._grouping_index: Dict[str, int] = {val: i for i, val in enumerate(grouping_values)}
+        self._grouped_index: Dict[str, int] = {val: i for i, val in enumerate(grouped_values)}
+        self._metric_index: Dict[str, int] = {col: i for i, col in enumerate(metric_cols)}
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, grouping_col_name: str, grouped_col_name: str,
+                   metric_cols: Sequence[str], oee_col_name: str | None) -> "DailyAggregateCube":
+        """Ham sayfa DataFrame'inden küpü tek geçişte oluşturur."""
+        # Anahtar etiketleri GraphWorker'daki string değerlerle aynıdır; boş değerler -1 kodunu alır
+        grouping_codes, grouping_uniques = factorize_keys(df[grouping_col_name])
+        grouped_codes, grouped_uniques = factorize_keys(df[grouped_col_name])
+        valid = (grouping_codes >= 0) & (grouped_codes >= 0)
+
+        n_grouping, n_grouped = len(grouping_uniques), max(len(grouped_uniques), 1)
+        metric_cols = [col for col in metric_cols if col in df.columns]
+        cell_codes = grouping_codes[valid].astype(np.int64) * n_grouped + grouped_codes[valid]
+        # Gözlenen hücreler sıralı kodlarıyla; first_rows her hücrenin ilk satırının konumu
+        cells, first_rows = np.unique(cell_codes, return_index=True)
+
+        seconds = seconds_matrix_from_durations(df.loc[valid, metric_cols])
+        sums = pd.DataFrame(seconds).groupby(cell_codes, sort=True).sum().to_numpy()
+        grouping_offsets = np.searchsorted(cells // n_grouped, np.arange(n_grouping + 1))
+
+        first_oee = None
+        oee_is_fraction = False
+        if oee_col_name and oee_col_name in df.columns:
+            oee_is_fraction = is_compact_oee(df[oee_col_name])
+            # Her hücrenin ilk satırındaki OEE değeri (GraphWorker'daki values[0] ile aynı)
+            first_oee = df.loc[valid, oee_col_name].to_numpy()[first_rows]
+
+        logging.info("Günlük küp oluşturuldu: %d tarih x %d ürün, %d dolu hücre x %d metrik",
+                     n_grouping, len(grouped_uniques), len(cells), len(metric_cols))
+        return cls(grouping_uniques, grouped_uniques, metric_cols,
+                   (cells % n_grouped).astype(np.intp), grouping_offsets,
+                   sums, first_oee, oee_is_fraction)
+
+    def _cells_for(self, grouping_val: str) -> Dict[int, int]:
+        """Seçilen tarihin hücrelerini ürün konumu -> hücre satırı sözlüğü olarak döndürür."""
+        g = self._grouping_index.get(grouping_val)
+        if g is None:
+            return {}
+        start, stop = self.grouping_offsets[g], self.grouping_offsets[g + 1]
+        return dict(zip(self.cell_grouped[start:stop].tolist(), range(start, stop)))
+
+    def grouped_values_for(self, grouping_val: str) -> List[str]:
+        """Seçilen tarihte satırı bulunan ürünleri sıralı olarak döndürür."""
+        return sorted(self.grouped_values[p] for p in self._cells_for(grouping_val))
+
+    def results(self, selected_grouping_val: str, grouped_values: Sequence[str],
+                metric_cols: Sequence[str]) -> List[DailyGraphResult]:
+        """
+        GraphWorker.finished ile aynı biçimde sonuç üretir: grouped_values sırasıyla
+        (ürün, sıfırdan büyük metrik toplamları, OEE gösterim metni) listesi.
+        """
+        cells = self._cells_for(selected_grouping_val)
+        if not cells:
+            return []
+        metric_cols = [col for col in metric_cols if col in self._metric_index]
+        metric_positions = [self._metric_index[col] for col in metric_cols]
+
+        results: List[DailyGraphResult] = []
+        for grouped_val in grouped_values:
+            cell = cells.get(self._grouped_index.get(grouped_val, -1))
+            if cell is None:
+                continue
+            sums = pd.Series(self.sums[cell, metric_positions], index=metric_cols)
+            sums = sums[sums > 0]
+            oee_display_value = format_oee_display(self.first_oee[cell], fraction=self.oee_is_fraction) \
+                if self.first_oee is not None else "0%"
+            if not sums.empty:
+                results.append(DailyGraphResult(grouped_val, sums, oee_display_value))
+        return results
@@ -0,0 +1,72 @@
+from typing import List, NamedTuple, Sequence
+
+import pandas as pd
+
+from logic.cancellation import CancellationToken, check_cancelled
+from utils.helpers import (format_oee_display, is_compact_oee, key_equals_mask, key_isin_mask,
+                           seconds_matrix_from_durations)
+
+
+class DailyGraphResult(NamedTuple):
+    """
+    Tek bir ürünün günlük grafik verisi. Demet olarak da açılabilir
+    (grouped_val, metric_sums, oee_display_value); mevcut çağıranlar bu biçimi kullanır.
+    """
+    grouped_val: str  # Ürün (gruplanan değer)
+    metric_sums: pd.Series  # Sıfırdan büyük metrik toplamları (saniye)
+    oee_display_value: str  # OEE gösterim metni (örn. "85%")
+
+
+def aggregate_daily_metrics(df: pd.DataFrame, grouping_col_name: str, grouped_col_name: str,
+                            grouped_values: Sequence[str], metric_cols: Sequence[str],
+                            oee_col_name: str | None, selected_grouping_val: str,
+                            cancel_token: CancellationToken | None = None) -> List[DailyGraphResult]:
+    """
+    Seçilen grup değeri (örn. tarih) için tüm alt grupların (ürünlerin) metrik toplamlarını ve ilk
+    OEE değerini tek bir groupby geçişiyle hesaplar.
+
+    Returns:
+        grouped_values sırasıyla (alt grup, sıfırdan büyük metrik toplamları (saniye), OEE gösterim metni)
+        listesi. Toplamı sıfır olan alt gruplar listeye alınmaz.
+
+    Raises:
+        OperationCancelled: cancel_token ile iptal istenirse (ağır adımlar arasında ve ürün döngüsünde).
+    """
+    if grouping_col_name not in df.columns or grouped_col_name not in df.columns:
+        return []
+
+    # Seçilen grubun satırları tek maske ile ayrılır (kompakt tabloda tamsayı karşılaştırması);
+    # string'e dönüştürme yalnızca bu satırlarda yapılır
+    mask = key_equals_mask(df[grouping_col_name], selected_grouping_val) & \
+        key_isin_mask(df[grouped_col_name], grouped_values)
+    if not mask.any():
+        return []
+    keys = df.loc[mask, grouped_col_name].astype(str)
+    check_cancelled(cancel_token)
+
+    present_metric_cols = [col for col in metric_cols if col in df.columns]
+    seconds = pd.DataFrame(seconds_matrix_from_durations(df.loc[mask, present_metric_cols]),
+                           columns=present_metric_cols, index=keys.index)
+    check_cancelled(cancel_token)
+    sums_by_key = seconds.groupby(keys, sort=False).sum()
+
+    first_oee = None
+    oee_is_fraction = False
+    if oee_col_name and oee_col_name in df.columns:
+        oee_is_fraction = is_compact_oee(df[oee_col_name])  # Kompakt tablo: OEE oran olarak saklanır
+        # Her alt grubun ilk satırındaki OEE değeri
+        first_oee = pd.Series(df.loc[mask, oee_col_name].values, index=keys.values)
+        first_oee = first_oee[~first_oee.index.duplicated()]
+
+    results: List[DailyGraphResult] = []
+    for grouped_val in grouped_values:
+        check_cancelled(cancel_token)
+        if grouped_val not in sums_by_key.index:
+            continue
+        sums = sums_by_key.loc[grouped_val].rename(None)
+        sums = sums[sums > 0]
+        oee_display_value = format_oee_display(first_oee[grouped_val], fraction=oee_is_fraction) \
+            if first_oee is not None else "0%"
+        if not sums.empty:
+            results.append(DailyGraphResult(grouped_val, sums, oee_display_value))
+    return results
@@ -1,11 +1,20 @@
-from typing import List, Any
+import datetime
+from typing import List, Any, Dict, Union
 import pandas as pd
+import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.colors
+from matplotlib.figure import Figure
+from matplotlib.ticker import PercentFormatter
 import numpy as np
 
+from config.constants import (ALL_HATS_CHART_NAME, GENERAL_PARETO_CHART_NAME, MONTH_NAMES_TR,
+                              MONTHLY_EXPORT_FIGSIZE, PARETO_EXPORT_HEIGHT_LIMITS, PARETO_EXPORT_HEIGHT_PER_BAR,
+                              PARETO_EXPORT_WIDTH, PARETO_THRESHOLD_PERCENT)
+
+
 class GraphPlotter:
-    """Matplotlib grafikleri (donut ve çubuk) oluşturmak için yardımcı sınıf."""
+    """Matplotlib grafikleri (günlük donut/çubuk ve aylık grafikler) oluşturmak için yardımcı sınıf."""
 
     @staticmethod
     def create_donut_chart(
@@ -126,4 +135,383 @@ class GraphPlotter:
                     color='black')
 
         ax.set_xlim(left=0)  # X ekseni sıfırdan başlasın
-        plt.tight_layout(rect=[0.1, 0.1, 0.95, 0.9])  # Grafik kenar boşlukları
+        ax.figure.tight_layout(rect=[0.1, 0.1, 0.95, 0.9])  # Grafik kenar boşlukları
+
+    @staticmethod
+    def monthly_export_figsize(graph_type: str,
+                               data_container: Union[List[Dict[str, Any]], Dict[str, Any]]) -> tuple[float, float]:
+        """
+        Kaydedilen/dışa aktarılan aylık grafiğin ekran boyutundan bağımsız sabit boyutu (inç).
+        Dizgi Duruş grafiği daha geniştir ve yüksekliği çubuk sayısıyla (sınırlar içinde) artar.
+        """
+        if graph_type == "Dizgi Duruş Grafiği" and isinstance(data_container, dict):
+            min_height, max_height = PARETO_EXPORT_HEIGHT_LIMITS
+            num_bars = len(data_container.get("metrics", {}))
+            return PARETO_EXPORT_WIDTH, max(min_height, min(max_height, num_bars * PARETO_EXPORT_HEIGHT_PER_BAR + 2.0))
+        return MONTHLY_EXPORT_FIGSIZE
+
+    @staticmethod
+    def reset_figure(fig: Figure, figsize: tuple[float, float] | None = None) -> None:
+        """
+        Yeniden kullanılacak bir figürü boşaltır: tüm eksen ve metinleri siler, kenar boşluklarını
+        varsayılana döndürür ve istenirse boyutunu değiştirir.
+        """
+        fig.clear()
+        fig.subplotpars.update(**{key: matplotlib.rcParams[f"figure.subplot.{key}"]
+                                  for key in ("left", "right", "bottom", "top", "wspace", "hspace")})
+        if figsize is not None:
+            fig.set_size_inches(figsize, forward=False)
+
+    @staticmethod
+    def create_daily_figure(
+            metric_sums: pd.Series,  # Ürünün metrik toplamları (saniye)
+            oee_display_value: str,  # OEE gösterim değeri
+            graph_type: str,  # "Donut" veya "Bar"
+            fig: Figure | None = None  # Yeniden kullanılacak figür (verilmezse yenisi oluşturulur)
+    ) -> Figure:
+        """
+        Tek bir ürün için günlük grafiği (donut veya çubuk) ve toplam duruş metnini içeren figürü oluşturur.
+        pyplot durumuna bağlı olmadığından GUI iş parçacığı dışında da kullanılabilir.
+        """
+        # Grafik boyutları (700x460 piksel, DPI 100 varsayılır, inç cinsinden)
+        if fig is None:
+            fig = Figure(figsize=(700 / 100, 460 / 100))
+        else:
+            GraphPlotter.reset_figure(fig)
+        ax = fig.add_subplot()
+        background_color = 'white'
+        fig.patch.set_facecolor(background_color)
+        ax.set_facecolor(background_color)
+
+        # Metrikleri azalan sırada sıralar
+        sorted_metrics_series = metric_sums.sort_values(ascending=False) if not metric_sums.empty else pd.Series()
+
+        num_metrics = len(sorted_metrics_series)
+        if num_metrics == 1 and sorted_metrics_series.index[0] == 'HAT ÇALIŞMADI':
+            chart_colors = ['#FF9841']  # Özel durum renk
+        else:
+            # Matplotlib renk paletinden renkler alır
+            colors_palette = matplotlib.colormaps.get_cmap('tab20')
+            chart_colors = [colors_palette(i % 20) for i in range(num_metrics)] if num_metrics > 0 else []
+
+        # Seçilen grafik türüne göre çizim yapar
+        if graph_type == "Donut":
+            GraphPlotter.create_donut_chart(ax, sorted_metrics_series, oee_display_value, chart_colors, fig)
+        elif graph_type == "Bar":
+            GraphPlotter.create_bar_chart(ax, sorted_metrics_series, oee_display_value, chart_colors)
+
+        # Toplam duruş süresini saat ve dakika cinsinden hesapla
+        total_duration_seconds = sorted_metrics_series.sum()
+        total_duration_hours = int(total_duration_seconds // 3600)
+        total_duration_minutes = int((total_duration_seconds % 3600) // 60)
+        total_duration_text = f"TOPLAM DURUŞ\n{total_duration_hours} SAAT {total_duration_minutes} DAKİKA"
+
+        # Grafik altına toplam duruş metnini ekle
+        fig.text(0.01, 0.05, total_duration_text, transform=fig.transFigure,
+                 fontsize=14, fontweight='bold', verticalalignment='bottom')
+        return fig
+
+    @staticmethod
+    def create_monthly_chart(
+            fig: Figure,  # Çizim yapılacak (boş) figür
+            graph_type: str,  # "OEE Grafikleri", "Dizgi Onay Dağılım Grafiği" veya "Dizgi Duruş Grafiği"
+            graph_mode: str,  # "hat" veya "page"
+            name: str,  # Hat/sayfa adı
+            data_container: Union[List[Dict[str, Any]], Dict[str, Any]],  # MonthlyGraphWorker'dan gelen grafik verisi
+            prev_year_oee: float | None = None,  # Önceki yıl OEE (yüzde)
+            prev_month_oee: float | None = None,  # Önceki ay OEE (yüzde)
+            source_dates: pd.Series | None = None  # Pareto başlığındaki tarih aralığı için kaynak tarih sütunu
+    ) -> None:
+        """
+        Aylık grafik sayfasının grafiklerini verilen figüre çizer. Qt'ye ve pyplot durumuna bağlı
+        olmadığından arka plan iş parçacığında Agg ile çizim için kullanılabilir.
+        """
+        ax = fig.add_subplot()
+        background_color = 'white'
+        fig.patch.set_facecolor(background_color)  # Figür arka plan rengi
+        ax.set_facecolor(background_color)  # Eksen arka plan rengi
+
+        # Çerçeve çizgilerini ayarla
+        ax.spines['top'].set_visible(False)  # Üst çerçeveyi gizle
+        ax.spines['right'].set_visible(False)  # Sağ çerçeveyi gizle
+        ax.spines['left'].set_linewidth(1.5)  # Sol çerçevenin kalınlığı
+        ax.spines['bottom'].set_linewidth(1.5)  # Alt çerçevenin kalınlığı
+        ax.grid(False)  # Izgarayı gizle
+
+        if graph_type == "OEE Grafikleri":
+            grouped_oee = pd.DataFrame(data_container)  # Veri çerçevesi oluştur
+            grouped_oee['Tarih'] = pd.to_datetime(grouped_oee['Tarih'])  # Tarih sütununu datetime'a çevir
+
+            dates = grouped_oee['Tarih']
+            # İşlenmiş OEE değeri varsa onu kullan, yoksa ham OEE değerini kullan
+            oee_values = grouped_oee['OEE_Degeri_Processed'] if 'OEE_Degeri_Processed' in grouped_oee.columns else \
+                grouped_oee['OEE_Degeri']
+
+            line_color = '#1f77b4'  # Çizgi rengi
+
+            x_indices = np.arange(len(dates))  # X ekseni indeksleri
+            # OEE değerlerini çiz
+            ax.plot(x_indices, oee_values, marker='o', markersize=8, color=line_color, linewidth=2, label=name)
+            # Beyaz içi boş noktalarla çizgiyi vurgula
+            ax.plot(x_indices, oee_values, 'o', markersize=6, color='white', markeredgecolor=line_color,
+                    markeredgewidth=1.5, zorder=5)
+
+            # Sayfa modunda ve 'OEE_Degeri_Half' sütunu varsa çift vardiya OEE'sini çiz
+            if graph_mode == "page" and 'OEE_Degeri_Half' in grouped_oee.columns:
+                half_oee_values = grouped_oee['OEE_Degeri_Half']
+
+                month_name_for_half_oee = ""
+                if not dates.empty:
+                    first_date_in_data = dates.min()
+                    month_name_for_half_oee = MONTH_NAMES_TR.get(first_date_in_data.month,
+                                                                 first_date_in_data.strftime('%B')).capitalize()
+                else:
+                    month_name_for_half_oee = datetime.date.today().strftime('%B').capitalize()
+
+                average_half_oee = half_oee_values.mean() if not half_oee_values.empty else 0.0
+
+                half_oee_label = f"{month_name_for_half_oee} Ayı Çift Vardiya Durumunda OEE ({average_half_oee * 100:.1f}%)"
+
+                ax.plot(x_indices, half_oee_values, color='#ADD8E6', linestyle='--', linewidth=1.5,
+                        label=half_oee_label)
+                ax.plot(x_indices, half_oee_values, 'o', markersize=6, markerfacecolor='#ADD8E6',
+                        markeredgecolor='#ADD8E6', markeredgewidth=1.5, zorder=6)
+
+                if not half_oee_values.empty and len(x_indices) > 0:
+                    last_x_index = x_indices[-1]
+                    ax.annotate(f'{average_half_oee * 100:.1f}%', (last_x_index, half_oee_values.iloc[-1]),
+                                textcoords="offset points", xytext=(5, -5), ha='left', va='center',
+                                fontsize=9, fontweight='bold', color='#ADD8E6')
+
+            # Her OEE noktasına değerini etiket olarak ekle
+            for i, (x, y) in enumerate(zip(x_indices, oee_values)):
+                if pd.notna(y) and y > 0:
+                    ax.annotate(f'{y * 100:.1f}%', (x, y), textcoords="offset points", xytext=(0, 10), ha='center',
+                                fontsize=8, fontweight='bold')
+
+            overall_calculated_average = np.mean(oee_values) if not oee_values.empty else 0
+
+            # Önceki yıl OEE çizgisi
+            if prev_year_oee is not None:
+                y_val = prev_year_oee / 100
+                ax.axhline(y_val, color='red', linestyle='--', linewidth=1.5,
+                           label=f'Önceki Yıl OEE ({prev_year_oee:.1f}%)')
+                ax.text(1.01, y_val, f'{prev_year_oee:.1f}%',
+                        transform=ax.transAxes, color='red', va='center', ha='left', fontsize=9, fontweight='bold')
+
+            # Önceki ay OEE çizgisi
+            if prev_month_oee is not None:
+                y_val = prev_month_oee / 100
+                ax.axhline(y_val, color='orange', linestyle='--', linewidth=1.5,
+                           label=f'Önceki Ay OEE ({prev_month_oee:.1f}%)')
+                ax.text(1.01, y_val, f'{prev_month_oee:.1f}%',
+                        transform=ax.transAxes, color='orange', va='center', ha='left', fontsize=9, fontweight='bold')
+
+            # Bu ayın ortalama OEE çizgisi
+            if overall_calculated_average > 0:
+                y_val = overall_calculated_average
+                month_name = ""
+                if not dates.empty:
+                    first_date_in_data = dates.min()
+                    month_name = MONTH_NAMES_TR.get(first_date_in_data.month,
+                                                    first_date_in_data.strftime('%B')).capitalize()
+                else:
+                    month_name = datetime.date.today().strftime('%B').capitalize()
+
+                ax.axhline(y_val, color='purple', linestyle='--', linewidth=1.5,
+                           label=f'{month_name} OEE ({overall_calculated_average * 100:.1f}%)')
+                ax.text(1.01, y_val, f'{overall_calculated_average * 100:.1f}%',
+                        transform=ax.transAxes, color='purple', va='center', ha='left', fontsize=9, fontweight='bold')
+
+            # X ekseni etiketlerini ayarla
+            ax.set_xticks(x_indices)
+            ax.set_xticklabels([d.strftime('%d.%m.%Y') for d in dates])
+            fig.autofmt_xdate(rotation=45)  # Tarih etiketlerini otomatik döndür
+
+            # Y eksenini yüzde olarak formatla
+            ax.yaxis.set_major_formatter(PercentFormatter(xmax=1, decimals=0))
+            ax.set_yticks(np.arange(0.0, 1.001, 0.25))  # Y ekseni tick'lerini ayarla
+            ax.set_ylim(bottom=-0.05, top=1.05)  # Y ekseni limitlerini ayarla
+
+            ax.set_xlabel("Tarih", fontsize=12, fontweight='bold')  # X ekseni etiketi
+            ax.set_ylabel("OEE (%)", fontsize=12, fontweight='bold')  # Y ekseni etiketi
+
+            # Başlık için ay ismini al
+            month_name = ""
+            if not dates.empty:
+                first_date_in_data = dates.min()
+                month_name = MONTH_NAMES_TR.get(first_date_in_data.month,
+                                                first_date_in_data.strftime('%B')).capitalize()
+            else:
+                month_name = datetime.date.today().strftime('%B').capitalize()
+
+            # Grafik başlığını ayarla
+            if graph_mode == "page":
+                cleaned_name = name.replace('_', ' ').replace('-', ' ')
+                if cleaned_name.endswith("OEE"):
+                    cleaned_name = cleaned_name.rsplit(' ', 1)[0]
+                chart_title = f"{month_name} {cleaned_name} OEE"
+            else:
+                chart_title = f"{name} {month_name} OEE"
+
+            ax.set_title(chart_title, fontsize=24, color='#2c3e50', fontweight='bold')
+
+            ax.legend(loc='upper left', bbox_to_anchor=(1.02, 0), fontsize=10)  # Lejantı ayarla
+            fig.subplots_adjust(right=0.60)  # Lejant için sağda boşluk bırak
+
+        elif graph_type == "Dizgi Onay Dağılım Grafiği":
+            labels = [d["label"] for d in data_container]  # Etiketleri al
+            values = [d["value"] for d in data_container]  # Değerleri al
+
+            # Pasta dilimi renkleri (hat/diğer hatlar; tüm hatlar grafiğinde günlük grafiklerdeki gibi
+            # tab20 paletinden hat başına bir renk)
+            if name == ALL_HATS_CHART_NAME:
+                colors_palette = matplotlib.colormaps.get_cmap('tab20')
+                colors = [colors_palette(i % 20) for i in range(len(values))]
+            else:
+                colors = ['#00008B', '#ff7f0e']
+
+            total_sum = sum(values)  # Toplam değeri hesapla
+
+            # Pasta dilimi yüzdesini ve süresini formatlayan fonksiyon
+            def func(pct, allvals):
+                absolute = int(np.round(pct / 100. * total_sum))
+                hours = absolute // 3600
+                minutes = (absolute % 3600) // 60
+                seconds = absolute % 60
+                return f"{hours:02d}:{minutes:02d}:{seconds:02d}; {pct:.0f}%"
+
+            # Pasta grafiğini çiz
+            wedges, texts, autotexts = ax.pie(
+                values,
+                autopct=lambda pct: func(pct, values),  # Otomatik yüzde formatı
+                startangle=90,  # Başlangıç açısı
+                colors=colors,  # Renkler
+                wedgeprops=dict(edgecolor='black', linewidth=1.5)  # Dilim özellikleri
+            )
+
+            # Otomatik metin etiketlerini ayarla
+            for autotext in autotexts:
+                autotext.set_color('white')
+                autotext.set_fontsize(14)
+                autotext.set_fontweight('bold')
+
+            ax.axis('equal')  # Pasta grafiğini daire şeklinde tut
+
+            # Lejantı ayarla
+            ax.legend(wedges, labels,
+                      title="Hatlar",
+                      loc="upper right",
+                      bbox_to_anchor=(1.2, 1),
+                      fontsize=10,
+                      title_fontsize=12)
+
+            chart_title = "Dizgi Onay Dağılımı"
+            if name == ALL_HATS_CHART_NAME:
+                chart_title = "Dizgi Onay Dağılımı (Tüm Hatlar)"
+            ax.set_title(chart_title, fontsize=24, color='#2c3e50', fontweight='bold')  # Grafik başlığı
+            fig.tight_layout()  # Düzeni sıkılaştır
+
+        elif graph_type == "Dizgi Duruş Grafiği":
+            metric_sums_dict = data_container["metrics"]  # Metrik toplamlarını al
+            total_overall_sum = data_container["total_overall_sum"]  # Genel toplamı al
+            cumulative_percentages_dict = data_container["cumulative_percentages"]  # Kümülatif yüzdeleri al
+            threshold = data_container.get("threshold", PARETO_THRESHOLD_PERCENT)  # Pareto eşiği (%)
+
+            metric_sums = pd.Series(metric_sums_dict)  # Metrik toplamlarını Series'e çevir
+            cumulative_percentage = pd.Series(cumulative_percentages_dict)  # Kümülatif yüzdeleri Series'e çevir
+
+            ax2 = ax.twinx()  # İkinci bir y ekseni oluştur
+
+            bar_color = '#AECDCB'  # Çubuk rengi
+            line_color = '#6B0000'  # Çizgi rengi
+
+            # Çubuk grafiğini çiz (süreleri dakikaya çevirerek)
+            bars = ax.bar(metric_sums.index, metric_sums.values / 60, color=bar_color, alpha=0.8, edgecolor='black',
+                          linewidth=1.5)
+
+            # Kümülatif yüzde çizgisini çiz
+            ax2.plot(metric_sums.index, cumulative_percentage, color=line_color, linestyle='-', linewidth=2, zorder=1)
+            # Kümülatif yüzde noktalarını çiz
+            ax2.plot(metric_sums.index, cumulative_percentage, 'o', markersize=8, markerfacecolor='white',
+                     markeredgecolor=line_color, markeredgewidth=2, zorder=2)
+
+            x_min_data, x_max_data = ax.get_xlim()
+
+            # Pareto eşiği çizgisini ekle
+            normalized_xmin = (0 - x_min_data) / (x_max_data - x_min_data)
+            normalized_xmax = (len(metric_sums.index) - 1 - x_min_data) / (x_max_data - x_min_data)
+            ax2.axhline(threshold, color='#B0B0B0', linestyle='--', linewidth=1.5, xmin=normalized_xmin, xmax=normalized_xmax)
+
+            ax.grid(False)  # Izgarayı gizle
+            ax2.grid(False)  # İkinci eksenin ızgarasını gizle
+
+            ax.set_xlabel("")  # X ekseni etiketini boş bırak
+
+            ax.set_xticks(np.arange(len(metric_sums.index)))  # X ekseni tick'lerini ayarla
+            # X ekseni etiketlerinin çakışmasını önlemek için döndürme ve hizalama ayarları
+            ax.set_xticklabels(metric_sums.index, fontsize=10, fontweight='bold', rotation=60, ha='right')
+
+            # --- DÜZELTME: text_label'ı tanımla ve açıklama mantığını geliştir ---
+            # Her çubuğa süre ve yüzde etiketleri ekle
+            for i, bar in enumerate(bars):
+                value_seconds = metric_sums.values[i]
+                percentage = (value_seconds / total_overall_sum) * 100 if total_overall_sum > 0 else 0
+                duration_hours = int(value_seconds // 3600)
+                duration_minutes = int((value_seconds % 3600) // 60)
+                duration_seconds = int(value_seconds % 60)
+
+                # Metin etiketini formatla
+                text_label = f"{duration_hours:02d}:{duration_minutes:02d}:{duration_seconds:02d}\n({percentage:.1f}%)"
+
+                # Metin etiketleri için dikey ofset hesapla
+                # Tutarlılık için sabit bir ofset kullanın veya çubuk yüksekliğine göre ayarlayın
+                # Küçük bir mutlak ofset (örn. 5 nokta) yüzde olarak ayarlamaktan daha güvenilir olabilir
+                text_offset_points = 10  # Etiketler çubuklara çok yakınsa bu değeri artırın
+
+                ax.annotate(text_label,
+                            (bar.get_x() + bar.get_width() / 2, bar.get_height()),  # Çubuğun üstünde konumlandır
+                            textcoords="offset points",  # Konumdan ofset
+                            xytext=(0, text_offset_points),  # (x_ofset, y_ofset)
+                            ha='center', va='bottom',  # Yatay ve dikey hizalama
+                            fontsize=9, fontweight='bold', color='black')  # Okunabilirlik için ayarlanmış yazı tipi boyutu
+
+            # Çizgi üzerindeki kümülatif yüzde etiketlerini ekle
+            for i, (x, y) in enumerate(zip(metric_sums.index, cumulative_percentage)):
+                ax2.annotate(f'{y:.1f}%', (x, y),
+                             textcoords="offset points", xytext=(0, -15),  # Noktanın altında ofset
+                             ha='center', va='top', fontsize=9, color=line_color, fontweight='bold')
+            # --- DÜZELTME SONU ---
+
+            ax.set_ylabel("Süre (Dakika)", fontsize=12, fontweight='bold', color=bar_color)  # Birincil y ekseni etiketi
+            ax2.set_ylabel("Kümülatif Yüzde (%)", fontsize=12, fontweight='bold', color=line_color)  # İkincil y ekseni etiketi
+
+            is_general_pareto = name == GENERAL_PARETO_CHART_NAME
+            chart_title = "Genel Dizgi Duruş Pareto Analizi" if is_general_pareto else "Dizgi Duruş Pareto Analizi"
+            # Tarih aralığına göre başlığı güncelle
+            if source_dates is not None and not source_dates.empty:
+                df_dates = pd.to_datetime(source_dates, errors='coerce').dropna()
+                if not df_dates.empty:
+                    min_date = df_dates.min()
+                    max_date = df_dates.max()
+                    if min_date.month == max_date.month and min_date.year == max_date.year:
+                        month_name = MONTH_NAMES_TR.get(min_date.month, min_date.strftime('%B')).capitalize()
+                        chart_title = f"{month_name} Ayı Dizgi Duruşları"
+                    elif min_date.year == max_date.year:
+                        first_month_name = MONTH_NAMES_TR.get(min_date.month, min_date.strftime('%B')).capitalize()
+                        last_month_name = MONTH_NAMES_TR.get(max_date.month, max_date.strftime('%B')).capitalize()
+                        chart_title = f"{min_date.year} Yılı {first_month_name}-{last_month_name} Ayları Dizgi Duruşları"
+                    else:
+                        chart_title = f"{min_date.year}-{max_date.year} Yılları Dizgi Duruşları"
+            if not is_general_pareto:
+                chart_title = f"{name.removesuffix(' Dizgi Duruş')} {chart_title}"  # Hat Pareto'su
+
+            ax.set_title(chart_title, fontsize=24, color='#363636', fontweight='bold')
+
+            ax.set_ylim(bottom=0)  # Birincil y ekseni alt limiti
+            ax2.set_ylim(0, 100)  # İkincil y ekseni limitleri
+
+            ax.spines['top'].set_visible(False)
+            ax2.spines['top'].set_visible(False)
+
+            fig.tight_layout()  # Düzeni sıkılaştır
@@ -0,0 +1,337 @@
+import json
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+import pandas as pd
+
+from config.constants import HISTORY_STORE_DIR, LINE_GROUP_COLUMN, SHEET_OEE_COLUMNS
+from utils.helpers import (COMPACT_TABLE_ATTR, excel_index_to_col, line_group_keys, oee_fraction_series,
+                           sheet_column_indices, sheet_column_name)
+
+try:  # pyarrow isteğe bağlıdır; yoksa geçmiş deposu devre dışı kalır
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - ortamına göre değişir
+    pa = None
+    pc = None
+    feather = None
+
+MANIFEST_NAME = "manifest.json"
+HEADERS_NAME = "basliklar.json"  # Sayfa adı -> Excel harfi -> son eklenen çalışma kitabındaki sütun başlığı
+ROLLUP_DIR_NAME = "ozetler"  # Aylık OEE özetlerinin dizini (ay bölümlerinden ayrı tutulur)
+WHOLE_SHEET_GROUP = "*"  # Sayfanın tamamına ait özet satırlarının grup adı (hatlar "HAT-<n>")
+ROLLUP_COLUMNS = ["group", "month", "oee_sum", "days"]
+
+
+class HistoryStore:
+    """
+    Açılan çalışma kitaplarının kompakt sayfa satırlarını (tarih, ürün/hat, süre saniyeleri, OEE) yerel bir
+    dizinde sayfa ve ay bazında bölümlenmiş Feather dosyalarında biriktiren geçmiş deposu.
+
+    Her ay için bir dosya yazılır (<sayfa>/<YYYY-AA>.feather). Dosyalar sıkıştırılmadan yazıldığı için
+    okunurken belleğe eşlenir (memory map); çok aylık sorgular Excel dosyalarını yeniden ayrıştırmadan ve
+    veri kopyalanmadan yüklenir. Sütun adları çalışma kitabındaki başlıklar yerine Excel harfleridir
+    (A, B, H..BD, BP); böylece başlıkları farklı yazılmış aylar aynı tabloda birleşir ve sheet_column_name
+    gibi konuma dayalı yardımcılar tam sütunlu sorgularda aynen çalışır. Her sayfanın son eklenen başlıkları
+    basliklar.json'da tutulur ve load_sheet okurken sütunlara geri verilir.
+
+    Aynı tarih başka bir çalışma kitabından tekrar gelirse o tarihin eski satırları yenileriyle değiştirilir;
+    aynı dosya (yol, mtime, boyut) ikinci kez işlenmez. Yazma hataları yalnızca loglanır.
+
+    Değişen her ay için sayfa ve hat bazında aylık OEE özeti (günlük ortalamaların toplamı ve gün sayısı)
+    yeniden hesaplanıp ozetler/<sayfa>.feather dosyasında tutulur; önceki ay/yıl OEE referansları
+    (reference_oee) satırlara dönmeden bu özetlerden okunur.
+    pyarrow kurulu değilse tüm işlemler sessizce atlanır.
+
+    Not: Belleğe eşlenmiş bir bölüm okunurken (ör. Windows'ta) aynı bölüm değiştirilemezse işlem loglanır
+    ve dosya bir sonraki açılışta tekrar işlenir.
+    """
+
+    def __init__(self, root: Path = HISTORY_STORE_DIR) -> None:
+        self.root = Path(root)
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Geçmiş deposunun kullanılabilir olup olmadığı (pyarrow kurulu mu)."""
+        return feather is not None
+
+    @staticmethod
+    def source_key(path: Path | str) -> str:
+        """Kaynak dosyanın güncel durumunu (yol, mtime, boyut) tek bir metinde toplar."""
+        resolved = Path(path).resolve()
+        stat = resolved.stat()
+        return f"{resolved}|{stat.st_mtime_ns}|{stat.st_size}"
+
+    def _sheet_dir(self, sheet_name: str) -> Path:
+        return self.root / re.sub(r"[^\w\-]", "_", sheet_name)
+
+    def _read_manifest(self) -> Dict[str, List[str]]:
+        """Sayfa adı -> işlenmiş kaynak anahtarları; dosya yoksa veya bozuksa boş sözlük."""
+        try:
+            with open(self.root / MANIFEST_NAME, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self, manifest: Dict[str, List[str]]) -> None:
+        tmp_path = self.root / (MANIFEST_NAME + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.root / MANIFEST_NAME)
+
+    def _read_headers(self) -> Dict[str, Dict[str, str]]:
+        """Sayfa adı -> {Excel harfi: sütun başlığı}; dosya yoksa veya bozuksa boş sözlük."""
+        try:
+            with open(self.root / HEADERS_NAME, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_headers(self, sheet_name: str, headers: Dict[str, str]) -> None:
+        all_headers = self._read_headers()
+        all_headers[sheet_name] = headers
+        tmp_path = self.root / (HEADERS_NAME + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(all_headers, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.root / HEADERS_NAME)
+
+    def is_ingested(self, path: Path | str, sheet_name: str) -> bool:
+        """Dosyanın bu sayfası (mevcut haliyle) depoya daha önce işlendiyse True döner."""
+        return self.source_key(path) in self._read_manifest().get(sheet_name, [])
+
+    @staticmethod
+    def _to_history_frame(df: pd.DataFrame, sheet_name: str) -> pd.DataFrame | None:
+        """
+        Kompakt sayfayı (compact_sheet) Excel harfli sütunlara çevirir ve tarihi boş satırları atar.
+        Sütun yerleşimi tanımsız sayfalar ve tarihi datetime64 olmayan sayfalar için None döner.
+        """
+        layout = sheet_column_indices(sheet_name)
+        if layout is None or df.empty or not pd.api.types.is_datetime64_any_dtype(df.iloc[:, 0].dtype):
+            return None
+        df = df.drop(columns=LINE_GROUP_COLUMN, errors="ignore")  # Hat anahtarı bir Excel sütunu değildir
+        letters = [excel_index_to_col(i) for i in layout[:len(df.columns)]]
+        frame = df.iloc[:, :len(letters)].set_axis(letters, axis=1)
+        return frame[frame["A"].notna()]
+
+    def ingest(self, path: Path | str, sheet_name: str, df: pd.DataFrame) -> int:
+        """
+        Sayfanın satırlarını ay bölümlerine ekler; aynı tarihlerin eski satırları değiştirilir.
+
+        Returns:
+            Depoya yazılan satır sayısı (dosya daha önce işlendiyse veya yazılamadıysa 0).
+        """
+        if not self.enabled:
+            return 0
+        try:
+            key = self.source_key(path)
+            with self._lock:
+                manifest = self._read_manifest()
+                if key in manifest.get(sheet_name, []):
+                    return 0
+                frame = self._to_history_frame(df, sheet_name)
+                if frame is None:
+                    return 0
+
+                sheet_dir = self._sheet_dir(sheet_name)
+                sheet_dir.mkdir(parents=True, exist_ok=True)
+                days = frame["A"].dt.normalize()
+                rollups = []
+                for month, rows in frame.groupby(days.dt.strftime("%Y-%m"), sort=True):
+                    partition_rows = self._write_partition(sheet_dir / f"{month}.feather", rows)
+                    rollups.append(self._month_rollup(sheet_name, month, partition_rows))
+                self._write_rollups(sheet_name, rollups)
+                # Başlıklar yalnızca okunurken gösterim için geri yüklenir (load_sheet); bölümler harfli kalır
+                self._write_headers(sheet_name, dict(zip(frame.columns, map(str, df.columns))))
+
+                # Aynı dosyanın eski sürümlerine ait anahtarlar atılır (manifest dosya sayısıyla sınırlı)
+                source_path = key.rsplit("|", 2)[0]
+                manifest[sheet_name] = [k for k in manifest.get(sheet_name, [])
+                                        if k.rsplit("|", 2)[0] != source_path] + [key]
+                self._write_manifest(manifest)
+            logging.info("'%s' sayfasından %d satır geçmiş deposuna eklendi (%s).",
+                         sheet_name, len(frame), Path(path).name)
+            return len(frame)
+        except Exception as e:
+            logging.warning("Geçmiş deposuna yazılamadı (%s / %s): %s", Path(path).name, sheet_name, e)
+            return 0
+
+    @staticmethod
+    def _write_partition(partition: Path, rows: pd.DataFrame) -> pd.DataFrame:
+        """
+        Bir ayın satırlarını bölüm dosyasındaki aynı tarihli satırların yerine yazar (atomik) ve
+        bölümün yeni içeriğini döndürür.
+        """
+        if partition.exists():
+            # Eski bölüm belleğe eşlenmeden okunur; dosya açık kalmadığı için hemen değiştirilebilir
+            existing = feather.read_feather(partition, memory_map=False)
+            existing = existing[~existing["A"].dt.normalize().isin(rows["A"].dt.normalize().unique())]
+            columns = list(dict.fromkeys([*existing.columns, *rows.columns]))
+            rows = pd.concat([existing, rows], ignore_index=True).reindex(columns=columns)
+            if "B" in rows.columns:
+                rows["B"] = rows["B"].astype("category")  # Farklı kategorili parçalar object'e dönmüş olabilir
+        rows = rows.sort_values("A", kind="stable").reset_index(drop=True)
+        tmp_path = partition.with_suffix(".tmp")
+        # Sıkıştırılmamış Feather: okurken doğrudan belleğe eşlenebilir
+        feather.write_feather(rows, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, partition)
+        return rows
+
+    @staticmethod
+    def _month_rollup(sheet_name: str, month: str, rows: pd.DataFrame) -> pd.DataFrame:
+        """
+        Bir ayın satırlarından sayfa ve hat bazında OEE özetini çıkarır. Günlük ortalamalar aylık grafiklerle
+        aynı kurallarla hesaplanır (boş ve "ÜRETİM YAPILMADI" hücreleri 0); özet, günlük ortalamaların
+        toplamı ve gün sayısıdır, böylece aylar toplanarak yıllık ortalama da bulunur.
+        """
+        oee_letter = SHEET_OEE_COLUMNS.get(sheet_name)
+        if oee_letter is None or oee_letter not in rows.columns:
+            return pd.DataFrame(columns=ROLLUP_COLUMNS)
+        oee = oee_fraction_series(rows[oee_letter], compact=True)  # Bölümler kompakt sayfalardan yazılır
+        days = rows["A"].dt.normalize()
+        daily = oee.groupby(days).mean()
+        records = [(WHOLE_SHEET_GROUP, month, float(daily.sum()), len(daily))]
+        if "B" in rows.columns:
+            hats = line_group_keys(rows["B"])
+            has_hat = hats.notna().to_numpy()
+            hat_daily = oee[has_hat].groupby([hats[has_hat].astype(str), days[has_hat]]).mean()
+            per_hat = hat_daily.groupby(level=0).agg(["sum", "count"])
+            records += [(hat, month, float(row["sum"]), int(row["count"])) for hat, row in per_hat.iterrows()]
+        return pd.DataFrame(records, columns=ROLLUP_COLUMNS)
+
+    def _rollup_path(self, sheet_name: str) -> Path:
+        return self.root / ROLLUP_DIR_NAME / f"{self._sheet_dir(sheet_name).name}.feather"
+
+    def _write_rollups(self, sheet_name: str, rollups: List[pd.DataFrame]) -> None:
+        """Güncellenen ayların özet satırlarını sayfanın özet dosyasındaki eski satırların yerine yazar."""
+        if not rollups:
+            return
+        updated = pd.concat(rollups, ignore_index=True)
+        rollup_path = self._rollup_path(sheet_name)
+        if rollup_path.exists():
+            existing = feather.read_feather(rollup_path, memory_map=False)
+            existing = existing[~existing["month"].isin(updated["month"])]
+            updated = pd.concat([existing, updated], ignore_index=True)
+        rollup_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = rollup_path.with_suffix(".tmp")
+        feather.write_feather(updated.sort_values(["month", "group"]).reset_index(drop=True), tmp_path)
+        os.replace(tmp_path, rollup_path)
+
+    def rollup(self, sheet_name: str) -> pd.DataFrame | None:
+        """
+        Sayfanın aylık OEE özetleri (group, month, oee_sum, days); depoda sayfa yoksa None.
+        Özet dosyası yoksa (ör. özetlerden önce oluşturulmuş depo) ay bölümlerinden bir kez oluşturulur.
+        """
+        if not self.enabled:
+            return None
+        rollup_path = self._rollup_path(sheet_name)
+        with self._lock:
+            if not rollup_path.exists():
+                months = self.months(sheet_name)
+                if not months:
+                    return None
+                sheet_dir = self._sheet_dir(sheet_name)
+                self._write_rollups(sheet_name, [
+                    self._month_rollup(sheet_name, month,
+                                       feather.read_feather(sheet_dir / f"{month}.feather", memory_map=False))
+                    for month in months
+                ])
+            return feather.read_feather(rollup_path, memory_map=False)
+
+    def reference_oee(self, sheet_name: str, group: str, month: str) -> Tuple[float | None, float | None]:
+        """
+        Verilen aydan ("YYYY-AA") önceki takvim yılının ve önceki ayın ortalama OEE değerlerini (yüzde)
+        döndürür. group bir hat ("HAT-<n>") ya da sayfanın tamamı için WHOLE_SHEET_GROUP'tur.
+        Geçmişte verisi olmayan değerler None olur.
+        """
+        rollup = self.rollup(sheet_name)
+        if rollup is None:
+            return None, None
+        rows = rollup[rollup["group"] == group]
+        period = pd.Period(month, freq="M")
+        prev_year_rows = rows[rows["month"].str.startswith(f"{period.year - 1}-")]
+        prev_month_rows = rows[rows["month"] == str(period - 1)]
+        return self._average_percent(prev_year_rows), self._average_percent(prev_month_rows)
+
+    @staticmethod
+    def _average_percent(rows: pd.DataFrame) -> float | None:
+        """Özet satırlarındaki günlük ortalamaların ortalaması (yüzde, iki basamak); gün yoksa None."""
+        days = rows["days"].sum()
+        return round(float(rows["oee_sum"].sum()) / days * 100, 2) if days else None
+
+    def months(self, sheet_name: str) -> List[str]:
+        """Depoda bulunan ayları ("YYYY-AA") sıralı olarak döndürür."""
+        sheet_dir = self._sheet_dir(sheet_name)
+        return sorted(p.stem for p in sheet_dir.glob("*.feather")) if sheet_dir.is_dir() else []
+
+    def load_table(self, sheet_name: str, start: pd.Timestamp | None = None, end: pd.Timestamp | None = None,
+                   columns: Sequence[str] | None = None) -> "pa.Table | None":
+        """
+        [start, end] (uçlar dahil) aralığına düşen ay bölümlerini belleğe eşleyerek tek bir Arrow tablosu
+        olarak döndürür. Aralık verilmezse tablo veri kopyalanmadan oluşturulur; aralık verilirse yalnızca
+        kenar aylardaki satırlar süzülür. Depoda veri yoksa None döner.
+
+        Args:
+            columns: Okunacak Excel harfli sütunlar (ör. ["A", "B", "BP"]); None ise tümü.
+        """
+        if not self.enabled:
+            return None
+        first_month = start.strftime("%Y-%m") if start is not None else ""
+        last_month = end.strftime("%Y-%m") if end is not None else "9999-99"
+        read_columns = None if columns is None else list(dict.fromkeys(["A", *columns]))
+        tables = []
+        for month in self.months(sheet_name):
+            if not first_month <= month <= last_month:
+                continue
+            table = feather.read_table(self._sheet_dir(sheet_name) / f"{month}.feather", columns=read_columns,
+                                       memory_map=True)
+            if month in (first_month, last_month):
+                # Yalnızca aralığın kenarındaki aylar satır bazında süzülür (ara aylar kopyalanmaz)
+                table = table.filter(self._date_mask(table.column("A"), start, end))
+            tables.append(table)
+        if not tables:
+            return None
+        table = pa.concat_tables(tables, promote_options="default")
+        return table.select(list(columns)) if columns is not None else table
+
+    @staticmethod
+    def _date_mask(dates: "pa.ChunkedArray", start: pd.Timestamp | None, end: pd.Timestamp | None):
+        """Tarihleri [start, end] aralığında olan satırlar için Arrow boolean maskesi."""
+        mask = pc.greater_equal(dates, pa.scalar(start, type=dates.type)) if start is not None else None
+        if end is not None:
+            before_end = pc.less_equal(dates, pa.scalar(end, type=dates.type))
+            mask = before_end if mask is None else pc.and_(mask, before_end)
+        return mask
+
+    def load(self, sheet_name: str, start: pd.Timestamp | None = None, end: pd.Timestamp | None = None,
+             columns: Sequence[str] | None = None) -> pd.DataFrame | None:
+        """load_table sonucunu DataFrame olarak döndürür (sayısal sütunlar mümkün olduğunca kopyalanmaz)."""
+        table = self.load_table(sheet_name, start, end, columns)
+        return table.to_pandas(split_blocks=True) if table is not None else None
+
+    def load_sheet(self, sheet_name: str, start: pd.Timestamp | None = None,
+                   end: pd.Timestamp | None = None) -> pd.DataFrame | None:
+        """
+        [start, end] aralığındaki satırları kompakt sayfa biçiminde (compact_sheet) döndürür: hat anahtarı
+        sütunu (LINE_GROUP_COLUMN) yeniden eklenir ve OEE oranları is_compact_oee için işaretlenir. Sütun adları
+        Harfli sütunlar sayfanın son eklenen çalışma kitabındaki başlıklarıyla yeniden adlandırılır (ör. Dizgi
+        Duruş çubuk etiketleri); sütun sırası korunduğu için detect_sheet_columns ve aylık grafik hesapları
+        aynen kullanılabilir. Depoda veri yoksa None döner.
+        """
+        df = self.load(sheet_name, start, end)
+        if df is None:
+            return None
+        headers = self._read_headers().get(sheet_name, {})
+        names = [headers.get(letter, letter) for letter in df.columns]
+        if len(set(names)) == len(names):
+            df.columns = names
+        product_col = sheet_column_name(df, sheet_name, "B")
+        if product_col:
+            df[LINE_GROUP_COLUMN] = line_group_keys(df[product_col])
+        df.attrs[COMPACT_TABLE_ATTR] = True
+        return df
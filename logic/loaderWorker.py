@@ -0,0 +1,97 @@
+import logging
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from logic.dailyCube import DailyAggregateCube
+from utils.helpers import detect_sheet_columns
+
+
+class LoadCancelled(Exception):
+    """Kullanıcı yüklemeyi iptal ettiğinde okuma döngüsünü sonlandırmak için fırlatılır."""
+
+
+class LoaderWorker(QThread):
+    """
+    Çalışma kitabındaki sayfaları arka planda akışlı okuyup önbelleğe alan iş parçacığı.
+    Okuma ilerlemesini satır bazında yayınlar. cube_sheets'teki sayfaların günlük toplam küpleri de
+    burada (GUI iş parçacığı dışında) oluşturulur; add_to_history verilirse yüklenen sayfalar geçmiş
+    deposuna eklenir. cancel() çağrıldığında bir sonraki parçada durur.
+    """
+
+    finished = pyqtSignal(object, object)  # Sayfa adı -> DataFrame sözlüğü, sayfa adı -> küp (veya None) sözlüğü
+    progress = pyqtSignal(int)  # Yüzdelik ilerleme
+    rows_loaded = pyqtSignal(str, int, int)  # Sayfa adı, okunan satır, tahmini toplam satır
+    error = pyqtSignal(str)  # Hata mesajı
+    cancelled = pyqtSignal()  # Yükleme kullanıcı tarafından iptal edildi
+
+    def __init__(self, workbook_cache: "WorkbookCache", excel_path: Path, sheet_names: List[str],
+                 excel_file: pd.ExcelFile | None = None, cube_sheets: List[str] | None = None,
+                 add_to_history: bool = False) -> None:
+        super().__init__()
+        self.workbook_cache = workbook_cache
+        self.excel_path = excel_path
+        self.sheet_names = sheet_names
+        self.excel_file = excel_file  # Verilirse kullanılır ve iş bitince kapatılır
+        self.cube_sheets = cube_sheets or []  # Günlük toplam küpü oluşturulacak sayfalar
+        self.add_to_history = add_to_history  # Yüklenen sayfalar geçmiş deposuna eklensin mi
+        self._cancel_requested = False
+
+    def cancel(self) -> None:
+        """Yüklemenin iptalini ister; okuma bir sonraki parçada durur."""
+        self._cancel_requested = True
+
+    def _on_chunk(self, sheet_name: str, chunk: pd.DataFrame, rows_done: int, rows_total: int) -> None:
+        """WorkbookCache'ten gelen her parça için ilerleme sinyallerini yayınlar."""
+        if self._cancel_requested:
+            raise LoadCancelled()
+        self.rows_loaded.emit(sheet_name, rows_done, rows_total)
+        sheet_fraction = min(rows_done / rows_total, 1.0) if rows_total else 1.0
+        sheet_index = self.sheet_names.index(sheet_name) if sheet_name in self.sheet_names else 0
+        self.progress.emit(int((sheet_index + sheet_fraction) / len(self.sheet_names) * 100))
+
+    def _build_cubes(self, loaded: Dict[str, pd.DataFrame]) -> Dict[str, DailyAggregateCube | None]:
+        """
+        Yüklenen sayfalardan istenenlerin günlük toplam küplerini oluşturur. Küp oluşturulamayan
+        sayfalar None alır; günlük grafikler o sayfada ham satırlardan (GraphWorker) hesaplanır.
+        """
+        cubes: Dict[str, DailyAggregateCube | None] = {}
+        for sheet_name in self.cube_sheets:
+            if sheet_name not in loaded:
+                continue
+            if self._cancel_requested:
+                raise LoadCancelled()
+            df = loaded[sheet_name]
+            grouping_col_name, grouped_col_name, oee_col_name, metric_cols = detect_sheet_columns(df, sheet_name)
+            cubes[sheet_name] = None
+            if not grouping_col_name or not grouped_col_name:
+                continue
+            try:
+                cubes[sheet_name] = DailyAggregateCube.from_frame(df, grouping_col_name, grouped_col_name,
+                                                                  metric_cols, oee_col_name)
+            except Exception:
+                logging.exception("'%s' sayfasının günlük toplam küpü oluşturulamadı.", sheet_name)
+        return cubes
+
+    def run(self) -> None:
+        """Sayfaları önbelleğe yükler, istenen küpleri oluşturur ve ikisini birlikte yayınlar."""
+        try:
+            loaded = self.workbook_cache.load_sheets(self.excel_path, self.sheet_names, excel_file=self.excel_file,
+                                                     chunk_callback=self._on_chunk)
+            cubes = self._build_cubes(loaded)
+            if self.add_to_history:
+                rows = self.workbook_cache.add_to_history(self.excel_path, loaded)
+                logging.info("Geçmiş deposuna %d satır eklendi: %s", rows, self.excel_path)
+            self.progress.emit(100)
+            self.finished.emit(loaded, cubes)
+        except LoadCancelled:
+            logging.info("Dosya yükleme kullanıcı tarafından iptal edildi: %s", self.excel_path)
+            self.cancelled.emit()
+        except Exception as exc:
+            logging.exception("LoaderWorker hatası oluştu.")
+            self.error.emit(f"Dosya yüklenirken bir hata oluştu: {str(exc)}")
+        finally:
+            if self.excel_file is not None:
+                self.excel_file.close()
@@ -0,0 +1,403 @@
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from config.constants import (ALL_HATS_CHART_NAME, GENERAL_PARETO_CHART_NAME, LINE_GROUP_COLUMN, LINE_REGISTRY,
+                              PARETO_THRESHOLD_PERCENT)
+from logic.cancellation import CancellationToken, OperationCancelled, check_cancelled
+from logic.historyStore import WHOLE_SHEET_GROUP, HistoryStore
+from logic.workbookCache import WorkbookCache
+from utils.helpers import (SheetColumns, line_group_keys, oee_fraction_series, seconds_from_timedelta,
+                           seconds_matrix_from_durations, sheet_column_name, sheet_column_range)
+
+class MonthlyChartData(NamedTuple):
+    """Tek bir aylık grafiğin verisi (demet olarak da açılabilir: name, data)."""
+    name: str  # Hat veya sayfa adı
+    data: Union[List[Dict[str, Any]], Dict[str, Any]]  # GraphPlotter.create_monthly_chart'a verilen grafik verisi
+
+
+# Aylık grafik verisi: hat/sayfa başına bir MonthlyChartData
+FiguresData = List[MonthlyChartData]
+ProgressCallback = Callable[[int], None]
+# Hat/sayfa adı -> (önceki yıl OEE %, önceki ay OEE %)
+ReferenceOee = Dict[str, Tuple[float | None, float | None]]
+
+
+class MonthlyGraphError(Exception):
+    """Aylık grafik verisi üretilemediğinde kullanıcıya gösterilecek mesajla fırlatılır."""
+
+
+def _report(progress: ProgressCallback | None, value: int) -> None:
+    """İlerleme geri çağrısı verilmişse yüzdelik ilerlemeyi bildirir."""
+    if progress:
+        progress(value)
+
+
+def compute_pareto_data(metric_sums: pd.DataFrame,
+                        threshold: float = PARETO_THRESHOLD_PERCENT) -> Dict[str, Dict[str, Any]]:
+    """
+    Her satır (genel veya hat) için duruş sürelerinin Pareto verisini üretir. Satırlar grupları, sütunlar
+    duruş metriklerini, değerler saniyeyi gösterir. Süreler azalan sırada dizilir; kümülatif yüzdesi eşiğe
+    ilk ulaşan metrik dahil olmak üzere en büyük metrikler seçilir. Sıralama ve kesim noktası tüm satırlar
+    için birlikte hesaplanır.
+
+    Returns:
+        Satır adı -> GraphPlotter.create_monthly_chart'ın beklediği Pareto verisi
+        ("metrics", "total_overall_sum", "cumulative_percentages", "threshold").
+    """
+    values = metric_sums.to_numpy(dtype=np.float64)
+    metric_names = metric_sums.columns.to_numpy()
+    order = np.argsort(-values, axis=1, kind='stable')  # Her satırda büyükten küçüğe
+    sorted_values = np.take_along_axis(values, order, axis=1)
+    totals = values.sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cumulative_percentages = sorted_values.cumsum(axis=1) / totals[:, None] * 100
+    # Eşiğe ulaşan ilk metrik dahil edilir; sıfır süreli metrikler hiçbir zaman gösterilmez
+    cut_counts = np.minimum((cumulative_percentages < threshold).sum(axis=1) + 1, (sorted_values > 0).sum(axis=1))
+
+    pareto_data: Dict[str, Dict[str, Any]] = {}
+    for row, name in enumerate(metric_sums.index):
+        count = cut_counts[row]
+        selected = metric_names[order[row, :count]]
+        pareto_data[name] = {
+            "metrics": dict(zip(selected, sorted_values[row, :count])),
+            "total_overall_sum": totals[row],
+            "cumulative_percentages": dict(zip(selected, cumulative_percentages[row, :count])),
+            "threshold": threshold,
+        }
+    return pareto_data
+
+
+def compute_hat_figures_data(
+        current_df: pd.DataFrame,  # İşlenecek sayfa (genellikle SMD-OEE)
+        sheet_name: str,  # Sayfa adı (sütun harflerini çözmek için)
+        grouping_col_name: str,  # Tarih sütunu (A)
+        grouped_col_name: str,  # Ürün ağacı sütunu (B)
+        oee_col_name: str | None,  # OEE sütunu
+        graph_type: str,  # "OEE Grafikleri", "Dizgi Onay Dağılım Grafiği" veya "Dizgi Duruş Grafiği"
+        date_range: Tuple[pd.Timestamp, pd.Timestamp] | None = None,  # Yalnızca bu tarih aralığı (uçlar dahil)
+        progress: ProgressCallback | None = None,
+        cancel_token: CancellationToken | None = None,  # İptal istenirse OperationCancelled fırlatılır
+        pareto_threshold: float = PARETO_THRESHOLD_PERCENT  # Dizgi Duruş Pareto'sunun kümülatif yüzde eşiği
+) -> FiguresData:
+    """
+    Hat bazlı aylık grafik verilerini üretir (Qt'ye bağımlı değildir).
+
+    Raises:
+        MonthlyGraphError: Gerekli sütunlar veya hat verisi bulunamazsa.
+        OperationCancelled: cancel_token ile iptal istenirse (hat döngüsünde ve ağır adımlar arasında).
+    """
+    figures_data: FiguresData = []
+
+    # Dizgi Onay Dağılım Grafiği için sütun (T sütunu)
+    dizgi_onay_col_name = sheet_column_name(current_df, sheet_name, 'T')
+
+    # Dizgi Duruş Grafiği için metrik sütunları (H'den BD'ye kadar)
+    dizgi_durusu_metric_cols = sheet_column_range(current_df, sheet_name, 'H', 'BD')
+
+    # Yalnızca grafik türünün kullandığı sütunlar seçilir; aşağıdaki atamalar önbellekteki sayfayı değiştirmez
+    needed_cols = [grouping_col_name, grouped_col_name, LINE_GROUP_COLUMN]
+    if graph_type == "OEE Grafikleri":
+        needed_cols.append(oee_col_name)
+    elif graph_type == "Dizgi Onay Dağılım Grafiği":
+        needed_cols.append(dizgi_onay_col_name)
+    elif graph_type == "Dizgi Duruş Grafiği":
+        needed_cols.extend(dizgi_durusu_metric_cols)
+    df_to_process = current_df[[col for col in dict.fromkeys(needed_cols) if col and col in current_df.columns]]
+
+    # Sütunları dahili tutarlılık için yeniden adlandır
+    col_mapping = {}
+    if grouping_col_name in df_to_process.columns:
+        col_mapping[grouping_col_name] = 'Tarih'
+    if grouped_col_name in df_to_process.columns:
+        col_mapping[grouped_col_name] = 'U_Agaci_Sev'
+    if oee_col_name and oee_col_name in df_to_process.columns:
+        col_mapping[oee_col_name] = 'OEE_Degeri'
+    if LINE_GROUP_COLUMN in df_to_process.columns:
+        col_mapping[LINE_GROUP_COLUMN] = 'Group_Key'
+
+    # Sütun adları uygun değilse hata ver
+    if col_mapping:
+        df_to_process = df_to_process.rename(columns=col_mapping)
+    else:
+        raise MonthlyGraphError("Gerekli sütunlar Excel dosyasında bulunamadı veya adlandırılamadı.")
+
+    # 'Tarih' sütununu datetime türüne dönüştür ve geçersiz kayıtları kaldır
+    if 'Tarih' in df_to_process.columns:
+        df_to_process['Tarih'] = pd.to_datetime(df_to_process['Tarih'], errors='coerce')
+        df_to_process = df_to_process.dropna(subset=['Tarih'])
+        if date_range is not None:
+            df_to_process = df_to_process[df_to_process['Tarih'].between(*date_range)]
+    else:
+        raise MonthlyGraphError("'Tarih' sütunu bulunamadı.")
+
+    # OEE grafikleri için 'OEE_Degeri' sütununu 0-1 arası orana dönüştür
+    if graph_type == "OEE Grafikleri":
+        if 'OEE_Degeri' in df_to_process.columns:
+            df_to_process['OEE_Degeri'] = oee_fraction_series(df_to_process['OEE_Degeri'])
+        else:
+            raise MonthlyGraphError("'OEE_Degeri' sütunu bulunamadı.")
+
+    # Dizgi Onay Dağılım Grafiği için süreci hazırla
+    if graph_type == "Dizgi Onay Dağılım Grafiği":
+        if not dizgi_onay_col_name or dizgi_onay_col_name not in df_to_process.columns:
+            raise MonthlyGraphError(f"'{dizgi_onay_col_name}' (Dizgi Onay) sütunu bulunamadı veya geçersiz.")
+        # Süreyi saniyeye çevir
+        df_to_process[dizgi_onay_col_name] = seconds_from_timedelta(df_to_process[dizgi_onay_col_name])
+
+    # Dizgi Duruş Grafiği için metrik sütunları süreye çevir
+    elif graph_type == "Dizgi Duruş Grafiği":
+        if not dizgi_durusu_metric_cols:
+            raise MonthlyGraphError("Dizgi Duruş Grafiği için metrik sütunları bulunamadı.")
+        present_metric_cols = [col for col in dizgi_durusu_metric_cols if col in df_to_process.columns]
+        if present_metric_cols:
+            df_to_process[present_metric_cols] = seconds_matrix_from_durations(
+                df_to_process[present_metric_cols])
+
+    check_cancelled(cancel_token)
+
+    # Grup anahtarları ("HAT-<n>") kompakt tabloda yüklemede bir kez hesaplanır; sütun yoksa (ör. kompakt
+    # olmayan çerçeve) benzersiz ürün adları üzerinden burada çıkarılır
+    if 'Group_Key' not in df_to_process.columns:
+        if 'U_Agaci_Sev' not in df_to_process.columns:
+            raise MonthlyGraphError("'U_Agaci_Sev' sütunu bulunamadı.")
+        df_to_process['Group_Key'] = line_group_keys(df_to_process['U_Agaci_Sev'])
+    df_to_process = df_to_process[df_to_process['Group_Key'].notna()]
+    check_cancelled(cancel_token)
+
+    # Yalnızca hat kayıt defterindeki (LINE_REGISTRY) hatlar, kayıt defteri sırasıyla işlenir
+    present_hats = set(df_to_process['Group_Key'].unique())
+    unique_hats = [hat for hat in LINE_REGISTRY if hat in present_hats]
+    total_items = len(unique_hats)
+
+    # Hat verisi yoksa hata mesajı gönder
+    if not unique_hats and graph_type != "Dizgi Duruş Grafiği":
+        registry_names = [f"'{hat}'" for hat in LINE_REGISTRY]
+        raise MonthlyGraphError(
+            "Grafik oluşturmak için hat verisi bulunamadı. Lütfen Excel dosyasının "
+            f"{', '.join(registry_names[:-1])} veya {registry_names[-1]} için veri içerdiğinden emin olun.")
+
+    # Dizgi Duruş Grafiği için Pareto analizi: hat başına duruş toplamları tek bir groupby geçişinde
+    # hesaplanır; genel Pareto bu toplamların sütun toplamıdır
+    if graph_type == "Dizgi Duruş Grafiği":
+        hat_metric_sums = df_to_process.groupby('Group_Key', sort=True, observed=True)[dizgi_durusu_metric_cols].sum()
+        pareto_rows = pd.concat([hat_metric_sums.sum().to_frame(GENERAL_PARETO_CHART_NAME).T,
+                                 hat_metric_sums.loc[unique_hats]])
+        for name, chart_data in compute_pareto_data(pareto_rows, pareto_threshold).items():
+            if name == GENERAL_PARETO_CHART_NAME:
+                figures_data.append(MonthlyChartData(name, chart_data))
+            elif chart_data["total_overall_sum"] > 0:  # Hat Pareto'ları yalnızca hatta duruş varsa eklenir
+                figures_data.append(MonthlyChartData(f"{name} Dizgi Duruş", chart_data))
+        _report(progress, 100)
+
+    # Dizgi Onay Dağılım Grafiği: tüm hatların toplamları tek bir groupby geçişinde hesaplanır; her hattın
+    # "diğer hatlar" payı toplamdan çıkarılarak bulunur (hat başına maske/tarama yapılmaz)
+    elif graph_type == "Dizgi Onay Dağılım Grafiği":
+        hat_onay_sums = df_to_process.groupby('Group_Key', sort=True, observed=True)[dizgi_onay_col_name].sum()
+        total_onay_sum = hat_onay_sums.sum()
+        for i, selected_hat in enumerate(unique_hats):
+            check_cancelled(cancel_token)
+            current_hat_onay_sum = hat_onay_sums.get(selected_hat, 0.0)
+            other_hats_onay_sum = total_onay_sum - current_hat_onay_sum
+            if total_onay_sum > 0:
+                figures_data.append(MonthlyChartData(selected_hat, [
+                    {"label": selected_hat, "value": current_hat_onay_sum},
+                    {"label": "DİĞER HATLAR", "value": other_hats_onay_sum}
+                ]))
+            _report(progress, int((i + 1) / total_items * 100))
+
+        # Aynı toplamlardan tüm hatların paylarını birlikte gösteren grafik
+        all_hats_data = [{"label": hat, "value": value} for hat, value in hat_onay_sums.items() if value > 0]
+        if len(all_hats_data) > 1:
+            figures_data.append(MonthlyChartData(ALL_HATS_CHART_NAME, all_hats_data))
+
+    # OEE grafikleri için hat bazlı günlük ortalamaları işle
+    else:
+        group_keys = df_to_process['Group_Key'].to_numpy()
+        for i, selected_hat in enumerate(unique_hats):
+            check_cancelled(cancel_token)  # Yeni bir seçim yapıldıysa kalan hatlar işlenmez
+            # Hat satırları maskeyle seçilir; hat için çerçeve kopyası oluşturulmaz
+            hat_mask = group_keys == selected_hat
+            if hat_mask.any():
+                grouped_oee = df_to_process.loc[hat_mask, ['Tarih', 'OEE_Degeri']].groupby(
+                    pd.Grouper(key='Tarih', freq='D'))['OEE_Degeri'].mean().reset_index()
+                grouped_oee.dropna(subset=['OEE_Degeri'], inplace=True)
+                figures_data.append(MonthlyChartData(selected_hat, grouped_oee.to_dict('records')))
+            # İlerlemeyi bildir
+            _report(progress, int((i + 1) / total_items * 100))
+
+    return figures_data
+
+
+def compute_page_oee_figures_data(
+        workbook_cache: WorkbookCache,  # Sayfaların okunacağı/önbellekten alınacağı önbellek
+        excel_path: Path,  # Çalışma kitabı
+        available_sheets: Sequence[str],  # Çalışma kitabında bulunan sayfalar
+        date_range: Tuple[pd.Timestamp, pd.Timestamp] | None = None,  # Yalnızca bu tarih aralığı (uçlar dahil)
+        progress: ProgressCallback | None = None,
+        cancel_token: CancellationToken | None = None  # İptal istenirse OperationCancelled fırlatılır
+) -> FiguresData:
+    """
+    Sayfa bazlı (DALGA_LEHİM, ROBOT, KAPLAMA-OEE) aylık OEE grafik verilerini üretir (Qt'ye bağımlı değildir).
+
+    Raises:
+        MonthlyGraphError: İşlenecek uygun sayfa yoksa.
+        OperationCancelled: cancel_token ile iptal istenirse (sayfa okunurken veya sayfa döngüsünde).
+    """
+    figures_data: FiguresData = []
+
+    # İşlenecek sayfalar ve OEE sütun harfleri tanımlanır
+    sheets_to_process_info = [
+        ("DALGA_LEHİM", "BP"),
+        ("ROBOT", "BG"),
+        ("KAPLAMA-OEE", "BG")
+    ]
+
+    # Excel dosyasında mevcut olan sayfalar filtrelenir
+    available_sheets_for_page_mode = [
+        (sheet_name, oee_col) for sheet_name, oee_col in sheets_to_process_info
+        if sheet_name in available_sheets
+    ]
+
+    total_items = len(available_sheets_for_page_mode)
+    if not available_sheets_for_page_mode:
+        raise MonthlyGraphError(
+            "Sayfa grafikleri için işlenecek uygun sayfa bulunamadı (DALGA_LEHİM, ROBOT, KAPLAMA-OEE).")
+
+    # Önbellekte olmayan sayfalar çalışma kitabı bir kez açılarak tek geçişte okunur
+    try:
+        workbook_cache.load_sheets(
+            excel_path, [sheet_name for sheet_name, _ in available_sheets_for_page_mode],
+            chunk_callback=lambda *_: check_cancelled(cancel_token))  # Excel okunurken de iptal edilebilir
+    except OperationCancelled:
+        raise
+    except Exception as e:
+        logging.warning(f"Sayfa grafikleri için sayfalar toplu yüklenemedi: {e}. Tek tek denenecek.")
+
+    # Her sayfa için veri işleme
+    for i, (sheet_name, oee_col_letter) in enumerate(available_sheets_for_page_mode):
+        check_cancelled(cancel_token)
+        logging.info(
+            f"Aylık grafik (Sayfa Modu): '{sheet_name}' sayfası için OEE grafiği oluşturuluyor...")
+
+        try:
+            # Sayfa verisini önbellekten al (yoksa Excel'den okunur, sütun isimleri string)
+            sheet_df = workbook_cache.load_sheet(excel_path, sheet_name)
+        except Exception as e:
+            logging.warning(f"'{sheet_name}' sayfası yüklenirken hata oluştu: {e}. Atlanıyor.")
+            _report(progress, int((i + 1) / total_items * 100))
+            continue
+
+        # Tarih sütununu al (A sütunu)
+        tarih_col_name = sheet_column_name(sheet_df, sheet_name, 'A')
+        if not tarih_col_name or tarih_col_name not in sheet_df.columns:
+            logging.warning(
+                f"Aylık grafik (Sayfa Modu): '{sheet_name}' sayfasında 'A' sütunu (Tarih) bulunamadı. Atlanıyor.")
+            _report(progress, int((i + 1) / total_items * 100))
+            continue
+
+        # OEE sütununu al
+        current_oee_col_name = sheet_column_name(sheet_df, sheet_name, oee_col_letter)
+
+        if not current_oee_col_name or current_oee_col_name not in sheet_df.columns:
+            logging.warning(
+                f"Aylık grafik (Sayfa Modu): '{sheet_name}' sayfası için '{oee_col_letter}' ({current_oee_col_name}) sütunu bulunamadı veya geçersiz. Atlanıyor.")
+            _report(progress, int((i + 1) / total_items * 100))
+            continue
+
+        # Yalnızca tarih ve OEE sütunlarıyla çalışılır; tarih datetime türüne çevrilir ve geçersizler atılır
+        sheet_df = sheet_df[[tarih_col_name, current_oee_col_name]].assign(
+            Tarih=lambda frame: pd.to_datetime(frame[tarih_col_name], errors='coerce')).dropna(subset=['Tarih'])
+        if date_range is not None:
+            sheet_df = sheet_df[sheet_df['Tarih'].between(*date_range)]
+
+        if sheet_df.empty:
+            logging.warning(
+                f"Aylık grafik (Sayfa Modu): '{sheet_name}' sayfası için tarih verisi bulunamadı. Atlanıyor.")
+            _report(progress, int((i + 1) / total_items * 100))
+            continue
+
+        # OEE sütununu sayısal değere dönüştür
+        sheet_df['OEE_Degeri_Processed'] = oee_fraction_series(sheet_df[current_oee_col_name])
+
+        # Tarihe göre grupla ve günlük ortalama OEE değerini hesapla
+        grouped_oee = sheet_df.groupby(pd.Grouper(key='Tarih', freq='D'))[
+            'OEE_Degeri_Processed'].mean().reset_index()
+        grouped_oee.dropna(subset=['OEE_Degeri_Processed'], inplace=True)
+
+        # Yarı değer çizgisi hesapla (ek grafik için kullanılabilir)
+        grouped_oee['OEE_Degeri_Half'] = grouped_oee['OEE_Degeri_Processed'] / 2
+
+        if grouped_oee.empty:
+            logging.warning(
+                f"Aylık grafik (Sayfa Modu): '{sheet_name}' sayfası için işlenecek OEE verisi bulunamadı. Atlanıyor.")
+            _report(progress, int((i + 1) / total_items * 100))
+            continue
+
+        # İşlenmiş veriyi figures_data listesine ekle
+        figures_data.append(MonthlyChartData(sheet_name, grouped_oee.to_dict('records')))
+        _report(progress, int((i + 1) / total_items * 100))
+
+    return figures_data
+
+
+def compute_monthly_figures_data(
+        graph_mode: str,  # "hat" veya "page"
+        graph_type: str,  # "OEE Grafikleri", "Dizgi Onay Dağılım Grafiği" veya "Dizgi Duruş Grafiği"
+        current_df: pd.DataFrame,  # Hat modunda işlenecek sayfa
+        sheet_name: str,  # current_df'in sayfa adı
+        columns: SheetColumns,  # current_df'in sütunları (detect_sheet_columns)
+        workbook_cache: WorkbookCache | None = None,  # Sayfa modunda diğer sayfaların okunacağı önbellek
+        excel_path: Path | None = None,  # Sayfa modunda çalışma kitabı
+        available_sheets: Sequence[str] = (),  # Sayfa modunda çalışma kitabındaki sayfalar
+        date_range: Tuple[pd.Timestamp, pd.Timestamp] | None = None,  # Yalnızca bu tarih aralığı (uçlar dahil)
+        progress: ProgressCallback | None = None,
+        cancel_token: CancellationToken | None = None,  # İptal istenirse OperationCancelled fırlatılır
+        pareto_threshold: float = PARETO_THRESHOLD_PERCENT  # Dizgi Duruş Pareto'sunun kümülatif yüzde eşiği
+) -> FiguresData:
+    """
+    Grafik moduna göre hat veya sayfa bazlı hesaplamayı seçer. Sayfa modunda yalnızca OEE grafikleri
+    desteklenir; diğer türler için boş liste döner.
+
+    Raises:
+        MonthlyGraphError: Veri üretilemezse.
+        OperationCancelled: cancel_token ile iptal istenirse.
+    """
+    if graph_mode == "hat":
+        return compute_hat_figures_data(current_df, sheet_name, columns.grouping_col_name, columns.grouped_col_name,
+                                        columns.oee_col_name, graph_type, date_range=date_range, progress=progress,
+                                        cancel_token=cancel_token, pareto_threshold=pareto_threshold)
+    if graph_mode == "page" and graph_type == "OEE Grafikleri":
+        if workbook_cache is None or excel_path is None:
+            raise MonthlyGraphError("Sayfa bazlı grafikler için çalışma kitabı belirtilmedi.")
+        return compute_page_oee_figures_data(workbook_cache, excel_path, available_sheets,
+                                             date_range=date_range, progress=progress, cancel_token=cancel_token)
+    return []
+
+
+def compute_reference_oee(history: HistoryStore | None, graph_mode: str, sheet_name: str,
+                          figures_data: FiguresData) -> ReferenceOee:
+    """
+    Her aylık OEE grafiği için önceki yıl ve önceki ay OEE değerlerini (yüzde) geçmiş deposunun aylık
+    özetlerinden okur. Referans ay, grafikteki en son tarihin ayıdır. Hat modunda sheet_name sayfasının
+    hat özetleri, sayfa modunda grafiğin ait olduğu sayfanın tamamının özeti kullanılır. Geçmişte iki
+    değeri de bulunmayan grafikler sonuca eklenmez.
+    """
+    references: ReferenceOee = {}
+    if history is None:
+        return references
+    for name, data in figures_data:
+        dates = [record['Tarih'] for record in data if pd.notna(record.get('Tarih'))]
+        if not dates:
+            continue
+        month = pd.Timestamp(max(dates)).strftime('%Y-%m')
+        if graph_mode == "page":
+            prev_year_oee, prev_month_oee = history.reference_oee(name, WHOLE_SHEET_GROUP, month)
+        else:
+            prev_year_oee, prev_month_oee = history.reference_oee(sheet_name, name, month)
+        if prev_year_oee is not None or prev_month_oee is not None:
+            references[name] = (prev_year_oee, prev_month_oee)
+    return references
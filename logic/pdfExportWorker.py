@@ -0,0 +1,32 @@
+import logging
+from pathlib import Path
+from typing import Callable
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+
+class PdfExportWorker(QThread):
+    """
+    Grafikleri arka planda tek bir çok sayfalı PDF'e yazan iş parçacığı.
+
+    Dışa aktarma fonksiyonu (logic.pdfExporter'daki export_* fonksiyonlarından biri, argümanları bağlanmış)
+    yalnızca progress_callback anahtar argümanını alır ve yazılan sayfa sayısını döndürür.
+    """
+
+    finished = pyqtSignal(str, int)  # PDF yolu, yazılan sayfa sayısı
+    progress = pyqtSignal(int)  # Yüzdelik ilerleme
+    error = pyqtSignal(str)  # Hata mesajı
+
+    def __init__(self, output_path: Path, export: Callable[..., int]) -> None:
+        super().__init__()
+        self.output_path = output_path
+        self.export = export
+
+    def run(self) -> None:
+        """PDF'i yazar; her sayfa yazıldıkça ilerleme yayınlar."""
+        try:
+            pages = self.export(progress_callback=lambda done, total: self.progress.emit(int(done / total * 100)))
+            self.finished.emit(str(self.output_path), pages)
+        except Exception as exc:
+            logging.exception("PdfExportWorker hatası oluştu.")
+            self.error.emit(f"PDF kaydedilirken bir hata oluştu: {str(exc)}")
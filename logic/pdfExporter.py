@@ -0,0 +1,85 @@
+import logging
+from pathlib import Path
+from typing import Callable, Dict, Sequence, Tuple
+
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+from config.constants import EXPORT_DPI, MONTHLY_EXPORT_FIGSIZE
+from logic.graphPlotter import GraphPlotter
+from logic.monthlyEngine import FiguresData
+
+# İlerleme geri çağrısı: (tamamlanan sayfa, toplam sayfa)
+PdfProgressCallback = Callable[[int, int], None]
+
+
+def export_daily_pdf(
+        results: Sequence[Tuple[str, pd.Series, str]],  # GraphWorker sonuç biçimi: (ürün, metrik toplamları, OEE)
+        output_path: Path,  # Yazılacak PDF dosyası
+        grouping_val: str,  # Seçilen tarih (sayfa etiketlerinde kullanılır)
+        graph_type: str = "Donut",  # "Donut" veya "Bar"
+        progress_callback: PdfProgressCallback | None = None
+) -> int:
+    """
+    Günlük grafiklerin hepsini tek bir çok sayfalı PDF'e yazar.
+
+    Grafikler sırayla aynı figüre çizilir ve çizildiği anda PDF'e aktarılır; bellekte her an yalnızca
+    bir grafik bulunduğundan grafik sayısı ne olursa olsun bellek kullanımı sabit kalır.
+
+    Returns:
+        Yazılan sayfa sayısı.
+    """
+    fig = Figure(figsize=(700 / 100, 460 / 100))  # Arayüzdeki günlük grafik boyutu
+    FigureCanvasAgg(fig)
+    total = len(results)
+    with PdfPages(output_path, metadata={"Title": f"Günlük Grafikler - {grouping_val}"}) as pdf:
+        for done, (grouped_val, metric_sums, oee_display_value) in enumerate(results, 1):
+            GraphPlotter.create_daily_figure(metric_sums, oee_display_value, graph_type, fig=fig)
+            # Ekrandaki grafik bilgi etiketinin karşılığı (ürün adı figürün içinde yer almaz)
+            fig.text(0.99, 0.99, f"{grouping_val} - {grouped_val.replace('HAT-#', '').strip()}",
+                     ha='right', va='top', fontsize=10, color='#555555')
+            pdf.savefig(fig, dpi=EXPORT_DPI, facecolor=fig.get_facecolor())
+            fig.clear()  # Çizilen öğeler PDF'e yazıldıktan hemen sonra bırakılır
+            if progress_callback:
+                progress_callback(done, total)
+
+    logging.info("%d günlük grafik PDF olarak kaydedildi: %s", total, output_path)
+    return total
+
+
+def export_monthly_pdf(
+        figures_data: FiguresData,  # Aylık grafik verileri (monthlyEngine sonucu)
+        output_path: Path,  # Yazılacak PDF dosyası
+        graph_type: str,  # "OEE Grafikleri", "Dizgi Onay Dağılım Grafiği" veya "Dizgi Duruş Grafiği"
+        graph_mode: str,  # "hat" veya "page"
+        prev_oee_values: Dict[str, Tuple[float | None, float | None]] | None = None,  # Ad -> (önceki yıl, önceki ay)
+        source_dates: pd.Series | None = None,  # Pareto başlığındaki tarih aralığı için kaynak tarih sütunu
+        progress_callback: PdfProgressCallback | None = None
+) -> int:
+    """
+    Aylık grafiklerin hepsini tek bir çok sayfalı PDF'e yazar. Her hat/sayfa için önceki yıl/ay OEE
+    değerleri prev_oee_values'tan alınır. Grafikler export_daily_pdf'teki gibi tek figür üzerinden akıtılır.
+
+    Returns:
+        Yazılan sayfa sayısı.
+    """
+    prev_oee_values = prev_oee_values or {}
+    fig = Figure(figsize=MONTHLY_EXPORT_FIGSIZE, dpi=EXPORT_DPI)
+    FigureCanvasAgg(fig)
+    total = len(figures_data)
+    with PdfPages(output_path, metadata={"Title": graph_type}) as pdf:
+        for done, (name, data_container) in enumerate(figures_data, 1):
+            GraphPlotter.reset_figure(fig, GraphPlotter.monthly_export_figsize(graph_type, data_container))
+            prev_year_oee, prev_month_oee = prev_oee_values.get(name, (None, None))
+            GraphPlotter.create_monthly_chart(fig, graph_type, graph_mode, name, data_container,
+                                              prev_year_oee=prev_year_oee, prev_month_oee=prev_month_oee,
+                                              source_dates=source_dates)
+            pdf.savefig(fig, dpi=EXPORT_DPI, facecolor=fig.get_facecolor())
+            fig.clear()
+            if progress_callback:
+                progress_callback(done, total)
+
+    logging.info("%d aylık grafik PDF olarak kaydedildi: %s", total, output_path)
+    return total
@@ -0,0 +1,125 @@
+import hashlib
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Tuple
+
+import pandas as pd
+
+from config.constants import SIDECAR_CACHE_DIR, SIDECAR_CACHE_MAX_FILES
+
+try:  # pyarrow isteğe bağlıdır; yoksa yan dosya önbelleği devre dışı kalır
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - ortamına göre değişir
+    pa = None
+    feather = None
+
+# Yan dosya içeriğinin biçim sürümü; sütun yerleşimi veya normalizasyon değiştiğinde artırılır
+# (eski sürümle yazılmış yan dosyalar kullanılmaz, budama ile zamanla silinir)
+SIDECAR_FORMAT_VERSION = 7
+
+
+class SidecarCache:
+    """
+    Açılan Excel sayfalarını yerel bir dizine sütunsal Feather dosyası olarak yazar ve
+    aynı dosya tekrar açıldığında openpyxl ile ayrıştırmak yerine bu dosyadan okur.
+
+    Yan dosya adı kaynak dosyanın içerik özetinden (blake2b) ve sayfa adından türetilir;
+    dolayısıyla dosya değiştiğinde özet de değişir ve eski yan dosya kullanılmaz.
+    Özet, aynı oturumda (yol, mtime, boyut) değişmediği sürece tekrar hesaplanmaz.
+    pyarrow kurulu değilse tüm işlemler sessizce atlanır.
+    """
+
+    def __init__(self, cache_dir: Path = SIDECAR_CACHE_DIR, max_files: int = SIDECAR_CACHE_MAX_FILES) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.max_files = max_files
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Yan dosya önbelleğinin kullanılabilir olup olmadığı (pyarrow kurulu mu)."""
+        return feather is not None
+
+    def file_digest(self, path: Path | str) -> str:
+        """Kaynak dosyanın içerik özetini döndürür (mtime/boyut değişmedikçe bellekte saklanır)."""
+        resolved = Path(path).resolve()
+        stat = resolved.stat()
+        memo_key = (str(resolved), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            digest = self._digests.get(memo_key)
+        if digest is not None:
+            return digest
+
+        hasher = hashlib.blake2b(digest_size=16)
+        with open(resolved, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        with self._lock:
+            self._digests[memo_key] = digest
+        return digest
+
+    def sidecar_path(self, path: Path | str, sheet_name: str) -> Path:
+        """Kaynak dosya ve sayfa için yan dosyanın yolunu döndürür."""
+        safe_sheet = re.sub(r"[^\w\-]", "_", sheet_name)
+        return self.cache_dir / f"{self.file_digest(path)}_{safe_sheet}_v{SIDECAR_FORMAT_VERSION}.feather"
+
+    def load(self, path: Path | str, sheet_name: str) -> pd.DataFrame | None:
+        """Geçerli bir yan dosya varsa sayfayı ondan okur, yoksa None döndürür."""
+        if not self.enabled:
+            return None
+        try:
+            sidecar = self.sidecar_path(path, sheet_name)
+            if not sidecar.exists():
+                return None
+            df = feather.read_feather(sidecar)
+            os.utime(sidecar)  # Son kullanım zamanını güncelle (budama sırası için)
+            logging.info("'%s' sayfası yan dosyadan yüklendi: %s", sheet_name, sidecar.name)
+            return df
+        except Exception as e:
+            logging.warning("Yan dosya okunamadı (%s / %s): %s. Excel'den okunacak.", Path(path).name, sheet_name, e)
+            return None
+
+    def save(self, path: Path | str, sheet_name: str, df: pd.DataFrame) -> None:
+        """Sayfayı yan dosyaya yazar. Yazma hataları yalnızca loglanır, uygulamayı durdurmaz."""
+        if not self.enabled:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            sidecar = self.sidecar_path(path, sheet_name)
+            tmp_path = sidecar.with_suffix(".tmp")
+            feather.write_feather(self._to_arrow_compatible(df), tmp_path)
+            os.replace(tmp_path, sidecar)  # Yarım yazılmış dosya okunmasın diye atomik taşı
+            logging.info("'%s' sayfası için yan dosya yazıldı: %s", sheet_name, sidecar.name)
+            self._prune()
+        except Exception as e:
+            logging.warning("Yan dosya yazılamadı (%s / %s): %s", Path(path).name, sheet_name, e)
+
+    @staticmethod
+    def _to_arrow_compatible(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Arrow'a çevrilemeyen karışık tipli object sütunlarını (ör. sayı + metin) string'e dönüştürür.
+        Boş hücreler korunur; diğer sütunlar olduğu gibi bırakılır.
+        """
+        out = df.reset_index(drop=True)  # Yeni nesne; sütun atamaları kaynak DataFrame'i etkilemez
+        for col in out.columns:
+            if out[col].dtype != object:
+                continue
+            try:
+                pa.array(out[col], from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError):
+                out[col] = out[col].where(out[col].isna(), out[col].astype(str))
+        return out
+
+    def _prune(self) -> None:
+        """Dizindeki yan dosya sayısı sınırı aşarsa en uzun süredir kullanılmayanları siler."""
+        files = sorted(self.cache_dir.glob("*.feather"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for old_file in files[self.max_files:]:
+            try:
+                old_file.unlink()
+            except OSError:
+                pass
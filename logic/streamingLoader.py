@@ -0,0 +1,104 @@
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import pandas as pd
+
+from config.constants import STREAM_CHUNK_ROWS
+from utils.helpers import sheet_column_indices
+
+# İlerleme geri çağrısı: (sayfa adı, yeni okunan parça, okunan satır, tahmini toplam satır)
+ChunkCallback = Callable[[str, pd.DataFrame, int, int], None]
+
+
+def _header_names(header_row: Tuple) -> List[str]:
+    """Başlık satırını pandas.read_excel ile aynı kurallarla adlandırır ('Unnamed: i', tekrarlar için '.1')."""
+    names: List[str] = []
+    seen: Dict[str, int] = {}
+    for i, value in enumerate(header_row):
+        name = f"Unnamed: {i}" if value is None or (isinstance(value, str) and not value.strip()) else str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def iter_sheet_chunks(source: Path | str | pd.ExcelFile, sheet_name: str,
+                      chunk_rows: int = STREAM_CHUNK_ROWS) -> Iterator[Tuple[pd.DataFrame, int, int]]:
+    """
+    Excel sayfasını openpyxl read-only modunda satır satır okuyup parça parça DataFrame olarak üretir.
+    Tüm sayfa belleğe alınmadan işlem başlatılabilir ve ilerleme raporlanabilir.
+
+    İlk satır başlık kabul edilir, yalnızca SHEET_COLUMN_LAYOUT'taki sütunlar alınır ve tamamen boş
+    satırlar atlanır (pd.read_excel ile aynı davranış). Başlıktan geniş veri satırları sütunları genişletir;
+    başlığı boş sütunlar 'Unnamed: i' adını alır. Genişleme öncesi parçalarda bu sütunlar bulunmaz
+    (parçalar birleştirilirken boş kalır).
+
+    Args:
+        source: Excel dosyasının yolu veya zaten açılmış pd.ExcelFile (openpyxl kitabı yeniden kullanılır).
+        sheet_name: Okunacak sayfa adı.
+        chunk_rows: Her parçadaki en fazla satır sayısı.
+
+    Yields:
+        (parça DataFrame, şimdiye kadar okunan satır sayısı, tahmini toplam veri satırı sayısı)
+    """
+    import openpyxl  # pandas'ın Excel motoru; yalnızca akışlı okumada gerekir
+
+    own_workbook = not isinstance(source, pd.ExcelFile)
+    workbook = openpyxl.load_workbook(source, read_only=True, data_only=True, keep_links=False) \
+        if own_workbook else source.book
+    try:
+        worksheet = workbook[sheet_name]
+        rows_total = max((worksheet.max_row or 1) - 1, 0)  # Boyut bilgisi yoksa 0 (bilinmiyor)
+        rows = worksheet.iter_rows(values_only=True)
+
+        header = next(rows, None)
+        if header is None:
+            yield pd.DataFrame(), 0, 0
+            return
+        header = list(header)
+        while header and header[-1] is None:  # pandas gibi sondaki boş başlıkları kırp
+            header.pop()
+
+        layout = sheet_column_indices(sheet_name)
+        width = 0  # Şimdiye kadarki en geniş satırın (başlık dahil) dolu hücre genişliği
+        positions: List[int] = []
+        columns: List[str] = []
+
+        def widen(new_width: int) -> None:
+            """Okunan sütunları yeni genişliğe göre günceller; başlığı boş sütunlar 'Unnamed: i' adını alır."""
+            nonlocal width, positions, columns
+            width = new_width
+            names = _header_names(tuple(header) + (None,) * (width - len(header)))
+            positions = [i for i in layout if i < width] if layout is not None else list(range(width))
+            columns = [names[i] for i in positions]
+
+        widen(len(header))
+        buffer: List[List] = []
+        rows_done = 0
+        for row in rows:
+            rows_done += 1
+            if all(value is None for value in row):
+                continue  # Tamamen boş satır
+            if len(row) > width and any(value is not None for value in row[width:]):
+                # Başlıktan geniş veri: pd.read_excel gibi sütunlar en geniş satıra göre genişletilir
+                if buffer:
+                    yield pd.DataFrame(buffer, columns=columns), rows_done - 1, max(rows_total, rows_done - 1)
+                    buffer = []
+                row_width = len(row)
+                while row[row_width - 1] is None:
+                    row_width -= 1
+                widen(row_width)
+            buffer.append([row[i] if i < len(row) else None for i in positions])
+            if len(buffer) >= chunk_rows:
+                yield pd.DataFrame(buffer, columns=columns), rows_done, max(rows_total, rows_done)
+                buffer = []
+
+        if buffer or rows_done == 0:
+            yield pd.DataFrame(buffer, columns=columns), rows_done, max(rows_total, rows_done)
+    finally:
+        if own_workbook:
+            workbook.close()
+
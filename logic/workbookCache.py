@@ -0,0 +1,180 @@
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+from config.constants import HISTORY_AUTO_INGEST, WORKBOOK_CACHE_MAX_BYTES
+from logic.historyStore import HistoryStore
+from logic.sidecarCache import SidecarCache
+from logic.streamingLoader import ChunkCallback, iter_sheet_chunks
+from utils.helpers import compact_sheet
+
+# Önbellek anahtarı: (mutlak dosya yolu, değiştirilme zamanı (ns), dosya boyutu, sayfa adı)
+CacheKey = Tuple[str, int, int, str]
+
+
+class WorkbookCache:
+    """
+    Ayrıştırılmış Excel sayfalarını bellekte tutan, LRU (en az kullanılan önce atılır) politikalı önbellek.
+
+    Anahtar dosya yolu + mtime + boyut + sayfa adından oluşur; dosya diskte değişirse anahtar da
+    değişeceği için eski kayıt kendiliğinden geçersiz olur. Toplam bellek kullanımı max_bytes'ı
+    aşarsa en uzun süredir kullanılmayan sayfalar atılır.
+
+    Önbellekten dönen DataFrame'ler paylaşılır; çağıranlar bunları yerinde değiştirmemelidir.
+    GUI iş parçacığı ve worker'lar aynı önbelleği kullanabildiği için erişim kilitle korunur.
+    """
+
+    def __init__(self, max_bytes: int = WORKBOOK_CACHE_MAX_BYTES, sidecar: SidecarCache | None = None,
+                 history: HistoryStore | None = None, auto_ingest: bool = HISTORY_AUTO_INGEST) -> None:
+        self.max_bytes = max_bytes
+        self.sidecar = sidecar  # Disk üzerindeki Feather yan dosya önbelleği (isteğe bağlı)
+        self.history = history  # Çok aylık OEE geçmiş deposu (isteğe bağlı); referans OEE'ler buradan okunur
+        self.auto_ingest = auto_ingest  # True ise açılan sayfalar geçmiş deposuna otomatik eklenir
+        self._entries: "OrderedDict[CacheKey, Tuple[pd.DataFrame, int]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(path: Path | str, sheet_name: str) -> CacheKey:
+        """Dosyanın güncel durumuna (mtime, boyut) göre önbellek anahtarı üretir."""
+        resolved = Path(path).resolve()
+        stat = resolved.stat()
+        return str(resolved), stat.st_mtime_ns, stat.st_size, sheet_name
+
+    def get(self, path: Path | str, sheet_name: str) -> pd.DataFrame | None:
+        """Sayfa önbellekteyse DataFrame'i döndürür ve en son kullanılan olarak işaretler, yoksa None."""
+        key = self.make_key(path, sheet_name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, path: Path | str, sheet_name: str, df: pd.DataFrame) -> None:
+        """Sayfayı önbelleğe ekler ve bellek sınırı aşılırsa eski kayıtları atar."""
+        key = self.make_key(path, sheet_name)
+        nbytes = int(df.memory_usage(index=True, deep=True).sum())
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old[1]
+            # Aynı dosyanın eski sürümlerine ait kayıtları at (mtime/boyut değişmiş)
+            for stale_key in [k for k in self._entries if k[0] == key[0] and k[1:3] != key[1:3]]:
+                self._total_bytes -= self._entries.pop(stale_key)[1]
+            self._entries[key] = (df, nbytes)
+            self._total_bytes += nbytes
+            self._evict()
+
+    def load_sheet(self, path: Path | str, sheet_name: str) -> pd.DataFrame:
+        """Tek bir sayfayı load_sheets üzerinden yükler (önbellek -> yan dosya -> Excel)."""
+        return self.load_sheets(path, [sheet_name])[sheet_name]
+
+    def load_sheets(self, path: Path | str, sheet_names: List[str], excel_file: pd.ExcelFile | None = None,
+                    chunk_callback: ChunkCallback | None = None) -> Dict[str, pd.DataFrame]:
+        """
+        Verilen sayfaları önce bellekten, sonra disk yan dosyasından alır; ikisinde de olmayan
+        sayfaların hepsi çalışma kitabı tek kez açılarak openpyxl read-only modunda akışlı okunur.
+        Her sayfadan yalnızca SHEET_COLUMN_LAYOUT'ta tanımlı sütunlar alınır. Excel'den okunan sayfaların sütun
+        isimleri string tipine çevrilir, sayfa kompakt tabloya (compact_sheet: tarih datetime64, ürün category,
+        süreler float32 saniye, OEE float64 oran) dönüştürülür ve yan dosyaya yazılır. auto_ingest açıksa
+        bellekte olmayan sayfalar (yan dosyadan veya Excel'den) geçmiş deposuna da eklenir.
+
+        Args:
+            path: Excel dosyasının yolu (önbellek anahtarı için).
+            sheet_names: Yüklenecek sayfa adları.
+            excel_file: Çağıranın zaten açtığı pd.ExcelFile (varsa dosya tekrar açılmaz).
+            chunk_callback: Excel'den okunan her satır parçası için çağrılır
+                (sayfa adı, parça, okunan satır, tahmini toplam satır).
+
+        Returns:
+            Sayfa adı -> DataFrame sözlüğü.
+        """
+        loaded: Dict[str, pd.DataFrame] = {}
+        missing: List[str] = []
+        for sheet_name in sheet_names:
+            cached = self.get(path, sheet_name)
+            if cached is not None:
+                logging.info("'%s' sayfası önbellekten alındı.", sheet_name)
+                loaded[sheet_name] = cached
+                continue
+            df = self.sidecar.load(path, sheet_name) if self.sidecar else None
+            if df is None:
+                missing.append(sheet_name)
+                continue
+            self.put(path, sheet_name, df)
+            if self.history and self.auto_ingest:
+                self.history.ingest(path, sheet_name, df)
+            loaded[sheet_name] = df
+
+        if missing:
+            xls = excel_file if excel_file is not None else pd.ExcelFile(path)
+            try:
+                parsed = {sheet_name: self._read_streaming(xls, sheet_name, chunk_callback) for sheet_name in missing}
+            finally:
+                if excel_file is None:
+                    xls.close()
+            logging.info("Çalışma kitabından tek açılışta okunan sayfalar: %s", ", ".join(missing))
+            for sheet_name, df in parsed.items():
+                df.columns = df.columns.astype(str)
+                df = compact_sheet(df, sheet_name)
+                if self.sidecar:
+                    self.sidecar.save(path, sheet_name, df)
+                if self.history and self.auto_ingest:
+                    self.history.ingest(path, sheet_name, df)
+                self.put(path, sheet_name, df)
+                loaded[sheet_name] = df
+
+        return loaded
+
+    def add_to_history(self, path: Path | str, sheets: Dict[str, pd.DataFrame]) -> int:
+        """
+        Yüklenmiş sayfaları geçmiş deposuna açıkça ekler (auto_ingest kapalıyken kullanıcı isteğiyle).
+
+        Returns:
+            Depoya yazılan toplam satır sayısı (geçmiş deposu yoksa veya sayfalar daha önce eklendiyse 0).
+        """
+        if not self.history:
+            return 0
+        return sum(self.history.ingest(path, sheet_name, df) for sheet_name, df in sheets.items())
+
+    @staticmethod
+    def _read_streaming(xls: pd.ExcelFile, sheet_name: str,
+                        chunk_callback: ChunkCallback | None = None) -> pd.DataFrame:
+        """
+        Sayfayı openpyxl read-only modunda parça parça okur (yalnızca SHEET_COLUMN_LAYOUT sütunları)
+        ve parçaları birleştirir. Her parça okunduğunda chunk_callback çağrılır.
+        """
+        chunks = []
+        for chunk, rows_done, rows_total in iter_sheet_chunks(xls, sheet_name):
+            chunks.append(chunk)
+            if chunk_callback is not None:
+                chunk_callback(sheet_name, chunk, rows_done, rows_total)
+        return pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+
+    def invalidate(self, path: Path | str | None = None) -> None:
+        """Belirtilen dosyanın (veya path verilmezse tüm dosyaların) kayıtlarını önbellekten siler."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._total_bytes = 0
+                return
+            resolved = str(Path(path).resolve())
+            for key in [k for k in self._entries if k[0] == resolved]:
+                self._total_bytes -= self._entries.pop(key)[1]
+
+    def stats(self) -> Dict[str, int]:
+        """Önbellekteki kayıt sayısını ve toplam bellek kullanımını döndürür."""
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._total_bytes}
+
+    def _evict(self) -> None:
+        """Toplam boyut sınırın altına inene kadar en eski kayıtları atar (en yeni kayıt her zaman kalır)."""
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, (_, nbytes) = self._entries.popitem(last=False)
+            self._total_bytes -= nbytes
+            logging.info("Önbellekten atıldı: %s / %s (%d bayt)", Path(key[0]).name, key[3], nbytes)
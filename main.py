@@ -1,15 +1,22 @@
 import sys  # Sistem seviyesinde işlemler için (örn. argümanlar, çıkış)
 import logging  # Hata ve olay günlüğü kaydı için
+import multiprocessing  # Toplu grafik kaydetmedeki süreç havuzu için
 
 from PyQt5.QtWidgets import (  # PyQt5 arayüz öğeleri
     QApplication,  # Uygulama nesnesi (olmazsa olmaz)
     QMessageBox    # Hata mesaj kutusu (pop-up uyarı göstermek için)
 )
 
+from config.constants import LOG_FORMAT  # Uygulama günlük biçimi
+from utils.helpers import enable_copy_on_write  # Sütun seçimlerinin kopyalanmaması için (pandas 2.x)
 from ui.mainWindow import MainWindow  # Uygulamanın ana penceresi (arayüz sınıfı)
 
 # Ana çalıştırma bloğu: Bu dosya doğrudan çalıştırıldığında devreye girer
 if __name__ == "__main__":
+    multiprocessing.freeze_support()    # Paketlenmiş (PyInstaller) uygulamada alt süreçlerin doğru başlaması için
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT,  # INFO ve üzeri mesajlar terminale yazılır
+                        handlers=[logging.StreamHandler(sys.stdout)])
+    enable_copy_on_write()              # Worker'lara verilen sütun seçimleri veriyi kopyalamadan paylaşır
     app = QApplication(sys.argv)        # QApplication nesnesi oluşturulur, argv ile komut satırı argümanları alınır
     app.setStyle("Fusion")              # Fusion stili kullanılır (daha modern ve düz bir görünüm sağlar)
 
@@ -1,14 +1,14 @@
+import functools
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Tuple
-import pandas as pd
+from typing import List
 
-import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import (
     QWidget,
     QFileDialog,
@@ -22,9 +22,14 @@ from PyQt5.QtWidgets import (
     QScrollArea
 )
 
+from config.constants import DAILY_FIGURE_CACHE_PAGES, DAILY_RESULTS_CACHE_SIZE
 from utils.helpers import GRAPHS_PER_PAGE
+from logic.dailyEngine import DailyGraphResult
 from logic.graphWorker import GraphWorker
 from logic.graphPlotter import GraphPlotter
+from logic.batchRenderWorker import BatchRenderWorker
+from logic.pdfExporter import export_daily_pdf
+from logic.pdfExportWorker import PdfExportWorker
 
 
 class DailyGraphsPage(QWidget):
@@ -34,9 +39,12 @@ class DailyGraphsPage(QWidget):
     Attributes:
         main_window: Ana pencere referansı, genel veri ve ayarların erişimi için.
         worker: Arka planda grafik verilerini hazırlayan iş parçacığı (GraphWorker).
-        figures_data: Oluşturulan grafiklerin tuple listesi (etiket, Matplotlib Figure, OEE değeri).
+        results: Gösterilecek grafiklerin verileri (etiket, metrik toplamları, OEE değeri).
+        canvas_pool: Bir kez oluşturulup tekrar kullanılan grafik tuvalleri (her biri kendi figürüne sahip).
+        page_canvases: Çizilmiş sonuçların tuvalleri (sonuç indeksi -> tuval); yalnızca son görülen sayfalar tutulur.
         current_page: Şu anda görüntülenen sayfa indeksi (0 tabanlı).
         current_graph_type: Kullanıcının seçtiği grafik türü ("Donut" veya "Bar").
+        results_cache: (sayfa, tarih, ürünler, metrikler) anahtarıyla hesaplanmış sonuçlar (LRU).
     """
 
     def __init__(self, main_window: "MainWindow") -> None:
@@ -44,9 +52,16 @@ class DailyGraphsPage(QWidget):
         super().__init__()
         self.main_window = main_window
         self.worker: GraphWorker | None = None
-        self.figures_data: List[Tuple[str, Figure, str]] = []
+        self.cancelled_workers: List[GraphWorker] = []  # İptal edilip henüz bitmemiş worker'lar
+        self.batch_worker: BatchRenderWorker | None = None
+        self.pdf_worker: PdfExportWorker | None = None
+        self.results: List[DailyGraphResult] = []
+        self.canvas_pool: List[FigureCanvas] = []
+        self.page_canvases: OrderedDict[int, FigureCanvas] = OrderedDict()
         self.current_page = 0
         self.current_graph_type = "Donut"
+        self.results_cache: OrderedDict[tuple, List[DailyGraphResult]] = OrderedDict()
+        self._results_key: tuple | None = None  # Hesaplanmakta olan sonuçların anahtarı
         self.init_ui()
 
     def init_ui(self):
@@ -94,6 +109,16 @@ class DailyGraphsPage(QWidget):
         self.btn_save_image.clicked.connect(self.save_single_graph_as_image)
         self.btn_save_image.setEnabled(False)  # Başlangıçta pasif
         nav_top.addWidget(self.btn_save_image)
+
+        self.btn_save_all = QPushButton("Tümünü Kaydet (PNG)")
+        self.btn_save_all.clicked.connect(self.save_all_graphs_as_images)
+        self.btn_save_all.setEnabled(False)  # Başlangıçta pasif
+        nav_top.addWidget(self.btn_save_all)
+
+        self.btn_export_pdf = QPushButton("Tümünü Kaydet (PDF)")
+        self.btn_export_pdf.clicked.connect(self.export_all_graphs_as_pdf)
+        self.btn_export_pdf.setEnabled(False)  # Başlangıçta pasif
+        nav_top.addWidget(self.btn_export_pdf)
         main_layout.addLayout(nav_top)
 
         # Grafiklerin gösterileceği kaydırılabilir alan
@@ -133,87 +158,77 @@ class DailyGraphsPage(QWidget):
             index: Seçilen combo box indeksi.
         """
         self.current_graph_type = self.cmb_graph_type.currentText()
-        self.enter_page()  # Sayfayı yeniden yükleyerek grafikleri güncelle
+        # Sonuçlar önbellekte olduğundan yalnızca grafikler yeniden çizilir
+        self.enter_page()
 
-    def on_results(self, results: List[Tuple[str, pd.Series, str]]) -> None:
-        """GraphWorker'dan grafik verisi geldiğinde işleme ve grafik oluşturma.
+    def on_results(self, results: List[DailyGraphResult]) -> None:
+        """Grafik verisi (GraphWorker, küp veya önbellekten) geldiğinde sayfaları hazırlar.
 
         Args:
-            results: Tuple listesi, her tuple (gruplama değeri, metrik verileri serisi, OEE değeri).
+            results: DailyGraphResult listesi, her biri (gruplama değeri, metrik verileri serisi, OEE değeri).
         """
+        sender = self.sender()
+        if isinstance(sender, GraphWorker) and sender is not self.worker:
+            return  # Seçim değişmeden önce başlatılmış eski worker'ın sonucu; yok say
+
         self.progress.setValue(100)
         self.progress.hide()
 
+        if self._results_key is not None:
+            # Aynı seçim için (örn. grafik tipi değişiminde) tekrar hesaplama yapılmaması için sakla
+            self.results_cache[self._results_key] = results
+            self.results_cache.move_to_end(self._results_key)
+            while len(self.results_cache) > DAILY_RESULTS_CACHE_SIZE:
+                self.results_cache.popitem(last=False)
+
         if not results:
             QMessageBox.information(self, "Veri Yok", "Grafik oluşturulamadı. Seçilen kriterlere göre veri bulunamadı.")
             self.btn_save_image.setEnabled(False)
+            self.btn_save_all.setEnabled(False)
+            self.btn_export_pdf.setEnabled(False)
             self.lbl_chart_info.setText("Gösterilecek grafik bulunmadı.")
             return
 
-        self.figures_data.clear()  # Önceki grafikleri temizle
-
-        # Grafik boyutları (700x460 piksel, DPI 100 varsayılır, inç cinsinden)
-        fig_width_inches = 700 / 100
-        fig_height_inches = 460 / 100
-
-        for grouped_val, metric_sums, oee_display_value in results:
-            # Yeni Matplotlib figürü ve ekseni oluştur
-            fig, ax = plt.subplots(figsize=(fig_width_inches, fig_height_inches))
-            background_color = 'white'
-            fig.patch.set_facecolor(background_color)
-            ax.set_facecolor(background_color)
-
-            # Metrikleri azalan sırada sıralar
-            sorted_metrics_series = metric_sums.sort_values(ascending=False) if not metric_sums.empty else pd.Series()
-
-            num_metrics = len(sorted_metrics_series)
-            if num_metrics == 1 and sorted_metrics_series.index[0] == 'HAT ÇALIŞMADI':
-                chart_colors = ['#FF9841']  # Özel durum renk
-            else:
-                # Matplotlib renk paletinden renkler alır
-                colors_palette = matplotlib.colormaps.get_cmap('tab20')
-                chart_colors = [colors_palette(i % 20) for i in range(num_metrics)] if num_metrics > 0 else []
-
-            # Seçilen grafik türüne göre çizim yapar
-            if self.current_graph_type == "Donut":
-                GraphPlotter.create_donut_chart(ax, sorted_metrics_series, oee_display_value, chart_colors, fig)
-            elif self.current_graph_type == "Bar":
-                GraphPlotter.create_bar_chart(ax, sorted_metrics_series, oee_display_value, chart_colors)
-
-            # Toplam duruş süresini saat ve dakika cinsinden hesapla
-            total_duration_seconds = sorted_metrics_series.sum()
-            total_duration_hours = int(total_duration_seconds // 3600)
-            total_duration_minutes = int((total_duration_seconds % 3600) // 60)
-            total_duration_text = f"TOPLAM DURUŞ\n{total_duration_hours} SAAT {total_duration_minutes} DAKİKA"
-
-            # Grafik altına toplam duruş metnini ekle
-            fig.text(0.01, 0.05, total_duration_text, transform=fig.transFigure,
-                     fontsize=14, fontweight='bold', verticalalignment='bottom')
-
-            self.figures_data.append((grouped_val, fig, oee_display_value))
-            plt.close(fig)  # Bellek sızıntısını önlemek için figürü kapat
+        # Figürler burada oluşturulmaz; her sayfa gösterildiğinde (gerekirse) çizilir
+        self.results = results
+        self.page_canvases.clear()
+        self.btn_save_all.setEnabled(True)
+        self.btn_export_pdf.setEnabled(True)
 
-        self.display_current_page_graphs()  # Oluşturulan grafikleri göster
-        if self.figures_data:
-            self.btn_save_image.setEnabled(True)  # Kaydetme butonunu aktif et
+        self.display_current_page_graphs()  # Geçerli sayfanın grafiklerini çiz ve göster
 
     def enter_page(self) -> None:
         """Sayfaya girildiğinde grafik oluşturma sürecini başlatır."""
-        self.figures_data.clear()  # Önceki verileri temizle
+        self.results = []  # Önceki verileri temizle
+        self.page_canvases.clear()
         self.clear_canvases()  # Önceki grafik tuvalini temizle
         self.progress.setValue(0)
         self.progress.show()  # İlerleme çubuğunu göster
         self.btn_save_image.setEnabled(False)
+        self.btn_save_all.setEnabled(False)
+        self.btn_export_pdf.setEnabled(False)
         self.lbl_chart_info.setText("Grafikler oluşturuluyor...")
         self.update_page_label()
         self.update_navigation_buttons()
 
-        # Önceki çalışan iş parçacığı varsa durdur
-        if self.worker and self.worker.isRunning():
-            self.worker.quit()
-            self.worker.wait()
+        # Önceki çalışan iş parçacığı varsa iptal et (beklenmez; arayüz bloklanmaz)
+        self._cancel_running_worker()
+
+        # Aynı dosya sürümü, sayfa, tarih, ürün ve metrik seçimi daha önce hesaplandıysa tekrar kullan
+        self._results_key = self._current_results_key()
+        cached_results = self.results_cache.get(self._results_key)
+        if cached_results is not None:
+            self.on_results(cached_results)
+            return
 
-        # Yeni GraphWorker nesnesi oluştur ve başlat
+        # Önceden hesaplanmış küp varsa sonuçlar dizi dilimleme ile doğrudan alınır
+        cube = self.main_window.daily_cube
+        if cube is not None:
+            self.on_results(cube.results(self.main_window.selected_grouping_val, self.main_window.grouped_values,
+                                         self.main_window.selected_metrics))
+            return
+
+        # Küp yoksa ham satırlardan hesaplanır
         self.worker = GraphWorker(
             df=self.main_window.df,
             grouping_col_name=self.main_window.grouping_col_name,
@@ -229,32 +244,105 @@ class DailyGraphsPage(QWidget):
         self.worker.error.connect(self.on_error)
         self.worker.start()
 
+    def _cancel_running_worker(self) -> None:
+        """
+        Çalışan GraphWorker'a iptal isteği gönderir ve sinyallerini ayırır. Worker bir sonraki kontrol
+        noktasında kendiliğinden biter; çalışan bir QThread yok edilmemesi için o zamana kadar referansı tutulur.
+        """
+        self.cancelled_workers = [worker for worker in self.cancelled_workers if worker.isRunning()]
+        if self.worker and self.worker.isRunning():
+            self.worker.cancel()
+            self.worker.finished.disconnect()
+            self.worker.progress.disconnect()
+            self.worker.error.disconnect()
+            self.cancelled_workers.append(self.worker)
+        self.worker = None
+
+    def _current_results_key(self) -> tuple:
+        """Ana penceredeki mevcut seçimden sonuç önbelleği anahtarını üretir."""
+        mw = self.main_window
+        return (mw.workbook_cache.make_key(mw.excel_path, mw.selected_sheet), mw.selected_grouping_val,
+                tuple(mw.grouped_values), tuple(mw.selected_metrics))
+
     def on_error(self, message: str) -> None:
         """GraphWorker'dan hata mesajı geldiğinde kullanıcıya gösterir.
 
         Args:
             message: Hata mesajı metni.
         """
+        sender = self.sender()
+        if isinstance(sender, GraphWorker) and sender is not self.worker:
+            return  # İptal edilmiş eski worker'ın hatası; yok say
+
         QMessageBox.critical(self, "Hata", message)
         self.progress.setValue(0)
         self.progress.hide()
         self.lbl_chart_info.setText("Grafik oluşturma hatası.")
         self.btn_save_image.setEnabled(False)
+        self.btn_save_all.setEnabled(False)
+        self.btn_export_pdf.setEnabled(False)
 
     def clear_canvases(self) -> None:
-        """Mevcut grafik tuval widgetlarını temizler ve bellekten kaldırır."""
-        while self.vbox_canvases.count():
-            item = self.vbox_canvases.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()  # Widget'ı bellekten sil
+        """Grafik tuvallerini gizler; tuvaller silinmez, sonraki çizimlerde tekrar kullanılır."""
+        for canvas in self.canvas_pool:
+            canvas.hide()
+
+    def total_pages(self) -> int:
+        """Sonuç sayısına göre toplam sayfa sayısını döndürür."""
+        return (len(self.results) + GRAPHS_PER_PAGE - 1) // GRAPHS_PER_PAGE
+
+    def canvas_for(self, index: int) -> FigureCanvas:
+        """
+        İndeksteki sonucun çizildiği tuvali döndürür; yoksa havuzdan bir tuval alıp figürünü
+        temizleyerek yeniden çizer. En son kullanılan DAILY_FIGURE_CACHE_PAGES sayfa çizili tutulur.
+        """
+        canvas = self.page_canvases.get(index)
+        if canvas is None:
+            if len(self.canvas_pool) < DAILY_FIGURE_CACHE_PAGES * GRAPHS_PER_PAGE:
+                # Havuz dolana kadar yeni tuval oluşturulur (700x460 piksel, DPI 100)
+                canvas = FigureCanvas(Figure(figsize=(700 / 100, 460 / 100)))
+                canvas.setFixedSize(700, 460)  # Sabit boyutlu grafik tuvali
+                canvas.hide()
+                self.vbox_canvases.addWidget(canvas)
+                self.canvas_pool.append(canvas)
+            else:
+                # Önce hiçbir sayfaya bağlı olmayan (ör. sonuçlar yenilenince boşalan) tuval kullanılır;
+                # hepsi bağlıysa en uzun süredir kullanılmayan sayfanın tuvali yeniden kullanılır
+                mapped = {id(c) for c in self.page_canvases.values()}
+                canvas = next((c for c in self.canvas_pool if id(c) not in mapped), None)
+                if canvas is None:
+                    _, canvas = self.page_canvases.popitem(last=False)
+            _, metric_sums, oee_display_value = self.results[index]
+            GraphPlotter.create_daily_figure(metric_sums, oee_display_value, self.current_graph_type,
+                                             fig=canvas.figure)
+            canvas.draw()
+            self.page_canvases[index] = canvas
+        self.page_canvases.move_to_end(index)
+        return canvas
+
+    def figure_for(self, index: int) -> Figure:
+        """İndeksteki sonucun (gerekirse çizilmiş) figürünü döndürür."""
+        return self.canvas_for(index).figure
+
+    def prefetch_adjacent_pages(self) -> None:
+        """Geçerli sayfanın önceki ve sonraki sayfalarının figürlerini önceden çizer."""
+        current_page = self.current_page
+        for page in (current_page + 1, current_page - 1):
+            if 0 <= page < self.total_pages():
+                for index in range(page * GRAPHS_PER_PAGE, min((page + 1) * GRAPHS_PER_PAGE, len(self.results))):
+                    if index not in self.page_canvases:
+                        self.canvas_for(index)
+        # Önceden çizim geçerli sayfayı LRU'da geriye itmesin
+        for index in range(current_page * GRAPHS_PER_PAGE, min((current_page + 1) * GRAPHS_PER_PAGE, len(self.results))):
+            if index in self.page_canvases:
+                self.page_canvases.move_to_end(index)
 
     def display_current_page_graphs(self) -> None:
-        """Geçerli sayfadaki grafiklere ait figürleri tuval üzerinde gösterir."""
+        """Geçerli sayfadaki grafiklere ait figürleri (gerekirse çizerek) tuval üzerinde gösterir."""
         self.clear_canvases()
 
         # Toplam sayfa sayısını hesaplar
-        total_pages = (len(self.figures_data) + GRAPHS_PER_PAGE - 1) // GRAPHS_PER_PAGE if self.figures_data else 0
+        total_pages = self.total_pages()
 
         # Sayfa indeksi sınırlandırması
         if self.current_page >= total_pages and total_pages > 0:
@@ -266,19 +354,22 @@ class DailyGraphsPage(QWidget):
         start_index = self.current_page * GRAPHS_PER_PAGE
         end_index = start_index + GRAPHS_PER_PAGE
 
-        graphs_to_display = self.figures_data[start_index:end_index]
+        indices_to_display = range(start_index, min(end_index, len(self.results)))
 
-        if not graphs_to_display:
+        if not indices_to_display:
             self.lbl_chart_info.setText("Gösterilecek grafik bulunamadı.")
             self.btn_save_image.setEnabled(False)
             self.update_page_label()
             self.update_navigation_buttons()
             return
 
-        for grouped_val, fig, oee_display_value in graphs_to_display:
-            canvas = FigureCanvas(fig)
-            canvas.setFixedSize(700, 460)  # Sabit boyutlu grafik tuvali
-            self.vbox_canvases.addWidget(canvas)
+        for position, index in enumerate(indices_to_display):
+            grouped_val = self.results[index][0]
+            canvas = self.canvas_for(index)
+            # Havuzdaki tuval sayfadaki sırasına taşınır ve gösterilir
+            self.vbox_canvases.removeWidget(canvas)
+            self.vbox_canvases.insertWidget(position, canvas)
+            canvas.show()
             display_grouped_val = grouped_val.replace("HAT-#", "").strip()
             self.lbl_chart_info.setText(f"{self.main_window.selected_grouping_val} - {display_grouped_val}")
 
@@ -286,14 +377,17 @@ class DailyGraphsPage(QWidget):
         self.update_navigation_buttons()
         self.btn_save_image.setEnabled(True)
 
+        # Komşu sayfalar, geçerli sayfa ekrana çizildikten sonra hazırlanır
+        QTimer.singleShot(0, self.prefetch_adjacent_pages)
+
     def update_page_label(self) -> None:
         """Sayfa numarası etiketini günceller (örn. 'Sayfa 1 / 5')."""
-        total_pages = (len(self.figures_data) + GRAPHS_PER_PAGE - 1) // GRAPHS_PER_PAGE if self.figures_data else 0
+        total_pages = self.total_pages()
         self.lbl_page.setText(f"Sayfa {self.current_page + 1} / {total_pages}")
 
     def update_navigation_buttons(self) -> None:
         """Önceki ve Sonraki sayfa düğmelerinin etkinlik durumlarını günceller."""
-        total_pages = (len(self.figures_data) + GRAPHS_PER_PAGE - 1) // GRAPHS_PER_PAGE if self.figures_data else 0
+        total_pages = self.total_pages()
         self.btn_prev.setEnabled(self.current_page > 0)
         self.btn_next.setEnabled(self.current_page < total_pages - 1)
 
@@ -305,25 +399,26 @@ class DailyGraphsPage(QWidget):
 
     def next_page(self) -> None:
         """Sonraki sayfa grafiklerini görüntüler, sayfa numarasını artırır."""
-        total_pages = (len(self.figures_data) + GRAPHS_PER_PAGE - 1) // GRAPHS_PER_PAGE if self.figures_data else 0
+        total_pages = self.total_pages()
         if self.current_page < total_pages - 1:
             self.current_page += 1
             self.display_current_page_graphs()
 
     def save_single_graph_as_image(self) -> None:
         """Mevcut sayfadaki ilk grafiği kullanıcıya seçtirilen dosya adıyla PNG/JPEG olarak kaydeder."""
-        if not self.figures_data:
+        if not self.results:
             QMessageBox.warning(self, "Kaydedilecek Grafik Yok", "Görüntülenecek bir grafik bulunmamaktadır.")
             return
 
-        total_graphs = len(self.figures_data)
+        total_graphs = len(self.results)
         fig_index_on_page = self.current_page * GRAPHS_PER_PAGE
 
         if not (0 <= fig_index_on_page < total_graphs):
             QMessageBox.warning(self, "Geçersiz Sayfa", "Mevcut sayfada kaydedilecek bir grafik yok.")
             return
 
-        grouped_val, fig, _ = self.figures_data[fig_index_on_page]
+        grouped_val = self.results[fig_index_on_page][0]
+        fig = self.figure_for(fig_index_on_page)
 
         # Varsayılan dosya adını düzenle (boşluk ve / karakterleri kaldırılır)
         default_filename = f"grafik_{grouped_val}_{self.main_window.selected_grouping_val}_{self.current_graph_type}.png".replace(
@@ -342,3 +437,79 @@ class DailyGraphsPage(QWidget):
             except Exception as e:
                 QMessageBox.critical(self, "Kaydetme Hatası", f"Grafik kaydedilirken bir hata oluştu: {e}")
                 logging.exception("Grafik kaydetme hatası.")
+
+    def save_all_graphs_as_images(self) -> None:
+        """Seçili tarihteki tüm grafikleri, seçilen dizine süreç havuzunda paralel çizerek PNG olarak kaydeder."""
+        if not self.results:
+            QMessageBox.warning(self, "Kaydedilecek Grafik Yok", "Görüntülenecek bir grafik bulunmamaktadır.")
+            return
+        if self.batch_worker and self.batch_worker.isRunning():
+            QMessageBox.information(self, "Kaydediliyor", "Grafikler hâlâ kaydediliyor, lütfen bekleyin.")
+            return
+
+        output_dir = QFileDialog.getExistingDirectory(self, "Grafiklerin Kaydedileceği Klasör", str(Path.home()))
+        if not output_dir:
+            return
+
+        self.btn_save_all.setEnabled(False)
+        self.progress.setValue(0)
+        self.progress.show()
+        self.batch_worker = BatchRenderWorker(self.results, Path(output_dir),
+                                              self.main_window.selected_grouping_val, self.current_graph_type)
+        self.batch_worker.progress.connect(self.progress.setValue)
+        self.batch_worker.finished.connect(self.on_batch_saved)
+        self.batch_worker.error.connect(self.on_batch_error)
+        self.batch_worker.start()
+
+    def on_batch_saved(self, written: List[Path]) -> None:
+        """Toplu kaydetme bittiğinde kullanıcıyı bilgilendirir."""
+        self.progress.hide()
+        self.btn_save_all.setEnabled(bool(self.results))
+        if written:
+            QMessageBox.information(self, "Kaydedildi",
+                                    f"{len(written)} grafik kaydedildi: {written[0].parent}")
+
+    def on_batch_error(self, message: str) -> None:
+        """Toplu kaydetmede oluşan hatayı gösterir."""
+        self.progress.hide()
+        self.btn_save_all.setEnabled(bool(self.results))
+        QMessageBox.critical(self, "Kaydetme Hatası", message)
+
+    def export_all_graphs_as_pdf(self) -> None:
+        """Seçili tarihteki tüm grafikleri, her biri bir sayfa olacak şekilde tek bir PDF dosyasına kaydeder."""
+        if not self.results:
+            QMessageBox.warning(self, "Kaydedilecek Grafik Yok", "Görüntülenecek bir grafik bulunmamaktadır.")
+            return
+        if self.pdf_worker and self.pdf_worker.isRunning():
+            QMessageBox.information(self, "Kaydediliyor", "PDF hâlâ kaydediliyor, lütfen bekleyin.")
+            return
+
+        grouping_val = self.main_window.selected_grouping_val
+        default_filename = f"grafikler_{grouping_val}_{self.current_graph_type}.pdf".replace(" ", "_").replace("/", "-")
+        filepath, _ = QFileDialog.getSaveFileName(self, "Grafikleri PDF Olarak Kaydet", default_filename,
+                                                  "PDF (*.pdf)")
+        if not filepath:
+            return
+
+        self.btn_export_pdf.setEnabled(False)
+        self.progress.setValue(0)
+        self.progress.show()
+        export = functools.partial(export_daily_pdf, list(self.results), Path(filepath), grouping_val,
+                                   self.current_graph_type)
+        self.pdf_worker = PdfExportWorker(Path(filepath), export)
+        self.pdf_worker.progress.connect(self.progress.setValue)
+        self.pdf_worker.finished.connect(self.on_pdf_exported)
+        self.pdf_worker.error.connect(self.on_pdf_export_error)
+        self.pdf_worker.start()
+
+    def on_pdf_exported(self, filepath: str, pages: int) -> None:
+        """PDF kaydetme bittiğinde kullanıcıyı bilgilendirir."""
+        self.progress.hide()
+        self.btn_export_pdf.setEnabled(bool(self.results))
+        QMessageBox.information(self, "Kaydedildi", f"{pages} grafik PDF olarak kaydedildi: {filepath}")
+
+    def on_pdf_export_error(self, message: str) -> None:
+        """PDF kaydetmede oluşan hatayı gösterir."""
+        self.progress.hide()
+        self.btn_export_pdf.setEnabled(bool(self.results))
+        QMessageBox.critical(self, "Kaydetme Hatası", message)
@@ -14,6 +14,8 @@ from PyQt5.QtWidgets import (
     QSpacerItem,
 )
 
+from utils.helpers import key_equals_mask
+
 
 class DataSelectionPage(QWidget):
     """
@@ -109,8 +111,10 @@ class DataSelectionPage(QWidget):
 
         grouping_col_name = self.main_window.grouping_col_name
         if grouping_col_name and grouping_col_name in df.columns:
-            # Gruplama sütunundaki eşsiz ve boş olmayan değerleri sırala
-            grouping_vals = sorted(df[grouping_col_name].dropna().astype(str).unique())
+            # Gruplama sütunundaki eşsiz ve boş olmayan değerleri sırala (küp varsa ondan al)
+            cube = self.main_window.daily_cube
+            grouping_vals = sorted(cube.grouping_values) if cube else \
+                sorted(df[grouping_col_name].dropna().astype(str).unique())
             grouping_vals = [s for s in grouping_vals if s.strip()]  # boş stringleri çıkar
             self.cmb_grouping.addItems(grouping_vals)
             if not grouping_vals:
@@ -142,10 +146,15 @@ class DataSelectionPage(QWidget):
         df = self.main_window.df
 
         if selected_grouping_val and self.main_window.grouping_col_name and self.main_window.grouped_col_name:
-            # Seçilen gruplanma değerine göre dataframe'i filtrele
-            filtered_df = df[df[self.main_window.grouping_col_name].astype(str) == selected_grouping_val]
-            # Gruplanan sütundaki eşsiz ve boş olmayan değerleri sırala
-            grouped_vals = sorted(filtered_df[self.main_window.grouped_col_name].dropna().astype(str).unique())
+            cube = self.main_window.daily_cube
+            if cube:
+                # Seçilen tarihte satırı bulunan ürünler küpten okunur (ham satırlar taranmaz)
+                grouped_vals = cube.grouped_values_for(selected_grouping_val)
+            else:
+                # Seçilen gruplanma değerine göre dataframe'i filtrele
+                filtered_df = df[key_equals_mask(df[self.main_window.grouping_col_name], selected_grouping_val)]
+                # Gruplanan sütundaki eşsiz ve boş olmayan değerleri sırala
+                grouped_vals = sorted(filtered_df[self.main_window.grouped_col_name].dropna().astype(str).unique())
             grouped_vals = [s for s in grouped_vals if s.strip()]
 
             # Her değeri list widget'a ekle ve varsayılan seçili yap
@@ -274,10 +283,9 @@ class DataSelectionPage(QWidget):
 
         self.cmb_sheet.blockSignals(False)
 
-        # Seçili sayfayı kaydet, Excel verisini yükle ve seçim alanlarını doldur
+        # Seçili sayfayı kaydet, Excel verisini yükle (gerekirse arka planda) ve yüklenince seçim alanlarını doldur
         self.main_window.selected_sheet = self.cmb_sheet.currentText()
-        self.main_window.load_excel()
-        self._populate_data_selection_fields()
+        self.main_window.load_excel(on_loaded=self._populate_data_selection_fields)
 
     def refresh(self) -> None:
         """Sayfa görüntülendiğinde çağrılır ve verileri yeniler."""
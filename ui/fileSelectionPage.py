@@ -64,6 +64,13 @@ class FileSelectionPage(QWidget):
         self.btn_monthly_graphs.setEnabled(False)  # Başlangıçta devre dışı
         h_layout_buttons.addWidget(self.btn_monthly_graphs)
 
+        # Geçmişe ekle düğmesi (önceki ay/yıl OEE referansları bu depodan okunur)
+        self.btn_add_to_history = QPushButton("Geçmişe Ekle")
+        self.btn_add_to_history.setToolTip("Dosyayı çok aylık OEE geçmiş deposuna ekler")
+        self.btn_add_to_history.clicked.connect(self.add_to_history)
+        self.btn_add_to_history.setEnabled(False)  # Başlangıçta devre dışı
+        h_layout_buttons.addWidget(self.btn_add_to_history)
+
         h_layout_buttons.addStretch(1)  # Düğmeleri ortaya hizala
         layout.addLayout(h_layout_buttons)
 
@@ -82,11 +89,14 @@ class FileSelectionPage(QWidget):
             return  # Dosya seçilmediyse fonksiyonu bitir
 
         try:
+            # Çalışma kitabı yalnızca bir kez açılır: sayfa isimleri burada okunur, gerekli tüm sayfalar
+            # arka planda tek geçişte ayrıştırılıp önbelleğe alınır (günlük ve aylık sayfalar bu sonucu paylaşır)
             xls = pd.ExcelFile(path)
             # Dosyadaki sayfalarla gereken sayfaların kesişimi
             sheets = sorted(list(REQ_SHEETS.intersection(set(xls.sheet_names))))
 
             if not sheets:
+                xls.close()
                 # Gerekli sayfalar yoksa uyarı göster
                 QMessageBox.warning(
                     self,
@@ -104,16 +114,21 @@ class FileSelectionPage(QWidget):
             # Varsayılan sayfa olarak "SMD-OEE" varsa onu seç, yoksa ilkini seç
             if "SMD-OEE" in sheets:
                 self.main_window.selected_sheet = "SMD-OEE"
-            elif sheets:
-                self.main_window.selected_sheet = sheets[0]
             else:
-                self.main_window.selected_sheet = None  # Uygun sayfa yok
+                self.main_window.selected_sheet = sheets[0]
 
-            # Grafik sayfalarına geçiş düğmelerini etkinleştir
-            self.btn_daily_graphs.setEnabled(True)
-            self.btn_monthly_graphs.setEnabled(True)
+            def on_loaded() -> None:
+                # Grafik sayfalarına geçiş düğmelerini etkinleştir
+                self.btn_daily_graphs.setEnabled(True)
+                self.btn_monthly_graphs.setEnabled(True)
+                # Düğme yalnızca dosyanın bu sürümünün depoya eklenmemiş bir sayfası varsa etkin olur
+                history = self.main_window.workbook_cache.history
+                self.btn_add_to_history.setEnabled(bool(history and history.enabled) and not all(
+                    history.is_ingested(path, sheet_name) for sheet_name in sheets))
+                logging.info("Dosya seçildi: %s", path)
 
-            logging.info("Dosya seçildi: %s", path)
+            # Okuma arka planda yapılır; iptal veya hata durumunda sayfa sıfırlanır (xls'i worker kapatır)
+            self.main_window.start_loading(sheets, on_loaded=on_loaded, on_failed=self.reset_page, excel_file=xls)
 
         except Exception as e:
             # Dosya okuma veya işleme hatası durumunda uyarı göster ve sayfayı sıfırla
@@ -143,8 +158,21 @@ class FileSelectionPage(QWidget):
             QMessageBox.warning(self, "Uyarı", "Aylık grafikler için uygun sayfa bulunamadı.")
             return
 
-        self.main_window.load_excel()  # Seçilen sayfayı yükle
-        self.main_window.goto_page(3)
+        # Seçilen sayfa yüklendiğinde (gerekirse arka planda) aylık sayfaya geç
+        self.main_window.load_excel(on_loaded=lambda: self.main_window.goto_page(3))
+
+    def add_to_history(self) -> None:
+        """Seçili dosyanın uygun sayfalarını (gerekirse arka planda yükleyip) geçmiş deposuna ekler."""
+        if not self.main_window.excel_path or not self.main_window.available_sheets:
+            return
+
+        def on_added() -> None:
+            self.btn_add_to_history.setEnabled(False)  # Aynı dosya sürümü ikinci kez eklenmez
+            QMessageBox.information(self, "Geçmişe Eklendi",
+                                    "Dosya OEE geçmiş deposuna eklendi; önceki ay/yıl OEE referansları "
+                                    "bu verilerden hesaplanacak.")
+
+        self.main_window.start_loading(self.main_window.available_sheets, on_loaded=on_added, add_to_history=True)
 
     def reset_page(self):
         """Sayfayı ilk haline döndürür: dosya seçimini iptal eder ve butonları pasif yapar."""
@@ -154,3 +182,4 @@ class FileSelectionPage(QWidget):
         self.lbl_path.setText("Henüz dosya seçilmedi")
         self.btn_daily_graphs.setEnabled(False)
         self.btn_monthly_graphs.setEnabled(False)
+        self.btn_add_to_history.setEnabled(False)
@@ -1,14 +1,20 @@
 import logging
 from pathlib import Path
-from typing import List
+from typing import Callable, List
 import pandas as pd
-from PyQt5.QtWidgets import QMainWindow, QStackedWidget, QMessageBox
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QMainWindow, QStackedWidget, QMessageBox, QProgressDialog
 
 from ui.fileSelectionPage import FileSelectionPage
 from ui.dataSelectionPage import DataSelectionPage
 from ui.dailyGraphPage import DailyGraphsPage
 from ui.monthlyGraphPage import MonthlyGraphsPage
-from utils.helpers import excel_col_to_index
+from utils.helpers import detect_sheet_columns
+from logic.workbookCache import CacheKey, WorkbookCache
+from logic.sidecarCache import SidecarCache
+from logic.historyStore import HistoryStore
+from logic.loaderWorker import LoaderWorker
+from logic.dailyCube import DailyAggregateCube
 
 class MainWindow(QMainWindow):
     """Ana uygulama penceresini temsil eder. Sayfalar arası geçişi yönetir ve global verileri tutar."""
@@ -20,6 +26,9 @@ class MainWindow(QMainWindow):
         self.selected_sheet: str | None = None
         self.available_sheets: List[str] = []
         self.df: pd.DataFrame = pd.DataFrame()
+        # Aktif df'in önbellek anahtarı (dosya, mtime, boyut, sayfa); önbellekteki paylaşılan DataFrame'e
+        # kimlik bilgisi yazılmaz
+        self.loaded_sheet_key: CacheKey | None = None
         self.grouping_col_name: str | None = None
         self.grouped_col_name: str | None = None
         self.oee_col_name: str | None = None
@@ -27,6 +36,17 @@ class MainWindow(QMainWindow):
         self.grouped_values: List[str] = []
         self.selected_metrics: List[str] = []
         self.selected_grouping_val: str = ""
+        # Ayrıştırılmış sayfaların önbelleği (sayfa geçişlerinde dosyanın tekrar okunmasını önler);
+        # bellekte olmayan sayfalar önce diskteki Feather yan dosyalarından aranır. Ay bölümlü geçmiş
+        # deposundan referans OEE'ler okunur; dosyalar depoya yalnızca "Geçmişe Ekle" ile eklenir
+        self.workbook_cache = WorkbookCache(sidecar=SidecarCache(), history=HistoryStore())
+        # Excel okumasını GUI iş parçacığı dışında yapan worker ve ilerleme penceresi
+        self.loader_worker: LoaderWorker | None = None
+        self.loader_dialog: QProgressDialog | None = None
+        # Aktif sayfanın (tarih, ürün) hücrelerine ait önceden hesaplanmış toplamlar ve sayfa başına
+        # önbelleği (küpler LoaderWorker'da oluşturulur; oluşturulamayan sayfalar None tutar)
+        self.daily_cube: DailyAggregateCube | None = None
+        self.daily_cubes: dict[tuple, DailyAggregateCube | None] = {}
 
         # Sayfaları yönetmek için QStackedWidget kullanımı
         self.stacked_widget = QStackedWidget()
@@ -201,92 +221,148 @@ class MainWindow(QMainWindow):
         elif index == 3:
             self.monthly_graphs_page.enter_page()
 
-    def load_excel(self) -> None:
+    def start_loading(self, sheet_names: List[str], on_loaded: Callable[[], None],
+                      on_failed: Callable[[], None] | None = None,
+                      excel_file: pd.ExcelFile | None = None, cube_sheets: List[str] | None = None,
+                      add_to_history: bool = False) -> None:
+        """
+        Verilen sayfaları arka planda (LoaderWorker) önbelleğe yükler. Yükleme sürerken iptal
+        düğmeli bir ilerleme penceresi gösterilir ve arayüz donmaz.
+
+        Args:
+            sheet_names: Yüklenecek sayfa adları.
+            on_loaded: Yükleme başarıyla bitince çağrılır.
+            on_failed: Yükleme hata verirse veya iptal edilirse çağrılır.
+            excel_file: Zaten açılmış pd.ExcelFile (worker kullanır ve iş bitince kapatır).
+            cube_sheets: Günlük toplam küpü worker'da oluşturulacak sayfalar.
+            add_to_history: Yüklenen sayfalar geçmiş deposuna da eklensin mi.
+        """
+        # Önceki yükleme sürüyorsa iptal et (bir sonraki parçada durur)
+        if self.loader_worker and self.loader_worker.isRunning():
+            self.loader_worker.cancel()
+            self.loader_worker.wait()
+
+        self.loader_dialog = QProgressDialog("Excel dosyası yükleniyor…", "İptal", 0, 100, self)
+        self.loader_dialog.setWindowTitle("Yükleniyor")
+        self.loader_dialog.setWindowModality(Qt.WindowModal)
+        self.loader_dialog.setMinimumDuration(300)  # Önbellekten gelen hızlı yüklemelerde pencere açılmasın
+        self.loader_dialog.setAutoClose(False)
+        self.loader_dialog.setAutoReset(False)
+        self.loader_dialog.setValue(0)
+
+        self.loader_worker = LoaderWorker(self.workbook_cache, self.excel_path, sheet_names, excel_file=excel_file,
+                                          cube_sheets=cube_sheets, add_to_history=add_to_history)
+        dialog = self.loader_dialog
+        excel_path = self.excel_path
+
+        def finish(callback: Callable[[], None] | None) -> None:
+            dialog.close()
+            if callback:
+                callback()
+
+        def on_finished(cubes: dict) -> None:
+            self._store_daily_cubes(excel_path, cubes)
+            finish(on_loaded)
+
+        def on_error(message: str) -> None:
+            dialog.close()
+            QMessageBox.critical(self, "Veri Yükleme Hatası", message)
+            if on_failed:
+                on_failed()
+
+        self.loader_worker.progress.connect(dialog.setValue)
+        self.loader_worker.rows_loaded.connect(
+            lambda sheet, rows_done, rows_total: dialog.setLabelText(
+                f"'{sheet}' sayfası okunuyor… {rows_done} / {rows_total} satır"))
+        self.loader_worker.finished.connect(lambda _loaded, cubes: on_finished(cubes))
+        self.loader_worker.cancelled.connect(lambda: finish(on_failed))
+        self.loader_worker.error.connect(on_error)
+        dialog.canceled.connect(self.loader_worker.cancel)
+        self.loader_worker.start()
+
+    def load_excel(self, on_loaded: Callable[[], None] | None = None) -> None:
         """
         Seçilen Excel dosyasını ve sayfasını yükler.
-        Sütun isimlerini dinamik olarak tanımlar ve metrik sütunlarını belirler.
+        Sayfa bellekteki önbellekte değilse arka planda yüklenir; sayfa hazır olduğunda on_loaded
+        çağrılır. Yükleme iptal edilir veya hata verirse dosya seçim sayfasına dönülür.
         """
         # Excel yolu veya seçilen sayfa boşsa işlemi durdur
         if not self.excel_path or not self.selected_sheet:
             logging.warning("load_excel: Excel yolu veya seçilen sayfa boş. Veri yüklenemiyor.")
             return
 
-        # Eğer aynı dosya ve sayfa zaten yüklüyse tekrar yüklemeyi önle
+        # Eğer aynı dosya (aynı sürümü) ve sayfa zaten yüklüyse tekrar yüklemeyi önle
         # Bu, gereksiz dosya okuma işlemlerini azaltarak performansı artırır.
-        if not self.df.empty and self.df.attrs.get('excel_path') == self.excel_path and \
-                self.df.attrs.get('selected_sheet') == self.selected_sheet:
+        try:
+            sheet_key = self.workbook_cache.make_key(self.excel_path, self.selected_sheet)
+        except OSError:
+            sheet_key = None  # Dosyaya erişilemiyorsa aşağıdaki yükleme hatayı bildirir
+        if not self.df.empty and sheet_key is not None and sheet_key == self.loaded_sheet_key:
             logging.info(f"'{self.selected_sheet}' sayfasındaki veriler zaten yüklü. Yeniden yüklenmiyor.")
+            if on_loaded:
+                on_loaded()
             return
 
+        def apply_and_notify() -> None:
+            self._apply_loaded_sheet()
+            if on_loaded:
+                on_loaded()
+
+        def on_failed() -> None:
+            self.df = pd.DataFrame()
+            self.loaded_sheet_key = None
+            self.goto_page(0)
+
+        # Sayfa ve küpü bellekte hazırsa doğrudan kullan, değilse arka planda yükle (bellekteki sayfa
+        # için worker yalnızca küpü oluşturur)
+        if self.workbook_cache.get(self.excel_path, self.selected_sheet) is not None and \
+                self.workbook_cache.make_key(self.excel_path, self.selected_sheet) in self.daily_cubes:
+            apply_and_notify()
+        else:
+            self.start_loading([self.selected_sheet], on_loaded=apply_and_notify, on_failed=on_failed,
+                               cube_sheets=[self.selected_sheet])
+
+    def _apply_loaded_sheet(self) -> None:
+        """
+        Önbelleğe yüklenmiş seçili sayfayı aktif DataFrame yapar.
+        Sütun isimlerini dinamik olarak tanımlar ve metrik sütunlarını belirler.
+        """
         try:
-            # Excel dosyasını belirtilen sayfadan yükle, ilk satırı başlık olarak kullan
-            self.df = pd.read_excel(self.excel_path, sheet_name=self.selected_sheet, header=0)
-            # Sütun isimlerini string tipine dönüştür
-            self.df.columns = self.df.columns.astype(str)
-
-            # Yüklenen dosya ve sayfa bilgilerini DataFrame özniteliklerine kaydet
-            self.df.attrs['excel_path'] = self.excel_path
-            self.df.attrs['selected_sheet'] = self.selected_sheet
+            # Sayfayı önbellekten al (ilk satır başlık, sütun isimleri string)
+            sheet_key = self.workbook_cache.make_key(self.excel_path, self.selected_sheet)
+            self.df = self.workbook_cache.load_sheet(self.excel_path, self.selected_sheet)
+            self.loaded_sheet_key = sheet_key
 
             logging.info("Veri '%s' sayfasından yüklendi. Satır sayısı: %d", self.selected_sheet, len(self.df))
 
-            # Sütun isimlerini dinamik olarak belirle (Excel sütun indekslerine göre)
-            # A sütunu gruplama (tarih), B sütunu gruplanan (ürün)
-            self.grouping_col_name = self.df.columns[excel_col_to_index('A')]
-            self.grouped_col_name = self.df.columns[excel_col_to_index('B')]
-            self.oee_col_name = None
-            self.metric_cols = []
-
-            # Seçilen sayfaya göre OEE ve metrik sütunlarını belirle
-            if self.selected_sheet == "SMD-OEE":
-                # OEE sütunu BP'de
-                self.oee_col_name = self.df.columns[excel_col_to_index('BP')] if excel_col_to_index('BP') < len(
-                    self.df.columns) else None
-                # Metrik sütunları H'den BD'ye kadar, AP hariç
-                start_col_index = excel_col_to_index('H')
-                end_col_index = excel_col_to_index('BD')
-                ap_col_index = excel_col_to_index('AP') # Hariç tutulacak sütun
-                for i in range(start_col_index, end_col_index + 1):
-                    if i < len(self.df.columns) and i != ap_col_index:
-                        self.metric_cols.append(self.df.columns[i])
-            elif self.selected_sheet == "ROBOT":
-                # ROBOT sayfası için OEE sütunu BG olarak belirtildi, ancak mevcut kodda kullanılmıyor.
-                # Eğer ROBOT sayfası için de OEE grafiği çizilecekse bu kısım güncellenmeli.
-                # Günlük grafiklerde OEE sütunu kullanılmadığı için burada sadece metrikler tanımlanır.
-                # Metrik sütunları H'den AU'ya kadar, AO hariç
-                start_col_index = excel_col_to_index('H')
-                end_col_index = excel_col_to_index('AU')
-                ao_col_index = excel_col_to_index('AO') # Hariç tutulacak sütun
-
-                for i in range(start_col_index, end_col_index + 1):
-                    if i < len(self.df.columns) and i != ao_col_index:
-                        self.metric_cols.append(self.df.columns[i])
-            elif self.selected_sheet == "DALGA_LEHİM":
-                # OEE sütunu BP'de
-                self.oee_col_name = self.df.columns[excel_col_to_index('BP')] if excel_col_to_index('BP') < len(
-                    self.df.columns) else None
-                # Metrik sütunları H'den BD'ye kadar, AP hariç
-                start_col_index = excel_col_to_index('H')
-                end_col_index = excel_col_to_index('BD')
-                ap_col_index = excel_col_to_index('AP') # Hariç tutulacak sütun
-                for i in range(start_col_index, end_col_index + 1):
-                    if i < len(self.df.columns) and i != ap_col_index:
-                        self.metric_cols.append(self.df.columns[i])
-            elif self.selected_sheet == "KAPLAMA-OEE":
-                # OEE sütunu BG'de
-                self.oee_col_name = self.df.columns[excel_col_to_index('BG')] if excel_col_to_index('BG') < len(
-                    self.df.columns) else None
-                # KAPLAMA-OEE için özel metrik sütunları tanımlanmadıysa, boş bırakılır veya varsayılan atanır.
-                # Bu sayfa için sadece OEE grafiği istendiği için metrikler boş kalabilir.
-                self.metric_cols = []
+            # Sütun isimlerini dinamik olarak belirle (Excel sütun harflerine göre; sayfa
+            # SHEET_COLUMN_LAYOUT ile projekte okunduğu için konumlar sheet_column_name ile çözülür)
+            (self.grouping_col_name, self.grouped_col_name,
+             self.oee_col_name, self.metric_cols) = detect_sheet_columns(self.df, self.selected_sheet)
 
             logging.info("Gruplama sütunu tanımlandı: %s", self.grouping_col_name)
             logging.info("Gruplanan sütun tanımlandı: %s", self.grouped_col_name)
             logging.info("OEE sütunu tanımlandı: %s", self.oee_col_name)
             logging.info("Metrik sütunları tanımlandı: %s", self.metric_cols)
 
+            self.daily_cube = self.daily_cubes.get(sheet_key)
+
         except Exception as e:
             # Hata durumunda kullanıcıya bilgi ver ve DataFrame'i sıfırla
             QMessageBox.critical(self, "Veri Yükleme Hatası", f"Veri yüklenirken bir hata oluştu: {e}")
             logging.exception("Excel veri yükleme hatası.")
             self.df = pd.DataFrame() # Hata durumunda boş DataFrame ata
+            self.loaded_sheet_key = None
+            self.daily_cube = None
+
+    def _store_daily_cubes(self, excel_path: Path, cubes: dict) -> None:
+        """
+        LoaderWorker'ın oluşturduğu küpleri sayfa başına önbelleğe alır. Yalnızca aktif dosyanın
+        (güncel sürümünün) küpleri tutulur.
+        """
+        if not cubes:
+            return
+        new_cubes = {self.workbook_cache.make_key(excel_path, sheet_name): cube for sheet_name, cube in cubes.items()}
+        file_key = next(iter(new_cubes))[:3]
+        self.daily_cubes = {k: v for k, v in self.daily_cubes.items() if k[:3] == file_key}
+        self.daily_cubes.update(new_cubes)
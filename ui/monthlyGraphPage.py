@@ -1,17 +1,15 @@
 import logging  # Loglama işlemleri için kullanılan modül
-import datetime  # Tarih ve saat manipülasyonları için kullanılan modül
 from pathlib import Path  # Dosya yolu işlemleri için kullanılan modül
 
-from typing import List, Tuple, Any, Union, Dict  # Tip ipuçları için kullanılan modüller
+import functools  # Çizim fonksiyonuna parametre bağlamak için
+from typing import Callable, List, Tuple, Any, Union, Dict  # Tip ipuçları için kullanılan modüller
 
-import pandas as pd  # Veri manipülasyonu ve analizi için kullanılan kütüphane
 import numpy as np  # Sayısal işlemler için kullanılan kütüphane
 
-import matplotlib.pyplot as plt  # Grafik çizimi için kullanılan kütüphane
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas  # Matplotlib figürlerini Qt widget'ı olarak gömmek için
-from matplotlib.ticker import PercentFormatter  # Y ekseninde yüzde formatı için
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # Kaydedilen grafiğin sabit boyutlu çizimi için
+from matplotlib.figure import Figure  # Arka planda çizilen figür tipi için
 
-from PyQt5.QtCore import Qt  # Qt temel sınıfları ve sabitleri için
+from PyQt5.QtCore import Qt, QTimer  # Qt temel sınıfları, sabitleri ve zamanlayıcı için
 from PyQt5.QtWidgets import (  # Qt widget'ları için
     QWidget,  # Temel widget sınıfı
     QFileDialog,  # Dosya iletişim kutusu için
@@ -25,11 +23,19 @@ from PyQt5.QtWidgets import (  # Qt widget'ları için
     QScrollArea,  # Kaydırılabilir alan widget'ı için
     QFrame,  # Çerçeve widget'ı için
     QLineEdit,  # Tek satırlık metin giriş kutusu için
+    QSpinBox,  # Pareto eşiği girişi için
     QSizePolicy  # Widget'ların boyutlandırma politikası için
 )
 from PyQt5 import QtGui  # QtGui modülü (QDoubleValidator için)
 
+from config.constants import EXPORT_DPI, PARETO_THRESHOLD_PERCENT  # Kaydetme çözünürlüğü ve varsayılan Pareto eşiği
+from logic.monthlyEngine import FiguresData, ReferenceOee  # Aylık grafik verisi ve geçmişten okunan OEE referansları
 from logic.monthlyGraphWorker import MonthlyGraphWorker  # Arka planda grafik oluşturma işlemlerini yürüten worker sınıfı
+from logic.graphPlotter import GraphPlotter  # Aylık grafiklerin çizimi için
+from logic.chartRenderWorker import ChartRenderWorker  # Grafikleri GUI iş parçacığı dışında çizen worker
+from logic.pdfExporter import export_monthly_pdf  # Tüm aylık grafikleri tek PDF'e yazmak için
+from logic.pdfExportWorker import PdfExportWorker  # PDF'i arka planda yazan worker
+from utils.helpers import SheetColumns  # Worker'a iletilen sayfa sütun adları
 
 class MonthlyGraphsPage(QWidget):
     """Aylık grafikler ve veri seçim sayfasını temsil eder."""
@@ -49,11 +55,28 @@ class MonthlyGraphsPage(QWidget):
         self.monthly_chart_layout = QVBoxLayout(self.monthly_chart_container)
         self.monthly_chart_layout.setAlignment(Qt.AlignCenter)  # Ortalamak için hizalama
 
+        # Grafikler arka planda Agg ile çizilip bu etikette resim olarak gösterilir (etkileşimli tuval gerekmez)
+        self.monthly_chart_label = QLabel(alignment=Qt.AlignCenter)
+        self.monthly_chart_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)  # Resim boyutu yerleşimi büyütmesin
+        self.monthly_chart_label.hide()  # İlk grafik çizilene kadar gizli
+        self.monthly_chart_layout.addWidget(self.monthly_chart_label, stretch=1)  # Layout'a bir kez eklenir
+
+        # Arka plan çizimi: son istek numarası, sırada bekleyen istek ve çalışan worker
+        self.render_worker: ChartRenderWorker | None = None
+        self._render_request_id = 0
+        self._pending_render: Tuple[int, Callable[[Figure], None], int, int, float] | None = None
+        self._monthly_chart_rgba: np.ndarray | None = None  # Gösterilen resmin arabelleği (QImage bunu paylaşır)
+        # Pencere boyutu değiştiğinde grafik yeni boyutta yeniden çizilir (kısa gecikmeyle)
+        self._resize_render_timer = QTimer(self, singleShot=True, interval=200)
+        self._resize_render_timer.timeout.connect(self._rerender_current_monthly_chart)
+
         self.current_monthly_chart_figure = None  # Mevcut gösterilen Matplotlib figürü
         # Oluşturulan tüm figür verilerini saklayan liste (isim ve grafik verisi)
-        self.figures_data_monthly: List[Tuple[str, Union[List[dict[str, Any]], Dict[str, Any]]]] = []
+        self.figures_data_monthly: FiguresData = []
         self.current_page_monthly = 0  # Mevcut grafik sayfasının indeksi
         self.monthly_worker: MonthlyGraphWorker | None = None  # Aylık grafik oluşturma worker'ı
+        self.cancelled_monthly_workers: List[MonthlyGraphWorker] = []  # İptal edilip henüz bitmemiş worker'lar
+        self.pdf_worker: PdfExportWorker | None = None  # Tüm grafikleri PDF'e yazan worker
         self.prev_year_oee_for_plot: float | None = None  # Önceki yılın OEE değeri (grafik çizimi için)
         self.prev_month_oee_for_plot: float | None = None  # Önceki ayın OEE değeri (grafik çizimi için)
         self.current_graph_mode: str = "hat"  # Varsayılan grafik modu ("hat" veya "page")
@@ -61,6 +84,8 @@ class MonthlyGraphsPage(QWidget):
         # Her hat/sayfa için OEE değerlerini saklamak için dictionary
         # Anahtar: Hat/Sayfa adı (string), Değer: (Önceki Yıl OEE, Önceki Ay OEE) tuple'ı
         self.cached_oee_values: Dict[str, Tuple[float | None, float | None]] = {}
+        # Son hesaplamada geçmiş deposundan otomatik okunan değerler (kullanıcı değiştirmediyse yenilenir)
+        self.reference_oee_values: ReferenceOee = {}
 
         self.init_ui()  # Kullanıcı arayüzünü başlatır
 
@@ -150,9 +175,28 @@ class MonthlyGraphsPage(QWidget):
         left_panel_layout.addWidget(self.oee_options_widget)
         left_panel_layout.addStretch(1)  # Kalan boşluğu doldurmak için esnek boşluk
 
-        # Diğer grafik türleri için boş widget (şimdilik)
+        # Diğer grafik türleri için seçenekler widget'ı
         self.other_graphs_widget = QWidget()
         other_graphs_layout = QVBoxLayout(self.other_graphs_widget)
+
+        # Dizgi Duruş Grafiği için Pareto seçenekleri (eşik ve genel/hat Pareto seçimi)
+        self.pareto_options_widget = QWidget()
+        pareto_options_layout = QVBoxLayout(self.pareto_options_widget)
+        pareto_options_layout.addWidget(QLabel("<b>Pareto Eşiği (%):</b>"))
+        self.spn_pareto_threshold = QSpinBox()
+        self.spn_pareto_threshold.setRange(1, 100)
+        self.spn_pareto_threshold.setValue(int(PARETO_THRESHOLD_PERCENT))
+        # Eşik değiştiğinde Pareto kısa bir gecikmeyle yeniden hesaplanır (ardışık değişiklikler birleştirilir)
+        self._pareto_threshold_timer = QTimer(self, singleShot=True, interval=300)
+        self._pareto_threshold_timer.timeout.connect(self._on_pareto_threshold_changed)
+        self.spn_pareto_threshold.valueChanged.connect(self._pareto_threshold_timer.start)
+        pareto_options_layout.addWidget(self.spn_pareto_threshold)
+        pareto_options_layout.addSpacing(10)
+        pareto_options_layout.addWidget(QLabel("<b>Pareto Kapsamı:</b>"))
+        self.cmb_pareto_scope = QComboBox()  # Genel Pareto ve hat Pareto'ları (hesaplamadan sonra doldurulur)
+        self.cmb_pareto_scope.currentIndexChanged.connect(self._on_pareto_scope_changed)
+        pareto_options_layout.addWidget(self.cmb_pareto_scope)
+        other_graphs_layout.addWidget(self.pareto_options_widget)
         left_panel_layout.addWidget(self.other_graphs_widget)
         self.other_graphs_widget.hide()  # Başlangıçta gizli
 
@@ -204,6 +248,11 @@ class MonthlyGraphsPage(QWidget):
         self.btn_save_monthly_chart.setEnabled(False)  # Başlangıçta devre dışı
         nav_bottom.addStretch(1)  # Butonları sağa yaslamak için esnek boşluk
         nav_bottom.addWidget(self.btn_save_monthly_chart)
+
+        self.btn_export_monthly_pdf = QPushButton("Tümünü Kaydet (PDF)")
+        self.btn_export_monthly_pdf.clicked.connect(self._export_monthly_charts_as_pdf)  # Tüm grafikleri PDF'e yazar
+        self.btn_export_monthly_pdf.setEnabled(False)  # Başlangıçta devre dışı
+        nav_bottom.addWidget(self.btn_export_monthly_pdf)
         right_panel_layout.addLayout(nav_bottom)
 
         # Ana içerik layout'una sağ paneli ekle
@@ -259,8 +308,12 @@ class MonthlyGraphsPage(QWidget):
         self.clear_monthly_chart_canvas()  # Grafik tuvalini temizle
         self.btn_save_monthly_chart.setEnabled(False)  # Kaydet butonunu devre dışı bırak
         self.figures_data_monthly.clear()  # Önbellekteki grafik verilerini temizle
+        self.btn_export_monthly_pdf.setEnabled(False)  # PDF'e aktarılacak grafik kalmadı
         self.current_page_monthly = 0  # Sayfa indeksini sıfırla
         self.cached_oee_values.clear()  # Grafik tipi değiştiğinde önbelleği temizle
+        self.reference_oee_values.clear()
+        self._set_pareto_scope_items([])
+        self.pareto_options_widget.setVisible(selected_type == "Dizgi Duruş Grafiği")
         self.txt_prev_year_oee.clear()  # OEE seçildiğinde giriş alanlarını temizle
         self.txt_prev_month_oee.clear()
 
@@ -299,12 +352,21 @@ class MonthlyGraphsPage(QWidget):
         self.update_monthly_navigation_buttons(graph_mode=self.current_graph_mode)
 
     def clear_monthly_chart_canvas(self):
-        """Aylık grafik tuvallerini temizler."""
-        # monthly_chart_layout içindeki tüm widget'ları siler
-        while self.monthly_chart_layout.count():
-            item = self.monthly_chart_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
+        """Aylık grafik alanını temizler: grafik resmini gizler, diğer widget'ları (örn. bilgi etiketi) siler."""
+        # Süren veya bekleyen çizimlerin sonuçları artık gösterilmez
+        self._render_request_id += 1
+        self._pending_render = None
+        self.monthly_chart_label.hide()
+        self.monthly_chart_label.clear()
+        self._monthly_chart_rgba = None
+        self._remove_monthly_info_widgets()
+
+    def _remove_monthly_info_widgets(self) -> None:
+        """Grafik alanındaki grafik dışı widget'ları (örn. 'veri yok' etiketi) siler."""
+        for i in reversed(range(self.monthly_chart_layout.count())):
+            widget = self.monthly_chart_layout.itemAt(i).widget()
+            if widget is not None and widget is not self.monthly_chart_label:
+                self.monthly_chart_layout.takeAt(i)
                 widget.deleteLater()  # Widget'ı güvenli bir şekilde sil
 
     def _start_monthly_graph_worker(self, graph_mode: str):
@@ -325,6 +387,7 @@ class MonthlyGraphsPage(QWidget):
         self.clear_monthly_chart_canvas()  # Grafik tuvalini temizle
         self.btn_save_monthly_chart.setEnabled(False)  # Kaydet butonunu devre dışı bırak
         self.figures_data_monthly.clear()  # Önceki grafik verilerini temizle
+        self.btn_export_monthly_pdf.setEnabled(False)  # PDF'e aktarılacak grafik kalmadı
         self.current_page_monthly = 0  # Sayfa indeksini sıfırla
         self.monthly_progress.setValue(0)  # İlerleme çubuğunu sıfırla
         self.monthly_progress.show()  # İlerleme çubuğunu göster
@@ -333,10 +396,8 @@ class MonthlyGraphsPage(QWidget):
         self.update_monthly_page_label(graph_mode=self.current_graph_mode)
         self.update_monthly_navigation_buttons(graph_mode=self.current_graph_mode)
 
-        # Çalışan bir worker varsa durdur ve bekle
-        if self.monthly_worker and self.monthly_worker.isRunning():
-            self.monthly_worker.quit()
-            self.monthly_worker.wait()
+        # Çalışan bir worker varsa iptal et (beklenmez; arayüz bloklanmaz)
+        self._cancel_running_monthly_worker()
 
         prev_year_oee = None
         prev_month_oee = None
@@ -357,14 +418,19 @@ class MonthlyGraphsPage(QWidget):
                 return
 
         # Yeni MonthlyGraphWorker örneği oluştur ve başlat
+        mw = self.main_window
         self.monthly_worker = MonthlyGraphWorker(
-            excel_path=self.main_window.excel_path,
-            current_df=self.main_window.df,
+            workbook_cache=mw.workbook_cache,
+            excel_path=mw.excel_path,
+            available_sheets=mw.available_sheets,
+            current_df=mw.df,
+            sheet_name=mw.selected_sheet,
+            columns=SheetColumns(mw.grouping_col_name, mw.grouped_col_name, mw.oee_col_name, mw.metric_cols),
             graph_mode=self.current_graph_mode,
             graph_type=self.cmb_monthly_graph_type.currentText(),
             prev_year_oee=prev_year_oee,  # Bu değerler worker'a iletilir
             prev_month_oee=prev_month_oee,  # Bu değerler worker'a iletilir
-            main_window=self.main_window
+            pareto_threshold=float(self.spn_pareto_threshold.value())
         )
         # Worker'ın finished sinyali _on_monthly_graphs_generated metoduna bağlanır
         self.monthly_worker.finished.connect(self._on_monthly_graphs_generated)
@@ -374,9 +440,24 @@ class MonthlyGraphsPage(QWidget):
         self.monthly_worker.error.connect(self._on_monthly_graph_error)
         self.monthly_worker.start()  # Worker'ı başlat
 
+    def _cancel_running_monthly_worker(self):
+        """
+        Çalışan MonthlyGraphWorker'a iptal isteği gönderir ve sinyallerini ayırır. Worker bir sonraki hat/sayfada
+        kendiliğinden biter; çalışan bir QThread yok edilmemesi için o zamana kadar referansı tutulur.
+        """
+        self.cancelled_monthly_workers = [worker for worker in self.cancelled_monthly_workers if worker.isRunning()]
+        if self.monthly_worker and self.monthly_worker.isRunning():
+            self.monthly_worker.cancel()
+            self.monthly_worker.finished.disconnect()
+            self.monthly_worker.progress.disconnect()
+            self.monthly_worker.error.disconnect()
+            self.cancelled_monthly_workers.append(self.monthly_worker)
+        self.monthly_worker = None
+
     def _on_monthly_graphs_generated(self,
-                                     figures_data_raw: List[Tuple[str, Union[List[dict[str, Any]], Dict[str, Any]]]],
-                                     prev_year_oee: float | None, prev_month_oee: float | None):
+                                     figures_data_raw: FiguresData,
+                                     prev_year_oee: float | None, prev_month_oee: float | None,
+                                     reference_oee: ReferenceOee):
         """
         MonthlyGraphWorker'dan gelen sonuçları işler.
 
@@ -384,7 +465,11 @@ class MonthlyGraphsPage(QWidget):
             figures_data_raw: Oluşturulan grafik verilerinin listesi.
             prev_year_oee: Hesaplamalar için kullanılan önceki yılın OEE değeri.
             prev_month_oee: Hesaplamalar için kullanılan önceki ayın OEE değeri.
+            reference_oee: Geçmiş deposundan hat/sayfa bazında okunan önceki yıl/ay OEE değerleri.
         """
+        if self.sender() is not None and self.sender() is not self.monthly_worker:
+            return  # İptal edilmiş eski worker'ın sonucu; yok say
+
         self.monthly_progress.setValue(100)  # İlerleme çubuğunu tamamla
         self.monthly_progress.hide()  # İlerleme çubuğunu gizle
 
@@ -395,22 +480,28 @@ class MonthlyGraphsPage(QWidget):
             return
 
         self.figures_data_monthly = figures_data_raw  # Grafik verilerini sakla
+        self.btn_export_monthly_pdf.setEnabled(True)  # Tüm grafikler PDF'e aktarılabilir
         self.prev_year_oee_for_plot = prev_year_oee  # Çizim için önceki yıl OEE'yi sakla
         self.prev_month_oee_for_plot = prev_month_oee  # Çizim için önceki ay OEE'yi sakla
 
         # İlk grafiğin OEE değerlerini önbelleğe al ve giriş alanlarına yükle
         if self.cmb_monthly_graph_type.currentText() == "OEE Grafikleri" and self.figures_data_monthly:
-            # Sadece worker çalıştıktan sonra ve grafikler oluştuğunda önbelleği başlangıç değerleriyle doldur.
-            # Her bir grafik için önbelleğe başlangıç değerlerini kaydet.
-            # Şu anki mantık, worker'a verdiğiniz prev_year_oee ve prev_month_oee değerlerinin
-            # ilk grafik için geçerli olmasıdır. Sonraki grafikler için bu değerlerin
-            # otomatik olarak doldurulması istenir.
+            # Her grafik için önbelleğe başlangıç değerlerini kaydet: geçmiş deposunda hat/sayfa bazında
+            # değer varsa o, yoksa giriş alanlarındaki değer kullanılır
             for name, _ in self.figures_data_monthly:
-                # Eğer daha önce kaydedilmemişse, başlangıçtaki global değerleri kullan
-                if name not in self.cached_oee_values:
-                    self.cached_oee_values[name] = (self.prev_year_oee_for_plot, self.prev_month_oee_for_plot)
+                auto_year, auto_month = reference_oee.get(name, (None, None))
+                # Kullanıcının değiştirdiği değerler korunur; önceki otomatik değerler yenilenir
+                if name not in self.cached_oee_values or \
+                        self.cached_oee_values[name] == self.reference_oee_values.get(name, (None, None)):
+                    self.cached_oee_values[name] = (
+                        auto_year if auto_year is not None else self.prev_year_oee_for_plot,
+                        auto_month if auto_month is not None else self.prev_month_oee_for_plot)
+                self.reference_oee_values[name] = (auto_year, auto_month)
             self._load_cached_oee_values(self.figures_data_monthly[self.current_page_monthly][0])
 
+        if self.cmb_monthly_graph_type.currentText() == "Dizgi Duruş Grafiği":
+            self._set_pareto_scope_items([name for name, _ in self.figures_data_monthly])
+
         self.display_current_page_graphs_monthly()  # Mevcut sayfadaki grafiği göster
         self.btn_save_monthly_chart.setEnabled(True)  # Kaydet butonunu etkinleştir
 
@@ -421,6 +512,9 @@ class MonthlyGraphsPage(QWidget):
         Args:
             message: Görüntülenecek hata mesajı.
         """
+        if self.sender() is not None and self.sender() is not self.monthly_worker:
+            return  # İptal edilmiş eski worker'ın hatası; yok say
+
         QMessageBox.critical(self, "Hata", message)  # Hata mesajı kutusu göster
         self.monthly_progress.setValue(0)  # İlerleme çubuğunu sıfırla
         self.monthly_progress.hide()  # İlerleme çubuğunu gizle
@@ -485,7 +579,8 @@ class MonthlyGraphsPage(QWidget):
 
     def display_current_page_graphs_monthly(self) -> None:
         """Mevcut sayfadaki aylık grafiği görüntüler."""
-        self.clear_monthly_chart_canvas()  # Grafik tuvalini temizle
+        # Önceki grafik, yenisi arka planda çizilene kadar ekranda kalır
+        self._remove_monthly_info_widgets()
 
         total_pages = len(self.figures_data_monthly)  # Toplam sayfa sayısını al
 
@@ -498,6 +593,7 @@ class MonthlyGraphsPage(QWidget):
         if not self.figures_data_monthly:
             # Grafik verisi yoksa bir etiket göster
             no_data_label = QLabel("Gösterilecek aylık grafik bulunamadı.", alignment=Qt.AlignCenter)
+            self.clear_monthly_chart_canvas()
             self.monthly_chart_layout.addWidget(no_data_label)
             self.current_monthly_chart_figure = None
             self.btn_save_monthly_chart.setEnabled(False)
@@ -509,6 +605,12 @@ class MonthlyGraphsPage(QWidget):
         # Mevcut sayfanın grafik verilerini al
         name, data_container = self.figures_data_monthly[self.current_page_monthly]
 
+        # Pareto kapsamı seçimini gösterilen grafikle eşitle
+        if self.cmb_pareto_scope.count() == len(self.figures_data_monthly):
+            self.cmb_pareto_scope.blockSignals(True)
+            self.cmb_pareto_scope.setCurrentIndex(self.current_page_monthly)
+            self.cmb_pareto_scope.blockSignals(False)
+
         # Değişiklik: OEE grafiği ise, giriş alanlarını güncel OEE değerleriyle doldur
         if self.cmb_monthly_graph_type.currentText() == "OEE Grafikleri":
             self._load_cached_oee_values(name)  # Önbellekteki OEE değerlerini yükle
@@ -524,332 +626,102 @@ class MonthlyGraphsPage(QWidget):
                 QMessageBox.warning(self, "Geçersiz Giriş",
                                     "Kaydedilmiş OEE değerleri geçersiz. Lütfen doğru formatta girin.")
 
-        # Matplotlib figürü ve eksenleri oluştur
-        fig_width_inches = 12.0
-        fig_height_inches = 7.0
-
-        # "Dizgi Duruş Grafiği" için yüksekliği özel olarak ayarla
-        if self.cmb_monthly_graph_type.currentText() == "Dizgi Duruş Grafiği":
-            metric_sums_dict = data_container["metrics"]
-            num_bars = len(metric_sums_dict)
-            # Çubuk sayısına göre dinamik yükseklik hesapla.
-            # Verilerinize ve istenen görünüme göre bu değerleri ayarlamanız gerekebilir.
-            # Temel bir yükseklik artı çubuk başına bir artış.
-            base_height = 6.0  # Minimum yükseklik
-            height_per_bar = 0.5  # Aşırı kalabalığı önlemek için çubuk başına ek yükseklik
-            # Etiketler ve ek açıklamalar için yeterli alan olduğundan emin olun ve aşırı uzun grafikleri önleyin
-            fig_height_inches = max(base_height, min(25.0, num_bars * height_per_bar + 2.0))
-            fig_width_inches = 14.0  # Etiketlerin daha iyi görünmesi için biraz daha geniş
-
-        fig, ax = plt.subplots(figsize=(fig_width_inches, fig_height_inches), dpi=120)
-        background_color = 'white'
-        fig.patch.set_facecolor(background_color)  # Figür arka plan rengi
-        ax.set_facecolor(background_color)  # Eksen arka plan rengi
-
-        # Çerçeve çizgilerini ayarla
-        ax.spines['top'].set_visible(False)  # Üst çerçeveyi gizle
-        ax.spines['right'].set_visible(False)  # Sağ çerçeveyi gizle
-        ax.spines['left'].set_linewidth(1.5)  # Sol çerçevenin kalınlığı
-        ax.spines['bottom'].set_linewidth(1.5)  # Alt çerçevenin kalınlığı
-        ax.grid(False)  # Izgarayı gizle
+        # Çizim (Agg ile, GUI iş parçacığı dışında) ChartRenderWorker'da yapılır; sonuç resim olarak gösterilir
+        self._request_monthly_render(name, data_container)
 
-        if self.cmb_monthly_graph_type.currentText() == "OEE Grafikleri":
-            grouped_oee = pd.DataFrame(data_container)  # Veri çerçevesi oluştur
-            grouped_oee['Tarih'] = pd.to_datetime(grouped_oee['Tarih'])  # Tarih sütununu datetime'a çevir
-
-            dates = grouped_oee['Tarih']
-            # İşlenmiş OEE değeri varsa onu kullan, yoksa ham OEE değerini kullan
-            oee_values = grouped_oee['OEE_Degeri_Processed'] if 'OEE_Degeri_Processed' in grouped_oee.columns else \
-                grouped_oee['OEE_Degeri']
-
-            line_color = '#1f77b4'  # Çizgi rengi
-
-            x_indices = np.arange(len(dates))  # X ekseni indeksleri
-            # OEE değerlerini çiz
-            ax.plot(x_indices, oee_values, marker='o', markersize=8, color=line_color, linewidth=2, label=name)
-            # Beyaz içi boş noktalarla çizgiyi vurgula
-            ax.plot(x_indices, oee_values, 'o', markersize=6, color='white', markeredgecolor=line_color,
-                    markeredgewidth=1.5, zorder=5)
-
-            # Sayfa modunda ve 'OEE_Degeri_Half' sütunu varsa çift vardiya OEE'sini çiz
-            if self.current_graph_mode == "page" and 'OEE_Degeri_Half' in grouped_oee.columns:
-                half_oee_values = grouped_oee['OEE_Degeri_Half']
-
-                # Türkçe ay isimleri sözlüğü
-                month_names_turkish = {
-                    1: "Ocak", 2: "Şubat", 3: "Mart", 4: "Nisan", 5: "Mayıs", 6: "Haziran",
-                    7: "Temmuz", 8: "Ağustos", 9: "Eylül", 10: "Ekim", 11: "Kasım", 12: "Aralık"
-                }
-                month_name_for_half_oee = ""
-                if not dates.empty:
-                    first_date_in_data = dates.min()
-                    month_name_for_half_oee = month_names_turkish.get(first_date_in_data.month,
-                                                                      first_date_in_data.strftime('%B')).capitalize()
-                else:
-                    month_name_for_half_oee = datetime.date.today().strftime('%B').capitalize()
-
-                average_half_oee = half_oee_values.mean() if not half_oee_values.empty else 0.0
-
-                half_oee_label = f"{month_name_for_half_oee} Ayı Çift Vardiya Durumunda OEE ({average_half_oee * 100:.1f}%)"
-
-                ax.plot(x_indices, half_oee_values, color='#ADD8E6', linestyle='--', linewidth=1.5,
-                        label=half_oee_label)
-                ax.plot(x_indices, half_oee_values, 'o', markersize=6, markerfacecolor='#ADD8E6',
-                        markeredgecolor='#ADD8E6', markeredgewidth=1.5, zorder=6)
-
-                if not half_oee_values.empty and len(x_indices) > 0:
-                    last_x_index = x_indices[-1]
-                    ax.annotate(f'{average_half_oee * 100:.1f}%', (last_x_index, half_oee_values.iloc[-1]),
-                                textcoords="offset points", xytext=(5, -5), ha='left', va='center',
-                                fontsize=9, fontweight='bold', color='#ADD8E6')
-
-            # Her OEE noktasına değerini etiket olarak ekle
-            for i, (x, y) in enumerate(zip(x_indices, oee_values)):
-                if pd.notna(y) and y > 0:
-                    ax.annotate(f'{y * 100:.1f}%', (x, y), textcoords="offset points", xytext=(0, 10), ha='center',
-                                fontsize=8, fontweight='bold')
-
-            overall_calculated_average = np.mean(oee_values) if not oee_values.empty else 0
-
-            # Burada self.prev_year_oee_for_plot ve self.prev_month_oee_for_plot
-            # display_current_page_graphs_monthly başında güncellendiği için doğru değerleri içerir.
-            # Önceki yıl OEE çizgisi
-            if self.prev_year_oee_for_plot is not None:
-                y_val = self.prev_year_oee_for_plot / 100
-                ax.axhline(y_val, color='red', linestyle='--', linewidth=1.5,
-                           label=f'Önceki Yıl OEE ({self.prev_year_oee_for_plot:.1f}%)')
-                ax.text(1.01, y_val, f'{self.prev_year_oee_for_plot:.1f}%',
-                        transform=ax.transAxes, color='red', va='center', ha='left', fontsize=9, fontweight='bold')
-
-            # Önceki ay OEE çizgisi
-            if self.prev_month_oee_for_plot is not None:
-                y_val = self.prev_month_oee_for_plot / 100
-                ax.axhline(y_val, color='orange', linestyle='--', linewidth=1.5,
-                           label=f'Önceki Ay OEE ({self.prev_month_oee_for_plot:.1f}%)')
-                ax.text(1.01, y_val, f'{self.prev_month_oee_for_plot:.1f}%',
-                        transform=ax.transAxes, color='orange', va='center', ha='left', fontsize=9, fontweight='bold')
-
-            # Bu ayın ortalama OEE çizgisi
-            if overall_calculated_average > 0:
-                y_val = overall_calculated_average
-                # Türkçe ay isimleri
-                month_names_turkish = {
-                    1: "Ocak", 2: "Şubat", 3: "Mart", 4: "Nisan", 5: "Mayıs", 6: "Haziran",
-                    7: "Temmuz", 8: "Ağustos", 9: "Eylül", 10: "Ekim", 11: "Kasım", 12: "Aralık"
-                }
-                month_name = ""
-                if not dates.empty:
-                    first_date_in_data = dates.min()
-                    month_name = month_names_turkish.get(first_date_in_data.month,
-                                                         first_date_in_data.strftime('%B')).capitalize()
-                else:
-                    month_name = datetime.date.today().strftime('%B').capitalize()
-
-                ax.axhline(y_val, color='purple', linestyle='--', linewidth=1.5,
-                           label=f'{month_name} OEE ({overall_calculated_average * 100:.1f}%)')
-                ax.text(1.01, y_val, f'{overall_calculated_average * 100:.1f}%',
-                        transform=ax.transAxes, color='purple', va='center', ha='left', fontsize=9, fontweight='bold')
-
-            # X ekseni etiketlerini ayarla
-            ax.set_xticks(x_indices)
-            ax.set_xticklabels([d.strftime('%d.%m.%Y') for d in dates])
-            fig.autofmt_xdate(rotation=45)  # Tarih etiketlerini otomatik döndür
-
-            # Y eksenini yüzde olarak formatla
-            ax.yaxis.set_major_formatter(PercentFormatter(xmax=1, decimals=0))
-            ax.set_yticks(np.arange(0.0, 1.001, 0.25))  # Y ekseni tick'lerini ayarla
-            ax.set_ylim(bottom=-0.05, top=1.05)  # Y ekseni limitlerini ayarla
-
-            ax.set_xlabel("Tarih", fontsize=12, fontweight='bold')  # X ekseni etiketi
-            ax.set_ylabel("OEE (%)", fontsize=12, fontweight='bold')  # Y ekseni etiketi
-
-            # Başlık için ay ismini al
-            month_names_turkish = {
-                1: "Ocak", 2: "Şubat", 3: "Mart", 4: "Nisan", 5: "Mayıs", 6: "Haziran",
-                7: "Temmuz", 8: "Ağustos", 9: "Eylül", 10: "Ekim", 11: "Kasım", 12: "Aralık"
-            }
-            month_name = ""
-            if not dates.empty:
-                first_date_in_data = dates.min()
-                month_name = month_names_turkish.get(first_date_in_data.month,
-                                                     first_date_in_data.strftime('%B')).capitalize()
-            else:
-                month_name = datetime.date.today().strftime('%B').capitalize()
-
-            # Grafik başlığını ayarla
-            if self.current_graph_mode == "page":
-                cleaned_name = name.replace('_', ' ').replace('-', ' ')
-                if cleaned_name.endswith("OEE"):
-                    cleaned_name = cleaned_name.rsplit(' ', 1)[0]
-                chart_title = f"{month_name} {cleaned_name} OEE"
-            else:
-                chart_title = f"{name} {month_name} OEE"
-
-            ax.set_title(chart_title, fontsize=24, color='#2c3e50', fontweight='bold')
-
-            ax.legend(loc='upper left', bbox_to_anchor=(1.02, 0), fontsize=10)  # Lejantı ayarla
-            fig.subplots_adjust(right=0.60)  # Lejant için sağda boşluk bırak
-
-        elif self.cmb_monthly_graph_type.currentText() == "Dizgi Onay Dağılım Grafiği":
-            labels = [d["label"] for d in data_container]  # Etiketleri al
-            values = [d["value"] for d in data_container]  # Değerleri al
-
-            colors = ['#00008B', '#ff7f0e']  # Pasta dilimi renkleri
-
-            total_sum = sum(values)  # Toplam değeri hesapla
-
-            # Pasta dilimi yüzdesini ve süresini formatlayan fonksiyon
-            def func(pct, allvals):
-                absolute = int(np.round(pct / 100. * total_sum))
-                hours = absolute // 3600
-                minutes = (absolute % 3600) // 60
-                seconds = absolute % 60
-                return f"{hours:02d}:{minutes:02d}:{seconds:02d}; {pct:.0f}%"
-
-            # Pasta grafiğini çiz
-            wedges, texts, autotexts = ax.pie(
-                values,
-                autopct=lambda pct: func(pct, values),  # Otomatik yüzde formatı
-                startangle=90,  # Başlangıç açısı
-                colors=colors,  # Renkler
-                wedgeprops=dict(edgecolor='black', linewidth=1.5)  # Dilim özellikleri
-            )
-
-            # Otomatik metin etiketlerini ayarla
-            for autotext in autotexts:
-                autotext.set_color('white')
-                autotext.set_fontsize(14)
-                autotext.set_fontweight('bold')
-
-            ax.axis('equal')  # Pasta grafiğini daire şeklinde tut
-
-            # Lejantı ayarla
-            ax.legend(wedges, labels,
-                      title="Hatlar",
-                      loc="upper right",
-                      bbox_to_anchor=(1.2, 1),
-                      fontsize=10,
-                      title_fontsize=12)
-
-            chart_title = f"Dizgi Onay Dağılımı"
-            ax.set_title(chart_title, fontsize=24, color='#2c3e50', fontweight='bold')  # Grafik başlığı
-            fig.tight_layout()  # Düzeni sıkılaştır
-
-        elif self.cmb_monthly_graph_type.currentText() == "Dizgi Duruş Grafiği":
-            metric_sums_dict = data_container["metrics"]  # Metrik toplamlarını al
-            total_overall_sum = data_container["total_overall_sum"]  # Genel toplamı al
-            cumulative_percentages_dict = data_container["cumulative_percentages"]  # Kümülatif yüzdeleri al
-
-            metric_sums = pd.Series(metric_sums_dict)  # Metrik toplamlarını Series'e çevir
-            cumulative_percentage = pd.Series(cumulative_percentages_dict)  # Kümülatif yüzdeleri Series'e çevir
-
-            ax2 = ax.twinx()  # İkinci bir y ekseni oluştur
-
-            bar_color = '#AECDCB'  # Çubuk rengi
-            line_color = '#6B0000'  # Çizgi rengi
-
-            # Çubuk grafiğini çiz (süreleri dakikaya çevirerek)
-            bars = ax.bar(metric_sums.index, metric_sums.values / 60, color=bar_color, alpha=0.8, edgecolor='black',
-                          linewidth=1.5)
-
-            # Kümülatif yüzde çizgisini çiz
-            ax2.plot(metric_sums.index, cumulative_percentage, color=line_color, linestyle='-', linewidth=2, zorder=1)
-            # Kümülatif yüzde noktalarını çiz
-            ax2.plot(metric_sums.index, cumulative_percentage, 'o', markersize=8, markerfacecolor='white',
-                     markeredgecolor=line_color, markeredgewidth=2, zorder=2)
-
-            x_min_data, x_max_data = ax.get_xlim()
-
-            # %80 Pareto çizgisini ekle
-            normalized_xmin = (0 - x_min_data) / (x_max_data - x_min_data)
-            normalized_xmax = (len(metric_sums.index) - 1 - x_min_data) / (x_max_data - x_min_data)
-            ax2.axhline(80, color='#B0B0B0', linestyle='--', linewidth=1.5, xmin=normalized_xmin, xmax=normalized_xmax)
-
-            ax.grid(False)  # Izgarayı gizle
-            ax2.grid(False)  # İkinci eksenin ızgarasını gizle
-
-            ax.set_xlabel("")  # X ekseni etiketini boş bırak
-
-            ax.set_xticks(np.arange(len(metric_sums.index)))  # X ekseni tick'lerini ayarla
-            # X ekseni etiketlerinin çakışmasını önlemek için döndürme ve hizalama ayarları
-            ax.set_xticklabels(metric_sums.index, fontsize=10, fontweight='bold', rotation=60, ha='right')
-
-            # --- DÜZELTME: text_label'ı tanımla ve açıklama mantığını geliştir ---
-            # Her çubuğa süre ve yüzde etiketleri ekle
-            for i, bar in enumerate(bars):
-                value_seconds = metric_sums.values[i]
-                percentage = (value_seconds / total_overall_sum) * 100 if total_overall_sum > 0 else 0
-                duration_hours = int(value_seconds // 3600)
-                duration_minutes = int((value_seconds % 3600) // 60)
-                duration_seconds = int(value_seconds % 60)
-
-                # Metin etiketini formatla
-                text_label = f"{duration_hours:02d}:{duration_minutes:02d}:{duration_seconds:02d}\n({percentage:.1f}%)"
-
-                # Metin etiketleri için dikey ofset hesapla
-                # Tutarlılık için sabit bir ofset kullanın veya çubuk yüksekliğine göre ayarlayın
-                # Küçük bir mutlak ofset (örn. 5 nokta) yüzde olarak ayarlamaktan daha güvenilir olabilir
-                text_offset_points = 10  # Etiketler çubuklara çok yakınsa bu değeri artırın
-
-                ax.annotate(text_label,
-                            (bar.get_x() + bar.get_width() / 2, bar.get_height()),  # Çubuğun üstünde konumlandır
-                            textcoords="offset points",  # Konumdan ofset
-                            xytext=(0, text_offset_points),  # (x_ofset, y_ofset)
-                            ha='center', va='bottom',  # Yatay ve dikey hizalama
-                            fontsize=9, fontweight='bold', color='black')  # Okunabilirlik için ayarlanmış yazı tipi boyutu
-
-            # Çizgi üzerindeki kümülatif yüzde etiketlerini ekle
-            for i, (x, y) in enumerate(zip(metric_sums.index, cumulative_percentage)):
-                ax2.annotate(f'{y:.1f}%', (x, y),
-                             textcoords="offset points", xytext=(0, -15),  # Noktanın altında ofset
-                             ha='center', va='top', fontsize=9, color=line_color, fontweight='bold')
-            # --- DÜZELTME SONU ---
-
-            ax.set_ylabel("Süre (Dakika)", fontsize=12, fontweight='bold', color=bar_color)  # Birincil y ekseni etiketi
-            ax2.set_ylabel("Kümülatif Yüzde (%)", fontsize=12, fontweight='bold', color=line_color)  # İkincil y ekseni etiketi
-
-            chart_title = "Genel Dizgi Duruş Pareto Analizi"
-            # Tarih aralığına göre başlığı güncelle
-            if not self.main_window.df.empty and 'Tarih' in self.main_window.df.columns:
-                df_dates = pd.to_datetime(self.main_window.df['Tarih'], errors='coerce').dropna()
-                if not df_dates.empty:
-                    min_date = df_dates.min()
-                    max_date = df_dates.max()
-                    month_names_turkish = {
-                        1: "Ocak", 2: "Şubat", 3: "Mart", 4: "Nisan", 5: "Mayıs", 6: "Haziran",
-                        7: "Temmuz", 8: "Ağustos", 9: "Eylül", 10: "Ekim", 11: "Kasım", 12: "Aralık"
-                    }
-                    if min_date.month == max_date.month and min_date.year == max_date.year:
-                        month_name = month_names_turkish.get(min_date.month, min_date.strftime('%B')).capitalize()
-                        chart_title = f"{month_name} Ayı Dizgi Duruşları"
-                    elif min_date.year == max_date.year:
-                        first_month_name = month_names_turkish.get(min_date.month, min_date.strftime('%B')).capitalize()
-                        last_month_name = month_names_turkish.get(max_date.month, max_date.strftime('%B')).capitalize()
-                        chart_title = f"{min_date.year} Yılı {first_month_name}-{last_month_name} Ayları Dizgi Duruşları"
-                    else:
-                        chart_title = f"{min_date.year}-{max_date.year} Yılları Dizgi Duruşları"
-
-            ax.set_title(chart_title, fontsize=24, color='#363636', fontweight='bold')
-
-            ax.set_ylim(bottom=0)  # Birincil y ekseni alt limiti
-            ax2.set_ylim(0, 100)  # İkincil y ekseni limitleri
-
-            ax.spines['top'].set_visible(False)
-            ax2.spines['top'].set_visible(False)
-
-            fig.tight_layout()  # Düzeni sıkılaştır
-
-        canvas = FigureCanvas(fig)  # Matplotlib figürünü bir Qt widget'ına dönüştür
-        canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)  # Boyut politikasını ayarla
-        self.monthly_chart_layout.addWidget(canvas, stretch=1)  # Layout'a ekle
-        canvas.draw()  # Tuvali çiz
-
-        self.current_monthly_chart_figure = fig  # Mevcut figürü sakla
-        self.btn_save_monthly_chart.setEnabled(True)  # Kaydet butonunu etkinleştir
         # Sayfa etiketini ve navigasyon butonlarını güncelle
         self.update_monthly_page_label(graph_mode=self.current_graph_mode)
         self.update_monthly_navigation_buttons(graph_mode=self.current_graph_mode)
 
+    def _monthly_draw(self, name: str,
+                      data_container: Union[List[dict[str, Any]], Dict[str, Any]]) -> Callable[[Figure], None]:
+        """Grafiği verilen boş Figure'a çizen fonksiyonu (geçerli grafik tipi ve OEE değerleriyle) döndürür."""
+        graph_type = self.cmb_monthly_graph_type.currentText()
+        source_dates = None
+        if graph_type == "Dizgi Duruş Grafiği" and 'Tarih' in self.main_window.df.columns:
+            source_dates = self.main_window.df['Tarih']
+        return functools.partial(GraphPlotter.create_monthly_chart, graph_type=graph_type,
+                                 graph_mode=self.current_graph_mode, name=name, data_container=data_container,
+                                 prev_year_oee=self.prev_year_oee_for_plot, prev_month_oee=self.prev_month_oee_for_plot,
+                                 source_dates=source_dates)
+
+    def _request_monthly_render(self, name: str, data_container: Union[List[dict[str, Any]], Dict[str, Any]]) -> None:
+        """
+        Grafiğin arka planda, grafik alanının görünür boyutunda çizilmesini ister. Bir çizim sürerken
+        gelen istekler birleştirilir; yalnızca en son istek çizilir.
+        """
+        draw = self._monthly_draw(name, data_container)
+
+        # Çizim boyutu: kaydırma alanının görünür kısmı (yüksek DPI ekranlar için piksel oranıyla)
+        margins = self.monthly_chart_layout.contentsMargins()
+        viewport_size = self.monthly_chart_scroll_area.viewport().size()
+        width = max(viewport_size.width() - margins.left() - margins.right(), 400)
+        height = max(viewport_size.height() - margins.top() - margins.bottom(), 300)
+        pixel_ratio = self.devicePixelRatioF()
+
+        self.btn_save_monthly_chart.setEnabled(False)  # Yeni grafik çizilene kadar kaydetme kapalı
+        self._render_request_id += 1
+        self._pending_render = (self._render_request_id, draw, int(width * pixel_ratio), int(height * pixel_ratio),
+                                120 * pixel_ratio)
+        if self.render_worker is None or not self.render_worker.isRunning():
+            self._start_pending_render()
+
+    def _start_pending_render(self) -> None:
+        """Sırada bekleyen çizim isteğini, süren bir çizim yoksa yeni bir ChartRenderWorker ile başlatır."""
+        if self._pending_render is None or (self.render_worker is not None and self.render_worker.isRunning()):
+            return  # Süren çizim bittiğinde sıradaki istek başlatılır
+        request_id, draw, width_px, height_px, dpi = self._pending_render
+        self._pending_render = None
+        self.render_worker = ChartRenderWorker(request_id, draw, width_px, height_px, dpi)
+        self.render_worker.finished.connect(self._on_monthly_chart_rendered)
+        self.render_worker.error.connect(self._on_monthly_render_error)
+        self.render_worker.start()
+
+    def _wait_for_sender(self) -> None:
+        """
+        Sinyali yayınlayan worker'ın bitmesini bekler (run() yalnızca sinyalden sonra döner; kısa sürer).
+        Bu sırada başlatılmış daha yeni bir çizim beklenmez.
+        """
+        worker = self.sender()
+        if isinstance(worker, ChartRenderWorker):
+            worker.wait()
+
+    def _on_monthly_chart_rendered(self, request_id: int, rgba: np.ndarray, fig: Figure) -> None:
+        """Çizilen RGBA arabelleğini kopyalamadan QImage'e sarar ve grafik alanında gösterir."""
+        self._wait_for_sender()
+        if request_id != self._render_request_id:
+            self._start_pending_render()  # Eski istek: sonucu gösterme, en son isteği çiz
+            return
+
+        height, width = rgba.shape[:2]
+        image = QtGui.QImage(rgba.data, width, height, rgba.strides[0], QtGui.QImage.Format_RGBA8888)
+        pixmap = QtGui.QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        self._monthly_chart_rgba = rgba  # Arabellek, resim gösterildiği sürece canlı tutulur
+        self.monthly_chart_label.setPixmap(pixmap)
+        self.monthly_chart_label.show()
+
+        self.current_monthly_chart_figure = fig  # Kaydetme için figürü sakla
+        self.btn_save_monthly_chart.setEnabled(True)  # Kaydet butonunu etkinleştir
+
+    def _on_monthly_render_error(self, request_id: int, message: str) -> None:
+        """Arka plan çiziminde oluşan hatayı gösterir."""
+        self._wait_for_sender()
+        if request_id == self._render_request_id:
+            QMessageBox.critical(self, "Hata", message)
+            self.btn_save_monthly_chart.setEnabled(False)
+        self._start_pending_render()
+
+    def _rerender_current_monthly_chart(self) -> None:
+        """Geçerli grafiği grafik alanının yeni boyutunda yeniden çizer."""
+        if self.figures_data_monthly and self.monthly_chart_label.isVisible():
+            self._request_monthly_render(*self.figures_data_monthly[self.current_page_monthly])
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        """Sayfa yeniden boyutlandığında grafiğin yeniden çizimini zamanlar."""
+        super().resizeEvent(event)
+        self._resize_render_timer.start()
+
     def update_monthly_page_label(self, graph_mode: str) -> None:
         """
         Aylık grafik sayfa etiketini günceller.
@@ -895,17 +767,33 @@ class MonthlyGraphsPage(QWidget):
             self.current_page_monthly += 1  # Sayfa indeksini artır
             self.display_current_page_graphs_monthly()  # Mevcut sayfadaki grafiği göster
 
+    def _set_pareto_scope_items(self, names: List[str]) -> None:
+        """Pareto kapsamı seçim kutusunu verilen grafik adlarıyla doldurur (seçim sinyali tetiklenmez)."""
+        self.cmb_pareto_scope.blockSignals(True)
+        self.cmb_pareto_scope.clear()
+        self.cmb_pareto_scope.addItems(names)
+        self.cmb_pareto_scope.blockSignals(False)
+
+    def _on_pareto_threshold_changed(self) -> None:
+        """Pareto eşiği değiştiğinde, dosya yüklüyse Dizgi Duruş grafiklerini yeniden hesaplatır."""
+        if self.main_window.excel_path and not self.main_window.df.empty:
+            self._start_monthly_graph_worker(graph_mode="hat")
+
+    def _on_pareto_scope_changed(self, index: int) -> None:
+        """Seçilen genel/hat Pareto grafiğine gider."""
+        if 0 <= index < len(self.figures_data_monthly) and index != self.current_page_monthly:
+            self.current_page_monthly = index
+            self.display_current_page_graphs_monthly()
+
     def _save_monthly_chart_as_image(self):
         """Aylık grafiği PNG/JPEG olarak kaydeder."""
-        if self.current_monthly_chart_figure is None:
+        if self.current_monthly_chart_figure is None or \
+                not 0 <= self.current_page_monthly < len(self.figures_data_monthly):
             QMessageBox.warning(self, "Kaydedilecek Grafik Yok", "Görüntülenecek bir aylık grafik bulunmamaktadır.")
             return
-
-        current_name = "grafik"
-        # Mevcut grafik adını al ve dosya adı için düzenle
-        if self.figures_data_monthly and 0 <= self.current_page_monthly < len(self.figures_data_monthly):
-            current_name = self.figures_data_monthly[self.current_page_monthly][0].replace(" ", "_").replace("/",
-                                                                                                             "-")
+        name, data_container = self.figures_data_monthly[self.current_page_monthly]
+        # Mevcut grafik adını dosya adı için düzenle
+        current_name = name.replace(" ", "_").replace("/", "-")
 
         graph_type_name = self.cmb_monthly_graph_type.currentText().replace(" ", "_").replace("/", "-")
         default_filename = f"{graph_type_name}_{current_name}.png"  # Varsayılan dosya adı
@@ -917,11 +805,64 @@ class MonthlyGraphsPage(QWidget):
 
         if filepath:
             try:
-                # Figürü belirtilen yola kaydet
-                self.current_monthly_chart_figure.savefig(filepath, dpi=120, bbox_inches='tight',
-                                                          facecolor=self.current_monthly_chart_figure.get_facecolor())
+                # Ekrandaki çizim pencere boyutuna bağlıdır; kaydedilen grafik PDF/CLI ile aynı sabit boyutta
+                # yeniden çizilir (Dizgi Duruş'ta çubuk sayısına göre uzar)
+                graph_type = self.cmb_monthly_graph_type.currentText()
+                fig = Figure(figsize=GraphPlotter.monthly_export_figsize(graph_type, data_container), dpi=EXPORT_DPI)
+                FigureCanvasAgg(fig)
+                self._monthly_draw(name, data_container)(fig)
+                fig.savefig(filepath, dpi=EXPORT_DPI, bbox_inches='tight', facecolor=fig.get_facecolor())
                 QMessageBox.information(self, "Kaydedildi", f"Aylık grafik başarıyla kaydedildi: {Path(filepath).name}")
                 logging.info("Aylık grafik kaydedildi: %s", filepath)  # Loglama
             except Exception as e:
                 QMessageBox.critical(self, "Kaydetme Hatası", f"Aylık grafik kaydedilirken bir hata oluştu: {e}")
-                logging.exception("Aylık grafik kaydetme hatası.")  # Hata loglama
\ No newline at end of file
+                logging.exception("Aylık grafik kaydetme hatası.")  # Hata loglama
+
+    def _export_monthly_charts_as_pdf(self):
+        """Mevcut grafik tipinin tüm hat/sayfa grafiklerini, her biri bir sayfa olacak şekilde tek bir PDF'e kaydeder."""
+        if not self.figures_data_monthly:
+            QMessageBox.warning(self, "Kaydedilecek Grafik Yok", "Görüntülenecek bir aylık grafik bulunmamaktadır.")
+            return
+        if self.pdf_worker and self.pdf_worker.isRunning():
+            QMessageBox.information(self, "Kaydediliyor", "PDF hâlâ kaydediliyor, lütfen bekleyin.")
+            return
+
+        graph_type = self.cmb_monthly_graph_type.currentText()
+        default_filename = f"{graph_type}_{self.current_graph_mode}.pdf".replace(" ", "_").replace("/", "-")
+        filepath, _ = QFileDialog.getSaveFileName(self, "Aylık Grafikleri PDF Olarak Kaydet", default_filename,
+                                                  "PDF (*.pdf)")
+        if not filepath:
+            return
+
+        # OEE grafiklerinde her hat/sayfa kendi önceki yıl/ay değerleriyle çizilir (ekrandaki değer dahil)
+        prev_oee_values = {}
+        if graph_type == "OEE Grafikleri":
+            self._cache_current_oee_values()
+            prev_oee_values = dict(self.cached_oee_values)
+        source_dates = None
+        if graph_type == "Dizgi Duruş Grafiği" and 'Tarih' in self.main_window.df.columns:
+            source_dates = self.main_window.df['Tarih']
+
+        self.btn_export_monthly_pdf.setEnabled(False)
+        self.monthly_progress.setValue(0)
+        self.monthly_progress.show()
+        export = functools.partial(export_monthly_pdf, list(self.figures_data_monthly), Path(filepath), graph_type,
+                                   self.current_graph_mode, prev_oee_values=prev_oee_values,
+                                   source_dates=source_dates)
+        self.pdf_worker = PdfExportWorker(Path(filepath), export)
+        self.pdf_worker.progress.connect(self.monthly_progress.setValue)
+        self.pdf_worker.finished.connect(self._on_monthly_pdf_exported)
+        self.pdf_worker.error.connect(self._on_monthly_pdf_export_error)
+        self.pdf_worker.start()
+
+    def _on_monthly_pdf_exported(self, filepath: str, pages: int):
+        """PDF kaydetme bittiğinde kullanıcıyı bilgilendirir."""
+        self.monthly_progress.hide()
+        self.btn_export_monthly_pdf.setEnabled(bool(self.figures_data_monthly))
+        QMessageBox.information(self, "Kaydedildi", f"{pages} grafik PDF olarak kaydedildi: {filepath}")
+
+    def _on_monthly_pdf_export_error(self, message: str):
+        """PDF kaydetmede oluşan hatayı gösterir."""
+        self.monthly_progress.hide()
+        self.btn_export_monthly_pdf.setEnabled(bool(self.figures_data_monthly))
+        QMessageBox.critical(self, "Kaydetme Hatası", message)
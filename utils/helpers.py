@@ -1,20 +1,20 @@
-import sys
 import logging
 import datetime
+import bisect
+from functools import lru_cache
+from typing import List, NamedTuple, Sequence
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from config.constants import (LINE_GROUP_COLUMN, LINE_GROUP_PATTERN, OEE_NO_PRODUCTION, SHEET_COLUMN_LAYOUT,
+                              SHEET_DURATION_RANGES, SHEET_OEE_COLUMNS)
+
 # --- Genel Sabitler ---
+COMPACT_TABLE_ATTR = "kompakt_tablo"  # compact_sheet ile dönüştürülmüş sayfaların DataFrame.attrs işareti
 GRAPHS_PER_PAGE = 1  # Her sayfada gösterilecek grafik sayısı
 REQ_SHEETS = {"SMD-OEE", "ROBOT", "DALGA_LEHİM", "KAPLAMA-OEE"}  # Gerekli Excel sayfaları
 
-# --- Loglama Ayarları ---
-logging.basicConfig(
-    level=logging.INFO,  # INFO ve üzeri seviyedeki mesajlar loglanacak
-    format="%(asctime)s [%(levelname)s] %(message)s",  # Zaman damgası ve seviye dahil
-    handlers=[logging.StreamHandler(sys.stdout)],  # Konsola yazdır
-)
-
 # --- Matplotlib Genel Ayarları ---
 
 # Türkçe karakter ve font ayarları
@@ -50,6 +50,15 @@ plt.rcParams['axes.edgecolor'] = 'black'
 plt.rcParams['axes.linewidth'] = 1.5
 
 
+def enable_copy_on_write() -> None:
+    """
+    pandas 2.x'te Copy-on-Write modunu açar; pandas 3'te her zaman açıktır ve seçenek kullanımdan
+    kalktığı için dokunulmaz. Giriş noktaları (main.py, cli.py) başlangıçta bir kez çağırır.
+    """
+    if int(pd.__version__.split(".")[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
+
+
 def excel_col_to_index(col_letter: str) -> int:
     """
     Excel sütun harfini sıfır tabanlı sayısal indekse dönüştürür.
@@ -73,16 +82,341 @@ def excel_col_to_index(col_letter: str) -> int:
     return index - 1
 
 
+def excel_index_to_col(index: int) -> str:
+    """
+    Sıfır tabanlı sütun indeksini Excel sütun harfine dönüştürür (excel_col_to_index'in tersi).
+    Örneğin: 0 -> 'A', 25 -> 'Z', 26 -> 'AA', 55 -> 'BD'
+    """
+    letters = ""
+    index += 1
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+@lru_cache(maxsize=None)
+def sheet_column_indices(sheet_name: str) -> tuple[int, ...] | None:
+    """
+    SHEET_COLUMN_LAYOUT'taki sütun tanımını ("A,B,H:BD,BP") sıralı, sıfır tabanlı indekslere çevirir.
+    Sayfa için tanım yoksa None döner (tüm sütunlar kullanılır).
+    """
+    layout = SHEET_COLUMN_LAYOUT.get(sheet_name)
+    if not layout:
+        return None
+    indices = set()
+    for part in layout.split(","):
+        part = part.strip()
+        if ":" in part:
+            start, end = part.split(":")
+            indices.update(range(excel_col_to_index(start), excel_col_to_index(end) + 1))
+        else:
+            indices.add(excel_col_to_index(part))
+    return tuple(sorted(indices))
+
+
+def sheet_column_name(df: pd.DataFrame, sheet_name: str, col: str | int) -> str | None:
+    """
+    Excel sütun harfinin (veya sıfır tabanlı indeksinin) yüklenmiş DataFrame'deki adını döndürür.
+
+    Sayfa SHEET_COLUMN_LAYOUT ile projekte edilerek okunduğu için DataFrame'deki konumlar Excel'deki
+    konumlarla aynı değildir; konum, yerleşimdeki sıraya göre bulunur. Sütun yerleşimde yoksa veya
+    sayfada bulunmuyorsa None döner. compact_sheet'in sona eklediği LINE_GROUP_COLUMN hiçbir Excel
+    sütununa karşılık gelmez (sayfa yerleşimden dar okunduğunda da eksik sütunun yerine geçmez).
+    """
+    index = excel_col_to_index(col) if isinstance(col, str) else col
+    layout = sheet_column_indices(sheet_name)
+    if layout is None:
+        pos = index
+    else:
+        pos = bisect.bisect_left(layout, index)
+        if pos >= len(layout) or layout[pos] != index:
+            return None
+    sheet_width = len(df.columns) - (LINE_GROUP_COLUMN in df.columns)
+    return df.columns[pos] if pos < sheet_width else None
+
+
+def sheet_column_range(df: pd.DataFrame, sheet_name: str, start: str, end: str,
+                       exclude: Sequence[str] = ()) -> List[str]:
+    """
+    Excel harf aralığındaki (uçlar dahil) sütunların DataFrame'deki adlarını döndürür.
+    exclude ile verilen harfler ve sayfada bulunmayan sütunlar atlanır.
+    """
+    excluded = {excel_col_to_index(letter) for letter in exclude}
+    names = []
+    for i in range(excel_col_to_index(start), excel_col_to_index(end) + 1):
+        if i in excluded:
+            continue
+        name = sheet_column_name(df, sheet_name, i)
+        if name is not None:
+            names.append(name)
+    return names
+
+
+class SheetColumns(NamedTuple):
+    """Bir sayfanın grafiklerde kullanılan sütun adları (detect_sheet_columns sonucu)."""
+    grouping_col_name: str | None  # A sütunu (tarih)
+    grouped_col_name: str | None  # B sütunu (ürün/hat)
+    oee_col_name: str | None  # OEE sütunu (sayfada yoksa None)
+    metric_cols: List[str]  # Süre içeren metrik sütunları
+
+
+def detect_sheet_columns(df: pd.DataFrame, sheet_name: str) -> SheetColumns:
+    """Sayfaya göre gruplama (A, tarih), gruplanan (B, ürün), OEE ve metrik sütunlarının adlarını belirler."""
+    grouping_col_name = sheet_column_name(df, sheet_name, 'A')
+    grouped_col_name = sheet_column_name(df, sheet_name, 'B')
+    oee_col_name = None
+    metric_cols: List[str] = []
+
+    # Seçilen sayfaya göre OEE ve metrik sütunlarını belirle
+    if sheet_name == "SMD-OEE":
+        # OEE sütunu BP'de
+        oee_col_name = sheet_column_name(df, sheet_name, 'BP')
+        # Metrik sütunları H'den BD'ye kadar, AP hariç
+        metric_cols = sheet_column_range(df, sheet_name, 'H', 'BD', exclude=('AP',))
+    elif sheet_name == "ROBOT":
+        # ROBOT sayfası için OEE sütunu BG olarak belirtildi, ancak mevcut kodda kullanılmıyor.
+        # Eğer ROBOT sayfası için de OEE grafiği çizilecekse bu kısım güncellenmeli.
+        # Günlük grafiklerde OEE sütunu kullanılmadığı için burada sadece metrikler tanımlanır.
+        # Metrik sütunları H'den AU'ya kadar, AO hariç
+        metric_cols = sheet_column_range(df, sheet_name, 'H', 'AU', exclude=('AO',))
+    elif sheet_name == "DALGA_LEHİM":
+        # OEE sütunu BP'de
+        oee_col_name = sheet_column_name(df, sheet_name, 'BP')
+        # Metrik sütunları H'den BD'ye kadar, AP hariç
+        metric_cols = sheet_column_range(df, sheet_name, 'H', 'BD', exclude=('AP',))
+    elif sheet_name == "KAPLAMA-OEE":
+        # OEE sütunu BG'de
+        oee_col_name = sheet_column_name(df, sheet_name, 'BG')
+        # Bu sayfa için sadece OEE grafiği istendiği için metrikler boş kalır.
+        metric_cols = []
+
+    return SheetColumns(grouping_col_name, grouped_col_name, oee_col_name, metric_cols)
+
+
+def line_group_keys(series: pd.Series) -> pd.Series:
+    """
+    Ürün/hat sütunundan hat anahtarlarını çıkarır: içinde "HAT<n>" geçen değerler (büyük/küçük harf
+    duyarsız) "HAT-<n>" olur, diğerleri ve boş hücreler NaN. Sonuç category tipindedir.
+
+    Düzenli ifade satırlara değil, yalnızca benzersiz ürün adlarına (kategori sütunlarında kategorilere)
+    uygulanır; satırların anahtar kodları tamsayı kodlardan tek bir indeksleme ile bulunur.
+    Aylık hat grafikleri ve geçmiş deposu aynı anahtarları kullanır.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes, labels = series.cat.codes.to_numpy(), series.cat.categories.astype(str)
+    else:
+        codes, uniques = pd.factorize(series.astype(str).where(series.notna()))
+        labels = pd.Index(uniques, dtype=object)
+    numbers = pd.Series(labels, dtype=object).str.upper().str.extract(LINE_GROUP_PATTERN, expand=False)
+    label_keys = "HAT-" + numbers
+    line_keys = sorted(label_keys.dropna().unique())
+    # Her benzersiz ürün adının anahtar kodu; son eleman boş hücrelerin (-1 kodu) karşılığıdır
+    key_codes = np.append(pd.Categorical(label_keys, categories=line_keys).codes, -1)
+    return pd.Series(pd.Categorical.from_codes(key_codes[codes], categories=line_keys),
+                     index=series.index, name=LINE_GROUP_COLUMN)
+
+
+def format_oee_display(oee_value_raw, fraction: bool = False) -> str:
+    """
+    Ham OEE hücre değerini grafikte gösterilecek metne çevirir.
+
+    - Boş değer veya dönüştürülemeyen değer -> "0%"
+    - "ÜRETİM YAPILMADI" -> "" (grafikte "Veri Yok" gösterilir)
+    - 0-1 arası değerler oran kabul edilip yüzdeye çevrilir, 1'den büyükler zaten yüzde kabul edilir.
+
+    fraction=True ise değer kompakt tablodaki (compact_sheet) orandır: her zaman 100 ile çarpılır,
+    OEE_NO_PRODUCTION ise "ÜRETİM YAPILMADI" gibi "" döner.
+    """
+    if not pd.notna(oee_value_raw):
+        return "0%"
+    if fraction:
+        if oee_value_raw == OEE_NO_PRODUCTION:
+            return ""
+        return _format_percent(float(oee_value_raw) * 100) if oee_value_raw > 0 else "0%"
+    if isinstance(oee_value_raw, str) and oee_value_raw.strip().upper() == "ÜRETİM YAPILMADI":
+        return ""  # Özel durum: üretim yapılmadı
+    try:
+        oee_value_float: float
+        if isinstance(oee_value_raw, str):
+            oee_value_str = oee_value_raw.replace('%', '').strip()
+            oee_value_float = float(oee_value_str)
+        elif isinstance(oee_value_raw, (int, float)):
+            oee_value_float = float(oee_value_raw)
+        else:
+            raise ValueError("Desteklenmeyen OEE değeri tipi veya formatı")
+
+        # 0-1 arası ise % çevir, >1 zaten % olarak kabul edilir
+        if 0.0 <= oee_value_float <= 1.0 and oee_value_float != 0:
+            return _format_percent(oee_value_float * 100)
+        elif oee_value_float > 1.0:
+            return _format_percent(oee_value_float)
+        return "0%"
+    except (ValueError, TypeError):
+        logging.warning(f"OEE değeri dönüştürülemedi: {oee_value_raw}. Varsayılan '0%' kullanılacak.")
+        return "0%"
+
+
+def _format_percent(percent: float) -> str:
+    """
+    Yüzdeyi tam sayıya yuvarlanmış etikete çevirir. Önce 9 basamağa yuvarlanır ki oran * 100 çarpımının
+    kayan nokta hatası (ör. 0.165 * 100 = 16.500000000000004) yarım yüzdelerin yuvarlamasını değiştirmesin;
+    böylece aynı değer oran veya yüzde olarak saklansa da aynı etiketi alır.
+    """
+    return f"{round(percent, 9):.0f}%"
+
+
+def _oee_value_to_fraction(oee_value_raw) -> float:
+    """
+    Tek bir ham OEE hücresini format_oee_display ile aynı kurallarla orana çevirir
+    (1'den büyükler yüzde kabul edilir). Boş veya dönüştürülemeyen değerler NaN,
+    "ÜRETİM YAPILMADI" OEE_NO_PRODUCTION olur.
+    """
+    if isinstance(oee_value_raw, str):
+        text = oee_value_raw.strip()
+        if text.upper() == "ÜRETİM YAPILMADI":
+            return OEE_NO_PRODUCTION
+        try:
+            value = float(text.replace('%', '').strip())
+        except ValueError:
+            return np.nan
+    elif isinstance(oee_value_raw, (int, float, np.number)) and not isinstance(oee_value_raw, (bool, np.bool_)):
+        value = float(oee_value_raw)
+    else:
+        return np.nan
+    if np.isnan(value):
+        return np.nan
+    return max(value, 0.0) if value <= 1.0 else value / 100.0
+
+
+def is_compact_oee(series: pd.Series) -> bool:
+    """
+    OEE sütunu compact_sheet ile orana çevrilmiş bir sayfadan mı geliyor. İşaret sayfanın
+    DataFrame.attrs sözlüğünde tutulur; sütun seçimi, yeniden adlandırma ve yan dosya ile korunur.
+    """
+    return bool(series.attrs.get(COMPACT_TABLE_ATTR)) and pd.api.types.is_float_dtype(series.dtype)
+
+
+def oee_fraction_series(series: pd.Series, compact: bool | None = None) -> pd.Series:
+    """
+    Aylık grafikler için OEE sütununu 0-1 arası orana (float64) çevirir; boş, dönüştürülemeyen ve
+    "ÜRETİM YAPILMADI" değerleri 0.0 olur.
+
+    Kompakt tablodaki sütunlar doğrudan kullanılır (compact verilmezse is_compact_oee ile belirlenir).
+    Ham sütunlar metin olarak ayrıştırılır ve en büyük değer 1'den büyükse sütunun tamamı yüzde kabul
+    edilip 100'e bölünür.
+    """
+    if compact if compact is not None else is_compact_oee(series):
+        return series.where(series >= 0, 0.0).astype(np.float64)
+    values = pd.to_numeric(series.astype(str).replace('%', '').replace(',', '.'), errors='coerce').fillna(0.0)
+    # Eğer OEE değerleri % formatındaysa 100'e böl
+    if not values.empty and values.max() > 1.0:
+        values = values / 100.0
+    return values
+
+
+def _unique_durations_to_seconds(uniques: np.ndarray) -> np.ndarray:
+    """
+    Tekil (benzersiz) süre değerlerini saniyeye çevirir. Tip kontrolü her benzersiz değer için
+    yalnızca bir kez yapılır; değerler tiplerine göre şeritlere (lane) ayrılıp toplu dönüştürülür.
+
+    Şeritler:
+    - datetime.time      -> saat, dakika, saniye + mikrosaniye
+    - timedelta          -> toplam saniye
+    - sayısal (bool hariç) -> gün olarak kabul edilip saniyeye çevrilir (Excel süre formatı)
+    - diğer (string vb.) -> pd.to_timedelta ile dönüştürülür, dönüştürülemeyenler 0.0
+    """
+    seconds = np.zeros(len(uniques), dtype=np.float64)
+    if not len(uniques):
+        return seconds
+
+    is_time = np.fromiter((isinstance(v, datetime.time) for v in uniques), dtype=bool, count=len(uniques))
+    is_td = np.fromiter((isinstance(v, (datetime.timedelta, np.timedelta64)) for v in uniques),
+                        dtype=bool, count=len(uniques))
+    is_num = np.fromiter(
+        (isinstance(v, (int, float, np.number)) and not isinstance(v, (bool, np.bool_)) for v in uniques),
+        dtype=bool, count=len(uniques))
+    is_other = ~(is_time | is_td | is_num)
+
+    # 1) datetime.time şeridi
+    if is_time.any():
+        times = uniques[is_time]
+        seconds[is_time] = [t.hour * 3600 + t.minute * 60 + t.second + t.microsecond / 1e6 for t in times]
+
+    # 2) timedelta şeridi
+    if is_td.any():
+        seconds[is_td] = pd.to_timedelta(uniques[is_td]).total_seconds().to_numpy()
+
+    # 3) Sayısal şerit: Excel süreleri gün kesri olarak saklar
+    if is_num.any():
+        seconds[is_num] = uniques[is_num].astype(np.float64) * 86400.0
+
+    # 4) String ve diğer formatlar
+    if is_other.any():
+        as_str = pd.Series(uniques[is_other].astype(str)).str.strip()
+        converted = pd.to_timedelta(as_str, errors='coerce').dt.total_seconds()
+        seconds[is_other] = converted.fillna(0.0).to_numpy()
+
+    return seconds
+
+
+def seconds_matrix_from_durations(frame: pd.DataFrame, fill_value: float = 0.0) -> np.ndarray:
+    """
+    Bir DataFrame'deki süre sütunlarının tamamını tek geçişte saniyeye çevirir ve
+    (satır x sütun) boyutunda float64 NumPy matrisi döndürür.
+
+    İşleyiş:
+    - timedelta64 sütunları doğrudan toplam saniyeye çevrilir.
+    - float32 sütunlar kompakt tablonun (compact_sheet) süre sütunlarıdır ve zaten saniyedir.
+    - Diğer sayısal sütunlar gün olarak kabul edilip saniyeye çevrilir.
+    - Object sütunları tek bir blok halinde düzleştirilir ve pd.factorize ile kodlanır;
+      tip kontrolü ve dönüştürme yalnızca benzersiz değerler üzerinde yapılır,
+      sonuç kodlar üzerinden NumPy indekslemesiyle tüm bloğa dağıtılır.
+
+    Parametre:
+        frame: Süre bilgileri içeren DataFrame (ör. H..BD metrik sütunları)
+        fill_value: Boş (NaN/None) hücreler için kullanılacak değer
+
+    Dönen:
+        np.ndarray, frame.shape boyutunda saniye değerleri (float64)
+    """
+    n_rows, n_cols = frame.shape
+    result = np.full((n_rows, n_cols), fill_value, dtype=np.float64)
+    object_positions: List[int] = []
+
+    for pos in range(n_cols):
+        col = frame.iloc[:, pos]
+        if pd.api.types.is_timedelta64_dtype(col.dtype):
+            values = col.dt.total_seconds().to_numpy(dtype=np.float64)
+        elif pd.api.types.is_bool_dtype(col.dtype):
+            values = np.where(col.isna().to_numpy(), np.nan, 0.0)
+        elif col.dtype == np.float32:
+            values = col.to_numpy(dtype=np.float64)
+        elif pd.api.types.is_numeric_dtype(col.dtype):
+            values = col.to_numpy(dtype=np.float64, na_value=np.nan) * 86400.0
+        else:
+            object_positions.append(pos)
+            continue
+        result[:, pos] = np.where(np.isnan(values), fill_value, values)
+
+    if object_positions and n_rows:
+        # Tüm object sütunları tek seferde düzleştir ve benzersiz değerlere indirge
+        block = frame.iloc[:, object_positions].to_numpy(dtype=object).ravel(order='F')
+        codes, uniques = pd.factorize(block, use_na_sentinel=True)
+        # -1 (boş hücre) kodu son elemana, yani fill_value'ya denk gelir
+        lookup = np.append(_unique_durations_to_seconds(np.asarray(uniques, dtype=object)), fill_value)
+        result[:, object_positions] = lookup[codes].reshape((n_rows, len(object_positions)), order='F')
+
+    return result
+
+
 def seconds_from_timedelta(series: pd.Series) -> pd.Series:
     """
     Pandas Serisindeki farklı zaman formatlarındaki değerleri (datetime.time, timedelta string, sayısal vb.)
     toplam saniye cinsine çevirir. Dönüştürülemeyenler 0.0 olarak işaretlenir.
 
-    İşleyiş:
-    - datetime.time objeleri saat, dakika, saniye + mikrosaniyeye göre hesaplanır.
-    - string veya timedelta formatları pd.to_timedelta ile dönüştürülür.
-    - Sayısal değerler gün olarak kabul edilip saniyeye çevrilir.
-    - Sonuç tüm indeksler için float saniye cinsinden döner.
+    Tek sütunluk seconds_matrix_from_durations çağrısıdır; birden fazla sütun dönüştürülecekse
+    doğrudan seconds_matrix_from_durations kullanılmalıdır.
 
     Parametre:
         series: pd.Series, zaman bilgileri içeren
@@ -90,34 +424,112 @@ def seconds_from_timedelta(series: pd.Series) -> pd.Series:
     Dönen:
         pd.Series, aynı indeksle saniye cinsinden değerler (float)
     """
-    seconds_series = pd.Series(0.0, index=series.index, dtype=float)
-
-    # 1) datetime.time objelerini işleme
-    is_time_obj = series.apply(lambda x: isinstance(x, datetime.time))
-    if is_time_obj.any():
-        time_objects = series[is_time_obj]
-        seconds_series.loc[is_time_obj] = time_objects.apply(
-            lambda t: t.hour * 3600 + t.minute * 60 + t.second + t.microsecond / 1e6
-        )
-
-    # 2) timedelta string veya diğer formatları işleme
-    str_and_timedelta_mask = ~is_time_obj & series.notna()
-    if str_and_timedelta_mask.any():
-        converted_td = pd.to_timedelta(series.loc[str_and_timedelta_mask].astype(str).str.strip(), errors='coerce')
-        valid_td_mask = pd.notna(converted_td)
-        seconds_series.loc[str_and_timedelta_mask & valid_td_mask] = converted_td[valid_td_mask].dt.total_seconds()
-
-    # 3) Kalan NaN veya dönüştürülemeyenleri sayısal gün olarak işleme
-    remaining_nan_mask = seconds_series.isna()
-    if remaining_nan_mask.any():
-        numeric_candidates = series.loc[remaining_nan_mask]
-        numeric_values = pd.to_numeric(numeric_candidates, errors='coerce')
-        valid_numeric_mask = pd.notna(numeric_values)
-        if valid_numeric_mask.any():
-            converted_from_numeric = pd.to_timedelta(numeric_values[valid_numeric_mask], unit='D', errors='coerce')
-            valid_num_td_mask = pd.notna(converted_from_numeric)
-            seconds_series.loc[remaining_nan_mask[valid_numeric_mask] & valid_num_td_mask] = converted_from_numeric[
-                valid_num_td_mask].dt.total_seconds()
-
-    # Dönüştürülemeyenler 0.0 ile doldurulur
-    return seconds_series.fillna(0.0)
+    return pd.Series(seconds_matrix_from_durations(series.to_frame())[:, 0], index=series.index, dtype=float)
+
+
+def normalize_duration_columns(df: pd.DataFrame, sheet_name: str) -> pd.DataFrame:
+    """
+    Sayfanın süre sütunlarını (SHEET_DURATION_RANGES) karışık tiplerden (datetime.time, timedelta, string, sayı)
+    float32 saniyeye dönüştürür. Boş hücreler NaN olarak korunur, böylece "boş sütun" kontrolleri
+    değişmez; seconds_matrix_from_durations float32 sütunları saniye olarak okur.
+
+    Parametre:
+        df: Excel'den okunmuş sayfa verisi
+        sheet_name: Sayfa adı (süre aralığını belirlemek için)
+
+    Dönen:
+        pd.DataFrame, süre sütunları normalize edilmiş (yerinde değiştirilir ve aynı nesne döner)
+    """
+    col_range = SHEET_DURATION_RANGES.get(sheet_name)
+    if not col_range:
+        return df
+
+    duration_cols = [col for col in sheet_column_range(df, sheet_name, col_range[0], col_range[1])
+                     if df[col].dtype != np.float32]
+    if duration_cols:
+        seconds = seconds_matrix_from_durations(df[duration_cols], fill_value=np.nan)
+        for pos, col in enumerate(duration_cols):
+            df[col] = seconds[:, pos].astype(np.float32)
+    return df
+
+
+def compact_sheet(df: pd.DataFrame, sheet_name: str) -> pd.DataFrame:
+    """
+    Excel'den okunan sayfayı yükleme sırasında bir kez kompakt tabloya çevirir:
+
+    - A (tarih): datetime64 (yalnızca dolu hücrelerin tamamı tarihe çevrilebiliyorsa)
+    - B (ürün/hat): category (her benzersiz ürün adı bir kez saklanır, filtreler tamsayı kodlarla yapılır)
+    - LINE_GROUP_COLUMN: B'den çıkarılan hat anahtarı ("HAT-<n>", category); sütun yerleşiminin sonuna eklenir
+    - Süre sütunları: float32 saniye (normalize_duration_columns)
+    - OEE: float64 oran (0-1); "ÜRETİM YAPILMADI" OEE_NO_PRODUCTION, boş/geçersiz NaN. float64 tutulur ki
+      günlük etiketlerin yarım yüzdelerdeki yuvarlaması ham değerlerle aynı kalsın (format_oee_display)
+
+    Dönüştürülen sayfa df.attrs[COMPACT_TABLE_ATTR] ile işaretlenir (is_compact_oee).
+
+    Parametre:
+        df: Excel'den okunmuş sayfa verisi (sütun isimleri string)
+        sheet_name: Sayfa adı (sütun düzeni için)
+
+    Dönen:
+        pd.DataFrame, dönüştürülmüş sayfa (yerinde değiştirilir ve aynı nesne döner)
+    """
+    date_col = sheet_column_name(df, sheet_name, 'A')
+    if date_col and not pd.api.types.is_datetime64_any_dtype(df[date_col].dtype):
+        dates = pd.to_datetime(df[date_col], errors='coerce')
+        if dates.notna().sum() == df[date_col].notna().sum():
+            df[date_col] = dates
+
+    product_col = sheet_column_name(df, sheet_name, 'B')
+    if product_col and not isinstance(df[product_col].dtype, pd.CategoricalDtype):
+        products = df[product_col]
+        # Sayı ve metin karışık ürün kodları, ekranda göründükleri gibi string olarak saklanır
+        df[product_col] = products.where(products.isna(), products.astype(str)).astype('category')
+    if product_col and LINE_GROUP_COLUMN not in df.columns:
+        df[LINE_GROUP_COLUMN] = line_group_keys(df[product_col])
+
+    normalize_duration_columns(df, sheet_name)
+
+    oee_letter = SHEET_OEE_COLUMNS.get(sheet_name)
+    oee_col = sheet_column_name(df, sheet_name, oee_letter) if oee_letter else None
+    if oee_col and not df.attrs.get(COMPACT_TABLE_ATTR):
+        # Dönüşüm yalnızca benzersiz değerler üzerinde yapılır
+        codes, uniques = pd.factorize(df[oee_col], use_na_sentinel=True)
+        lookup = np.array([_oee_value_to_fraction(v) for v in uniques] + [np.nan], dtype=np.float64)
+        df[oee_col] = lookup[codes]  # -1 (boş hücre) kodu son elemana, yani NaN'a denk gelir
+    df.attrs[COMPACT_TABLE_ATTR] = True
+    return df
+
+
+def factorize_keys(series: pd.Series) -> tuple[np.ndarray, List[str]]:
+    """
+    Anahtar sütununu (tarih veya ürün) tamsayı kodlara ve ekranda görünen string etiketlere ayırır.
+    Boş hücreler -1 kodunu alır. Tarih ve kategori sütunları string'e çevrilmeden kodlanır;
+    yalnızca benzersiz değerler etikete dönüştürülür (etiketler series.astype(str) ile aynıdır).
+    """
+    if pd.api.types.is_datetime64_any_dtype(series.dtype) or isinstance(series.dtype, pd.CategoricalDtype):
+        codes, uniques = pd.factorize(series)
+        return codes, list(uniques.astype(str))
+    codes, uniques = pd.factorize(series.astype(str).where(series.notna()))
+    return codes, list(uniques)
+
+
+def key_equals_mask(series: pd.Series, value: str) -> pd.Series:
+    """
+    Anahtar sütununun ekrandaki string değere (ör. seçilen tarih) eşit olduğu satırları bulur.
+    Tarih sütunları Timestamp ile, kategori sütunları kategori koduyla karşılaştırılır.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        try:
+            return series == pd.Timestamp(value)
+        except ValueError:
+            return pd.Series(False, index=series.index)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series == value
+    return series.astype(str) == value
+
+
+def key_isin_mask(series: pd.Series, values: Sequence[str]) -> pd.Series:
+    """Anahtar sütununun verilen string değerlerden birine eşit olduğu satırları bulur (key_equals_mask gibi)."""
+    if isinstance(series.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(series.dtype):
+        return series.isin(values)
+    return series.astype(str).isin(values)